@@ -361,6 +361,17 @@ async def oauth_callback(
                 redirect_uri=_get_oauth_redirect_uri(),
             )
         setattr(source, cfg["refresh_token"], tokens["refresh_token"])
+        if source.source_type == "google_drive":
+            # Drop access tokens minted for the previous grant
+            from ...services.sync.google_drive import GoogleDriveConnector
+
+            GoogleDriveConnector._token_cache.pop(folder_path, None)
+            source.gd_access_token = None
+            source.gd_access_token_expires_at = None
+        elif source.source_type == "box":
+            from ...services.sync.box import BoxConnector
+
+            BoxConnector.forget_access_token(folder_path)
         logger.info("OAuth token saved for %s (token field=%s, len=%d)",
                      folder_path, cfg["refresh_token"],
                      len(tokens.get("refresh_token", "") or ""))
@@ -821,6 +832,16 @@ async def upsert_sync_source(
 
     if existing:
         source = existing
+        if existing.source_type == "google_drive":
+            # Credentials may change below; don't keep serving tokens minted from the old ones
+            from ...services.sync.google_drive import GoogleDriveConnector
+
+            GoogleDriveConnector._token_cache.pop(path, None)
+            GoogleDriveConnector._sa_token_cache.pop(path, None)
+        elif existing.source_type == "box":
+            from ...services.sync.box import BoxConnector
+
+            BoxConnector.forget_access_token(path)
     else:
         source = FolderSyncSource(folder_path=path)
         db.add(source)
@@ -835,6 +856,7 @@ async def upsert_sync_source(
         "sp_tenant_id", "sp_client_id", "sp_client_secret", "sp_site_url", "sp_drive_id",
         "sp_all_sites", "sp_selected_sites",
         "gd_service_account_json", "gd_folder_id", "gd_client_id", "gd_client_secret",
+        "gd_access_token", "gd_access_token_expires_at",
         "gh_token", "gh_repo", "gh_branch", "gh_path",
         "gh_auth_method", "gh_username", "gh_pat", "gh_all_branches",
         "ado_tenant_id", "ado_client_id", "ado_client_secret",
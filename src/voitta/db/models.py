@@ -2,7 +2,7 @@
 
 from datetime import datetime, timezone
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, Integer, String, Text, UniqueConstraint
+from sqlalchemy import Boolean, DateTime, Float, ForeignKey, Integer, String, Text, UniqueConstraint
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 
 
@@ -158,6 +158,9 @@ class FolderSyncSource(Base):
     gd_client_id: Mapped[str | None] = mapped_column(String(255), nullable=True)
     gd_client_secret: Mapped[str | None] = mapped_column(String(500), nullable=True)
     gd_refresh_token: Mapped[str | None] = mapped_column(Text, nullable=True)
+    # Last OAuth access token and its expiry (epoch seconds), reused across restarts
+    gd_access_token: Mapped[str | None] = mapped_column(Text, nullable=True)
+    gd_access_token_expires_at: Mapped[float | None] = mapped_column(Float, nullable=True)
 
     # GitHub credentials
     gh_token: Mapped[str | None] = mapped_column(String(500), nullable=True)  # SSH private key
@@ -14,6 +14,7 @@ from .config import get_settings
 from .db.database import init_db
 from .mcp_server import mcp, UserHeaderMiddleware
 from .services.indexing_worker import get_indexing_worker
+from .services.sync import close_connectors
 from .services.watcher import file_watcher
 
 # Get project root for static files and templates
@@ -80,6 +81,9 @@ async def lifespan(app: FastAPI):
     # Stop filesystem watcher
     file_watcher.stop()
 
+    # Close pooled sync connector HTTP clients
+    await close_connectors()
+
 
 def create_app() -> FastAPI:
     """Create and configure the FastAPI application."""
@@ -30,3 +30,9 @@ def get_connector(source_type: str) -> BaseSyncConnector:
     if not connector:
         raise ValueError(f"Unknown sync source type: {source_type}")
     return connector
+
+
+async def close_connectors() -> None:
+    """Close pooled HTTP clients held by connector instances (on shutdown)."""
+    for connector in _connectors.values():
+        await connector.aclose()
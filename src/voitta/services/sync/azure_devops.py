@@ -1,20 +1,33 @@
 """Azure DevOps sync connector - Work Items and Wiki pages."""
 
+import asyncio
 import hashlib
+import io
 import json
 import logging
 import re
+from functools import lru_cache
 from pathlib import Path
 from urllib.parse import quote, urlencode, urlparse
 
 import httpx
 
-from .base import BaseSyncConnector, RemoteFile
+from .base import (
+    BaseSyncConnector,
+    RemoteFile,
+    read_json_sidecar,
+    sanitize_filename,
+    write_json_sidecar,
+)
 
 logger = logging.getLogger(__name__)
 
 ADO_SCOPES = "499b84ac-1321-427f-aa17-267ca6975798/user_impersonation offline_access"
 ADO_API_VERSION = "7.1"
+ADO_DOWNLOAD_CONCURRENCY = 8  # Max work items / wiki pages fetched in parallel during sync
+
+# Status codes worth retrying: throttling and transient server errors
+_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
 
 
 # ---------------------------------------------------------------------------
@@ -44,32 +57,79 @@ def _parse_ado_url(url: str) -> tuple[str, str]:
     raise ValueError(f"Cannot parse Azure DevOps URL: {url}")
 
 
-def _sanitize_filename(name: str) -> str:
-    """Sanitize a string for use as a filename/path component."""
-    sanitized = re.sub(r'[<>:"/\\|?*]', "-", name)
-    sanitized = re.sub(r"\s+", "-", sanitized)
-    sanitized = re.sub(r"-{2,}", "-", sanitized)
-    return sanitized.strip("-")[:100]
+@lru_cache(maxsize=64)
+def _ado_api_base(organization: str, project: str) -> str:
+    """REST API base URL for an organization/project pair."""
+    return f"https://dev.azure.com/{organization}/{quote(project, safe='')}/_apis"
+
+
+# One alternation covering every tag the converter understands, so rich-text
+# fields are scanned once instead of once per tag kind.
+_HTML_RE = re.compile(
+    r"(?P<br><br\s*/?>)"
+    r"|(?P<p></?p>)"
+    r"|<(?P<bold>strong|b)>(?P<bold_text>.*?)</(?P=bold)>"
+    r"|<(?P<italic>em|i)>(?P<italic_text>.*?)</(?P=italic)>"
+    r'|<a[^>]+href="(?P<href>[^"]*)"[^>]*>(?P<link_text>.*?)</a>'
+    r"|<li>(?P<li_text>.*?)</li>"
+    r"|(?P<div></?div[^>]*>)"
+    r"|<[^>]+>",
+    re.DOTALL,
+)
+_BLANK_LINES_RE = re.compile(r"\n{3,}")
+_WORK_ITEM_REL_RE = re.compile(r"/workItems/(\d+)")
+_WORK_ITEM_PATH_RE = re.compile(r"work-items/[^/]+/(\d+)-.*\.md$")
+
+
+def _html_tag_to_markdown(m: re.Match) -> str:
+    """Replacement callback for _HTML_RE; inner text is converted recursively."""
+    kind = m.lastgroup
+    if kind in ("br", "p", "div"):
+        return "\n"
+    if kind == "bold_text":
+        return f"**{_HTML_RE.sub(_html_tag_to_markdown, m['bold_text'])}**"
+    if kind == "italic_text":
+        return f"*{_HTML_RE.sub(_html_tag_to_markdown, m['italic_text'])}*"
+    if kind == "link_text":
+        return f"[{_HTML_RE.sub(_html_tag_to_markdown, m['link_text'])}]({m['href']})"
+    if kind == "li_text":
+        return f"- {_HTML_RE.sub(_html_tag_to_markdown, m['li_text'])}"
+    # Lists and any other tag are stripped
+    return ""
+
+
+# Rich-text fields larger than this go through html2text's linear-time parser.
+# The lazy ".*?" patterns in _HTML_RE rescan to the end of the input for every
+# unclosed tag, which turns quadratic on multi-megabyte descriptions.
+_LARGE_HTML_THRESHOLD = 64 * 1024
+
+
+def _html2text_convert(html: str) -> str | None:
+    """Convert HTML with html2text, or return None if it isn't installed."""
+    try:
+        import html2text
+    except ImportError:
+        return None
+
+    converter = html2text.HTML2Text()
+    converter.body_width = 0  # No wrapping
+    converter.ignore_links = False
+    converter.ignore_images = True
+    converter.ignore_emphasis = False
+    converter.unicode_snob = True
+    return converter.handle(html)
 
 
 def _html_to_markdown(html: str) -> str:
     """Basic HTML-to-markdown conversion for Azure DevOps rich-text fields."""
     if not html:
         return ""
-    text = html
-    text = re.sub(r"<br\s*/?>", "\n", text)
-    text = re.sub(r"</?p>", "\n", text)
-    text = re.sub(r"<strong>(.*?)</strong>", r"**\1**", text, flags=re.DOTALL)
-    text = re.sub(r"<b>(.*?)</b>", r"**\1**", text, flags=re.DOTALL)
-    text = re.sub(r"<em>(.*?)</em>", r"*\1*", text, flags=re.DOTALL)
-    text = re.sub(r"<i>(.*?)</i>", r"*\1*", text, flags=re.DOTALL)
-    text = re.sub(r'<a[^>]+href="([^"]*)"[^>]*>(.*?)</a>', r"[\2](\1)", text, flags=re.DOTALL)
-    text = re.sub(r"<li>(.*?)</li>", r"- \1", text, flags=re.DOTALL)
-    text = re.sub(r"</?[ou]l>", "", text)
-    text = re.sub(r"</?div[^>]*>", "\n", text)
-    # Strip remaining tags
-    text = re.sub(r"<[^>]+>", "", text)
-    text = re.sub(r"\n{3,}", "\n\n", text)
+    if len(html) > _LARGE_HTML_THRESHOLD:
+        text = _html2text_convert(html)
+        if text is not None:
+            return text.strip()
+    text = _HTML_RE.sub(_html_tag_to_markdown, html)
+    text = _BLANK_LINES_RE.sub("\n\n", text)
     return text.strip()
 
 
@@ -88,71 +148,74 @@ def _render_work_item_md(wi: dict, comments: list) -> str:
     changed_date = fields.get("System.ChangedDate", "")[:10]
     tags = fields.get("System.Tags", "")
 
-    lines: list[str] = []
-    lines.append(f"# [{wi_type} {wi_id}] {title}\n")
-
-    # Metadata table
-    lines.append("| Field | Value |")
-    lines.append("|---|---|")
-    lines.append(f"| Type | {wi_type} |")
-    lines.append(f"| State | {state} |")
-    lines.append(f"| Assigned To | {assigned_to} |")
-    lines.append(f"| Area Path | {area_path} |")
-    lines.append(f"| Iteration | {iteration_path} |")
+    buf = io.StringIO()
+    write = buf.write
+    write(
+        f"# [{wi_type} {wi_id}] {title}\n\n"
+        # Metadata table
+        "| Field | Value |\n"
+        "|---|---|\n"
+        f"| Type | {wi_type} |\n"
+        f"| State | {state} |\n"
+        f"| Assigned To | {assigned_to} |\n"
+        f"| Area Path | {area_path} |\n"
+        f"| Iteration | {iteration_path} |\n"
+    )
     if priority:
-        lines.append(f"| Priority | {priority} |")
-    lines.append(f"| Created | {created_date} |")
-    lines.append(f"| Updated | {changed_date} |")
+        write(f"| Priority | {priority} |\n")
+    write(f"| Created | {created_date} |\n")
+    write(f"| Updated | {changed_date} |\n")
     if tags:
-        lines.append(f"| Tags | {tags} |")
-    lines.append("")
+        write(f"| Tags | {tags} |\n")
+    write("\n")
 
     # Description
     description = fields.get("System.Description", "")
     if description:
-        lines.append("## Description\n")
-        lines.append(_html_to_markdown(description))
-        lines.append("")
+        write("## Description\n\n")
+        write(_html_to_markdown(description))
+        write("\n\n")
 
     # Acceptance Criteria (User Stories)
     acceptance = fields.get("Microsoft.VSTS.Common.AcceptanceCriteria", "")
     if acceptance:
-        lines.append("## Acceptance Criteria\n")
-        lines.append(_html_to_markdown(acceptance))
-        lines.append("")
+        write("## Acceptance Criteria\n\n")
+        write(_html_to_markdown(acceptance))
+        write("\n\n")
 
     # Repro Steps (Bugs)
     repro = fields.get("Microsoft.VSTS.TCM.ReproSteps", "")
     if repro:
-        lines.append("## Repro Steps\n")
-        lines.append(_html_to_markdown(repro))
-        lines.append("")
+        write("## Repro Steps\n\n")
+        write(_html_to_markdown(repro))
+        write("\n\n")
 
     # Comments
     if comments:
-        lines.append("## Comments\n")
+        write("## Comments\n\n")
         for comment in comments:
             author = (comment.get("createdBy") or {}).get("displayName", "Unknown")
             date = comment.get("createdDate", "")[:10]
             text = _html_to_markdown(comment.get("text", ""))
-            lines.append(f"### {author} ({date})\n")
-            lines.append(text)
-            lines.append("")
+            write(f"### {author} ({date})\n\n")
+            write(text)
+            write("\n\n")
 
     # Related work items
     relations = wi.get("relations") or []
     wi_relations = [r for r in relations if "workitem" in (r.get("url") or "").lower()]
     if wi_relations:
-        lines.append("## Related Work Items\n")
+        write("## Related Work Items\n\n")
         for rel in wi_relations:
             rel_type = (rel.get("attributes") or {}).get("name", rel.get("rel", "Related"))
             rel_url = rel.get("url", "")
-            rel_id_match = re.search(r"/workItems/(\d+)", rel_url)
+            rel_id_match = _WORK_ITEM_REL_RE.search(rel_url)
             rel_id = rel_id_match.group(1) if rel_id_match else "?"
-            lines.append(f"- {rel_type}: Work Item {rel_id}")
-        lines.append("")
+            write(f"- {rel_type}: Work Item {rel_id}\n")
+        write("\n")
 
-    return "\n".join(lines)
+    # Every section ends with a blank line; drop the final separator
+    return buf.getvalue()[:-1]
 
 
 # ---------------------------------------------------------------------------
@@ -215,6 +278,12 @@ class AzureDevOpsConnector(BaseSyncConnector):
     def __init__(self):
         self._cached_token: str | None = None
         self._token_expires_at: float = 0.0
+        self._cached_headers: tuple[str, dict] | None = None
+        # Work item JSON from the last listing, keyed by API base then work item ID.
+        # Lets download_file render without re-fetching the $expand=all payload.
+        self._wi_cache: dict[str, dict[int, dict]] = {}
+        # Sanitized wiki name -> wiki ID from the last listing, keyed by API base
+        self._wiki_ids: dict[str, dict[str, str]] = {}
 
     async def _get_access_token(self, source) -> str:
         """Get an access token, using cache when possible (~1h lifetime)."""
@@ -230,43 +299,72 @@ class AzureDevOpsConnector(BaseSyncConnector):
             )
 
         url = f"https://login.microsoftonline.com/{source.ado_tenant_id}/oauth2/v2.0/token"
-        async with httpx.AsyncClient() as client:
-            resp = await client.post(
-                url,
-                data={
-                    "grant_type": "refresh_token",
-                    "client_id": source.ado_client_id,
-                    "client_secret": source.ado_client_secret,
-                    "refresh_token": source.ado_refresh_token,
-                    "scope": ADO_SCOPES,
-                },
+        client = await self._get_client()
+        resp = await client.post(
+            url,
+            data={
+                "grant_type": "refresh_token",
+                "client_id": source.ado_client_id,
+                "client_secret": source.ado_client_secret,
+                "refresh_token": source.ado_refresh_token,
+                "scope": ADO_SCOPES,
+            },
+        )
+        if resp.status_code != 200:
+            try:
+                body = resp.json()
+                error_desc = body.get("error_description", body.get("error", ""))
+            except Exception:
+                error_desc = resp.text[:500]
+            raise RuntimeError(
+                f"Azure DevOps token refresh failed ({resp.status_code}): {error_desc}. "
+                "Try reconnecting Azure DevOps."
             )
-            if resp.status_code != 200:
-                try:
-                    body = resp.json()
-                    error_desc = body.get("error_description", body.get("error", ""))
-                except Exception:
-                    error_desc = resp.text[:500]
-                raise RuntimeError(
-                    f"Azure DevOps token refresh failed ({resp.status_code}): {error_desc}. "
-                    "Try reconnecting Azure DevOps."
-                )
 
-            data = resp.json()
-            new_refresh = data.get("refresh_token")
-            if new_refresh and new_refresh != source.ado_refresh_token:
-                source.ado_refresh_token = new_refresh
-                logger.info("Azure DevOps refresh token rotated for %s", source.folder_path)
+        data = resp.json()
+        new_refresh = data.get("refresh_token")
+        if new_refresh and new_refresh != source.ado_refresh_token:
+            source.ado_refresh_token = new_refresh
+            logger.info("Azure DevOps refresh token rotated for %s", source.folder_path)
 
-            self._cached_token = data["access_token"]
-            self._token_expires_at = time.time() + data.get("expires_in", 3600)
-            return self._cached_token
+        self._cached_token = data["access_token"]
+        self._token_expires_at = time.time() + data.get("expires_in", 3600)
+        return self._cached_token
 
     def _api_base(self, source) -> str:
-        return f"https://dev.azure.com/{source.ado_organization}/{quote(source.ado_project, safe='')}/_apis"
+        return _ado_api_base(source.ado_organization, source.ado_project)
 
     def _headers(self, token: str) -> dict:
-        return {"Authorization": f"Bearer {token}"}
+        # One headers dict per access token, reused until the token changes
+        if self._cached_headers is None or self._cached_headers[0] != token:
+            self._cached_headers = (token, {"Authorization": f"Bearer {token}"})
+        return self._cached_headers[1]
+
+    @staticmethod
+    async def _ado_request(
+        client: httpx.AsyncClient, method: str, url: str,
+        *, max_retries: int = 4, **kwargs,
+    ) -> httpx.Response:
+        """Send a request with retry + backoff for throttling (429) and transient 5xx.
+
+        Respects the Retry-After header when present. Falls back to
+        exponential backoff (2, 4, 8, 16 s).
+        """
+        for attempt in range(max_retries + 1):
+            resp = await client.request(method, url, **kwargs)
+            if resp.status_code not in _RETRY_STATUSES or attempt == max_retries:
+                return resp
+            try:
+                retry_after = float(resp.headers.get("Retry-After", 2 ** (attempt + 1)))
+            except ValueError:
+                retry_after = 2 ** (attempt + 1)
+            retry_after = min(retry_after, 30)  # cap wait at 30 s
+            logger.warning(
+                "Azure DevOps returned %d, retry %d/%d in %ss: %s %s",
+                resp.status_code, attempt + 1, max_retries, retry_after, method, url[:120],
+            )
+            await asyncio.sleep(retry_after)
+        return resp
 
     # ---- list_files -------------------------------------------------------
 
@@ -274,9 +372,9 @@ class AzureDevOpsConnector(BaseSyncConnector):
         token = await self._get_access_token(source)
         files: list[RemoteFile] = []
 
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            await self._list_work_items(client, token, source, files)
-            await self._list_wiki_pages(client, token, source, files)
+        client = await self._get_client()
+        await self._list_work_items(client, token, source, files)
+        await self._list_wiki_pages(client, token, source, files)
 
         return files
 
@@ -285,7 +383,8 @@ class AzureDevOpsConnector(BaseSyncConnector):
         headers = self._headers(token)
 
         # WIQL to get all work item IDs
-        resp = await client.post(
+        resp = await self._ado_request(
+            client, "POST",
             f"{base}/wit/wiql?api-version={ADO_API_VERSION}",
             json={
                 "query": (
@@ -299,6 +398,9 @@ class AzureDevOpsConnector(BaseSyncConnector):
         if resp.status_code != 200:
             raise RuntimeError(f"WIQL query failed ({resp.status_code}): {resp.text[:500]}")
 
+        wi_cache: dict[int, dict] = {}
+        self._wi_cache[base] = wi_cache
+
         work_item_ids = [item["id"] for item in resp.json().get("workItems", [])]
         if not work_item_ids:
             return
@@ -308,7 +410,8 @@ class AzureDevOpsConnector(BaseSyncConnector):
             batch_ids = work_item_ids[batch_start : batch_start + 200]
             ids_csv = ",".join(str(i) for i in batch_ids)
 
-            resp = await client.get(
+            resp = await self._ado_request(
+                client, "GET",
                 f"{base}/wit/workitems?ids={ids_csv}&$expand=all&api-version={ADO_API_VERSION}",
                 headers=headers,
             )
@@ -319,15 +422,18 @@ class AzureDevOpsConnector(BaseSyncConnector):
             for wi in resp.json().get("value", []):
                 fields = wi.get("fields", {})
                 wi_id = wi["id"]
+                wi_cache[wi_id] = wi
                 wi_type = fields.get("System.WorkItemType", "Unknown")
                 title = fields.get("System.Title", f"WorkItem-{wi_id}")
                 changed_date = fields.get("System.ChangedDate", "")
                 rev = str(wi.get("rev", 0))
 
-                safe_title = _sanitize_filename(title)
+                safe_title = sanitize_filename(title)
                 remote_path = f"work-items/{wi_type}/{wi_id}-{safe_title}.md"
 
-                content_hash = hashlib.sha256(f"{rev}:{changed_date}".encode()).hexdigest()
+                content_hash = hashlib.blake2b(
+                    f"{rev}:{changed_date}".encode(), digest_size=16
+                ).hexdigest()
 
                 created_date = fields.get("System.CreatedDate", "")
 
@@ -345,7 +451,8 @@ class AzureDevOpsConnector(BaseSyncConnector):
         base = self._api_base(source)
         headers = self._headers(token)
 
-        resp = await client.get(
+        resp = await self._ado_request(
+            client, "GET",
             f"{base}/wiki/wikis?api-version={ADO_API_VERSION}",
             headers=headers,
         )
@@ -353,11 +460,16 @@ class AzureDevOpsConnector(BaseSyncConnector):
             logger.warning("Failed to list wikis: %s %s", resp.status_code, resp.text[:300])
             return
 
+        wiki_ids: dict[str, str] = {}
+        self._wiki_ids[base] = wiki_ids
+
         for wiki in resp.json().get("value", []):
             wiki_id = wiki["id"]
             wiki_name = wiki.get("name", wiki_id)
+            wiki_ids[sanitize_filename(wiki_name)] = wiki_id
 
-            resp2 = await client.get(
+            resp2 = await self._ado_request(
+                client, "GET",
                 f"{base}/wiki/wikis/{wiki_id}/pages"
                 f"?recursionLevel=full&api-version={ADO_API_VERSION}",
                 headers=headers,
@@ -367,30 +479,37 @@ class AzureDevOpsConnector(BaseSyncConnector):
                 continue
 
             root_page = resp2.json()
-            self._walk_wiki_tree(root_page, f"wiki/{_sanitize_filename(wiki_name)}", files)
+            self._walk_wiki_tree(root_page, f"wiki/{sanitize_filename(wiki_name)}", files)
 
     def _walk_wiki_tree(self, page: dict, base_path: str, files: list[RemoteFile]):
-        page_path = page.get("path", "")
-        git_item_path = page.get("gitItemPath", "")
-
-        if page_path and page_path != "/":
-            clean_path = page_path.strip("/")
-            remote_path = f"{base_path}/{clean_path}.md"
-            content_hash = hashlib.sha256(
-                (git_item_path or page_path).encode()
-            ).hexdigest()
-
-            files.append(
-                RemoteFile(
-                    remote_path=remote_path,
-                    size=0,
-                    modified_at="",
-                    content_hash=content_hash,
+        # Iterative pre-order walk: deep wikis can't hit the recursion limit
+        blake2b = hashlib.blake2b
+        prefix = base_path + "/"
+        stack = [page]
+        while stack:
+            page = stack.pop()
+            page_path = page.get("path", "")
+            git_item_path = page.get("gitItemPath", "")
+
+            if page_path and page_path != "/":
+                clean_path = page_path.strip("/")
+                remote_path = f"{prefix}{clean_path}.md"
+                content_hash = blake2b(
+                    (git_item_path or page_path).encode(), digest_size=16
+                ).hexdigest()
+
+                files.append(
+                    RemoteFile(
+                        remote_path=remote_path,
+                        size=0,
+                        modified_at="",
+                        content_hash=content_hash,
+                    )
                 )
-            )
 
-        for sub_page in page.get("subPages", []):
-            self._walk_wiki_tree(sub_page, base_path, files)
+            sub_pages = page.get("subPages")
+            if sub_pages:
+                stack.extend(reversed(sub_pages))
 
     # ---- download_file ----------------------------------------------------
 
@@ -405,7 +524,7 @@ class AzureDevOpsConnector(BaseSyncConnector):
             raise RuntimeError(f"Unknown remote path pattern: {remote_path}")
 
     async def _download_work_item(self, source, token, remote_path, local_path):
-        match = re.match(r"work-items/[^/]+/(\d+)-.*\.md$", remote_path)
+        match = _WORK_ITEM_PATH_RE.match(remote_path)
         if not match:
             raise RuntimeError(f"Cannot parse work item path: {remote_path}")
 
@@ -413,26 +532,40 @@ class AzureDevOpsConnector(BaseSyncConnector):
         base = self._api_base(source)
         headers = self._headers(token)
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            resp = await client.get(
-                f"{base}/wit/workitems/{wi_id}?$expand=all&api-version={ADO_API_VERSION}",
-                headers=headers,
-            )
-            if resp.status_code != 200:
-                raise RuntimeError(f"Failed to fetch work item {wi_id}: {resp.text[:300]}")
-            wi = resp.json()
+        # Prefer the $expand=all payload already fetched by list_files
+        wi = self._wi_cache.get(base, {}).pop(wi_id, None)
 
-            comments: list = []
-            resp = await client.get(
-                f"{base}/wit/workitems/{wi_id}/comments"
-                f"?api-version={ADO_API_VERSION}-preview.4",
-                headers=headers,
+        comments_url = (
+            f"{base}/wit/workitems/{wi_id}/comments?api-version={ADO_API_VERSION}-preview.4"
+        )
+        comments: list = []
+
+        client = await self._get_client()
+        if wi is None:
+            # Work item body and comments are independent — fetch them concurrently
+            wi_resp, cm_resp = await asyncio.gather(
+                self._ado_request(
+                    client, "GET",
+                    f"{base}/wit/workitems/{wi_id}?$expand=all&api-version={ADO_API_VERSION}",
+                    headers=headers,
+                ),
+                self._ado_request(client, "GET", comments_url, headers=headers),
             )
-            if resp.status_code == 200:
-                comments = resp.json().get("comments", [])
+            if wi_resp.status_code != 200:
+                raise RuntimeError(
+                    f"Failed to fetch work item {wi_id}: {wi_resp.text[:300]}"
+                )
+            wi = wi_resp.json()
+            if cm_resp.status_code == 200:
+                comments = cm_resp.json().get("comments", [])
+        elif (wi.get("fields") or {}).get("System.CommentCount", 1) > 0:
+            # Most work items have no comments; only ask when the count says so
+            cm_resp = await self._ado_request(client, "GET", comments_url, headers=headers)
+            if cm_resp.status_code == 200:
+                comments = cm_resp.json().get("comments", [])
 
         md = _render_work_item_md(wi, comments)
-        local_path.write_text(md, encoding="utf-8")
+        await asyncio.to_thread(local_path.write_text, md, encoding="utf-8")
 
     async def _download_wiki_page(self, source, token, remote_path, local_path):
         # Parse: wiki/{WikiName}/{rest/of/path}.md
@@ -446,38 +579,43 @@ class AzureDevOpsConnector(BaseSyncConnector):
         base = self._api_base(source)
         headers = self._headers(token)
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            resp = await client.get(
+        # Resolved by list_files; only re-list wikis if this page wasn't seen there
+        wiki_id = self._wiki_ids.get(base, {}).get(wiki_name)
+
+        client = await self._get_client()
+        if not wiki_id:
+            resp = await self._ado_request(
+                client, "GET",
                 f"{base}/wiki/wikis?api-version={ADO_API_VERSION}",
                 headers=headers,
             )
             if resp.status_code != 200:
                 raise RuntimeError(f"Failed to list wikis: {resp.text[:300]}")
 
-            wiki_id = None
             for wiki in resp.json().get("value", []):
-                if _sanitize_filename(wiki.get("name", "")) == wiki_name:
+                if sanitize_filename(wiki.get("name", "")) == wiki_name:
                     wiki_id = wiki["id"]
                     break
 
-            if not wiki_id:
-                raise RuntimeError(f"Wiki not found: {wiki_name}")
+        if not wiki_id:
+            raise RuntimeError(f"Wiki not found: {wiki_name}")
 
-            encoded_path = quote(page_path, safe="/")
-            resp = await client.get(
-                f"{base}/wiki/wikis/{wiki_id}/pages"
-                f"?path={encoded_path}&includeContent=true"
-                f"&api-version={ADO_API_VERSION}",
-                headers=headers,
+        encoded_path = quote(page_path, safe="/")
+        resp = await self._ado_request(
+            client, "GET",
+            f"{base}/wiki/wikis/{wiki_id}/pages"
+            f"?path={encoded_path}&includeContent=true"
+            f"&api-version={ADO_API_VERSION}",
+            headers=headers,
+        )
+        if resp.status_code != 200:
+            raise RuntimeError(
+                f"Failed to fetch wiki page {page_path}: {resp.text[:300]}"
             )
-            if resp.status_code != 200:
-                raise RuntimeError(
-                    f"Failed to fetch wiki page {page_path}: {resp.text[:300]}"
-                )
 
-            content = resp.json().get("content", "")
+        content = resp.json().get("content", "")
 
-        local_path.write_text(content, encoding="utf-8")
+        await asyncio.to_thread(local_path.write_text, content, encoding="utf-8")
 
     # ---- sync override (revision-based change tracking) -------------------
 
@@ -488,56 +626,47 @@ class AzureDevOpsConnector(BaseSyncConnector):
         local_root.mkdir(parents=True, exist_ok=True)
 
         hash_file = local_root / ".ado_revisions.json"
-        old_revisions: dict[str, str] = {}
-        if hash_file.exists():
-            try:
-                old_revisions = json.loads(hash_file.read_text())
-            except Exception:
-                pass
+        old_revisions: dict[str, str] = read_json_sidecar(hash_file)
 
         remote_files = await self.list_files(source)
-        remote_paths: set[str] = set()
+        remote_paths = frozenset(rf.remote_path for rf in remote_files)
         new_revisions: dict[str, str] = {}
         stats = {"downloaded": 0, "deleted": 0, "skipped": 0, "errors": 0}
 
+        to_download: list[RemoteFile] = []
         for rf in remote_files:
-            remote_paths.add(rf.remote_path)
             new_revisions[rf.remote_path] = rf.content_hash or ""
             local_file = local_root / rf.remote_path
 
             if local_file.exists() and old_revisions.get(rf.remote_path) == rf.content_hash:
                 stats["skipped"] += 1
                 continue
+            to_download.append(rf)
 
-            local_file.parent.mkdir(parents=True, exist_ok=True)
-            try:
-                await self.download_file(source, rf.remote_path, local_file)
-                stats["downloaded"] += 1
-                logger.info("Downloaded: %s", rf.remote_path)
-            except Exception as e:
-                logger.error("Failed to download %s: %s", rf.remote_path, e)
-                stats["errors"] += 1
-
-        # Mirror-delete
-        for local_file in local_root.rglob("*"):
-            if local_file.is_file() and not local_file.name.startswith("."):
-                rel = str(local_file.relative_to(local_root))
-                if rel not in remote_paths:
-                    try:
-                        local_file.unlink()
-                        stats["deleted"] += 1
-                        logger.info("Deleted (not on remote): %s", rel)
-                    except Exception as e:
-                        logger.error("Failed to delete %s: %s", rel, e)
-                        stats["errors"] += 1
-
-        # Clean up empty directories
-        for dirpath in sorted(local_root.rglob("*"), reverse=True):
-            if dirpath.is_dir() and not any(dirpath.iterdir()):
+        # Create each target directory once, before the download fan-out
+        for parent in {(local_root / rf.remote_path).parent for rf in to_download}:
+            parent.mkdir(parents=True, exist_ok=True)
+
+        sem = asyncio.Semaphore(ADO_DOWNLOAD_CONCURRENCY)
+
+        async def _download_one(rf: RemoteFile) -> bool:
+            local_file = local_root / rf.remote_path
+            async with sem:
                 try:
-                    dirpath.rmdir()
-                except Exception:
-                    pass
+                    await self.download_file(source, rf.remote_path, local_file)
+                    logger.info("Downloaded: %s", rf.remote_path)
+                    return True
+                except Exception as e:
+                    logger.error("Failed to download %s: %s", rf.remote_path, e)
+                    return False
+
+        results = await asyncio.gather(*(_download_one(rf) for rf in to_download))
+        downloaded = sum(results)
+        stats["downloaded"] += downloaded
+        stats["errors"] += len(results) - downloaded
+
+        # Mirror-delete and clean up empty directories
+        self._mirror_delete(local_root, remote_paths, stats)
 
         # Write timestamps sidecar for the indexing pipeline
         timestamps = {}
@@ -551,6 +680,9 @@ class AzureDevOpsConnector(BaseSyncConnector):
                 timestamps[rf.remote_path] = entry
         (local_root / ".voitta_timestamps.json").write_text(json.dumps(timestamps))
 
-        hash_file.write_text(json.dumps(new_revisions), encoding="utf-8")
+        # Only rewrite revision state when it changed; write-then-rename so a crash
+        # mid-write can't lose it and force a full re-download next run.
+        if new_revisions != old_revisions:
+            write_json_sidecar(hash_file, new_revisions)
         logger.info("Sync complete for %s: %s", folder_path, stats)
         return stats
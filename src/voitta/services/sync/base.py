@@ -1,14 +1,76 @@
 """Base class for remote sync connectors."""
 
+import asyncio
 import hashlib
+import importlib.util
 import json
 import logging
+import os
+import re
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from pathlib import Path
 
+import httpx
+
 logger = logging.getLogger(__name__)
 
+# HTTP/2 needs the optional "h2" package; fall back to HTTP/1.1 keep-alive without it
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+try:
+    import orjson  # Optional: much faster (de)serialization of large sidecars
+except ImportError:
+    orjson = None
+
+
+# Reserved path characters and every whitespace char (same set as regex \s; the
+# highest Unicode whitespace code point is U+3000) map to "-".
+_SANITIZE_TABLE = str.maketrans(
+    dict.fromkeys('<>:"/\\|?*', "-")
+    | dict.fromkeys((c for c in map(chr, range(0x3001)) if c.isspace()), "-")
+)
+_DASHES_RE = re.compile(r"-{2,}")
+
+
+def sanitize_filename(name: str, max_len: int = 100) -> str:
+    """Sanitize a string for use as a filename/path component."""
+    sanitized = _DASHES_RE.sub("-", name.translate(_SANITIZE_TABLE))
+    return sanitized.strip("-")[:max_len]
+
+
+def read_json_sidecar(path: Path) -> dict:
+    """Load a JSON sidecar file, returning {} if it is missing or unreadable."""
+    try:
+        data = path.read_bytes()
+    except FileNotFoundError:
+        return {}
+    try:
+        return orjson.loads(data) if orjson else json.loads(data)
+    except Exception:
+        return {}
+
+
+def write_json_sidecar(path: Path, data: dict) -> bool:
+    """Write a JSON sidecar compactly and atomically (temp file + rename).
+
+    Returns False without touching the file if it already holds exactly
+    this content, so a no-op sync leaves sidecars alone.
+    """
+    if orjson:
+        blob = orjson.dumps(data)
+    else:
+        blob = json.dumps(data, separators=(",", ":")).encode()
+    try:
+        if path.stat().st_size == len(blob) and path.read_bytes() == blob:
+            return False
+    except OSError:
+        pass
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_bytes(blob)
+    os.replace(tmp_path, path)
+    return True
+
 
 @dataclass
 class RemoteFile:
@@ -20,11 +82,45 @@ class RemoteFile:
     content_hash: str | None = None
     created_at: str = ""  # ISO 8601
     source_url: str | None = None  # Original external URL (e.g. Google Docs link)
+    source_id: str | None = None  # Remote object ID, when the connector has one
 
 
 class BaseSyncConnector(ABC):
     """Abstract base for all sync connectors."""
 
+    _http_client: httpx.AsyncClient | None = None
+    _http_client_loop: asyncio.AbstractEventLoop | None = None
+    # Max downloads in flight during sync(); connectors whose downloads can
+    # safely overlap raise this
+    download_concurrency: int = 1
+
+    async def _get_client(self) -> httpx.AsyncClient:
+        """Return this connector's pooled HTTP client.
+
+        Connections (and their TLS sessions) are reused across every request
+        the connector makes. A new client is created if the previous one was
+        closed or belongs to a different event loop.
+        """
+        loop = asyncio.get_running_loop()
+        client = self._http_client
+        if client is None or client.is_closed or self._http_client_loop is not loop:
+            client = httpx.AsyncClient(
+                http2=_HTTP2_AVAILABLE,
+                limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+                timeout=60.0,
+            )
+            self._http_client = client
+            self._http_client_loop = loop
+        return client
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client, if one was created."""
+        client = self._http_client
+        self._http_client = None
+        self._http_client_loop = None
+        if client is not None and not client.is_closed:
+            await client.aclose()
+
     @abstractmethod
     async def list_files(self, source) -> list[RemoteFile]:
         """List all files on the remote, recursively."""
@@ -35,6 +131,63 @@ class BaseSyncConnector(ABC):
         """Download a single file from remote to local_path."""
         ...
 
+    async def _download_remote_file(self, source, rf: RemoteFile, local_path: Path) -> None:
+        """Download a file returned by list_files.
+
+        Connectors that set RemoteFile.source_id override this to fetch by ID
+        instead of parsing the ID back out of the remote path.
+        """
+        await self.download_file(source, rf.remote_path, local_path)
+
+    def _mirror_delete(
+        self,
+        local_root: Path,
+        remote_paths: frozenset[str] | set[str],
+        stats: dict,
+        keep_extensions: set[str] | None = None,
+        skip_dirs: frozenset[str] = frozenset(),
+    ) -> None:
+        """Delete local files not on remote and remove directories left empty.
+
+        Walks the tree once; directories are then tried for removal deepest
+        first. Top-level directories named in skip_dirs are left untouched.
+        """
+        _keep = keep_extensions or set()
+        root = str(local_root)
+        visited_dirs: list[str] = []
+        for dirpath, dirnames, filenames in os.walk(root):
+            # Relative paths are built as plain strings, once per directory, and
+            # use "/" to match remote paths regardless of platform.
+            rel_dir = os.path.relpath(dirpath, root).replace(os.sep, "/")
+            if rel_dir == ".":
+                prefix = ""
+                if skip_dirs:
+                    dirnames[:] = [d for d in dirnames if d not in skip_dirs]
+            else:
+                prefix = rel_dir + "/"
+                visited_dirs.append(dirpath)
+            for name in filenames:
+                if name.startswith("."):
+                    continue
+                if _keep and os.path.splitext(name)[1].lower() in _keep:
+                    continue
+                rel = prefix + name
+                if rel not in remote_paths:
+                    try:
+                        os.unlink(os.path.join(dirpath, name))
+                        stats["deleted"] += 1
+                        logger.info("Deleted (not on remote): %s", rel)
+                    except Exception as e:
+                        logger.error("Failed to delete %s: %s", rel, e)
+                        stats["errors"] += 1
+
+        # Top-down walk order reversed puts every directory after its children
+        for dirpath in reversed(visited_dirs):
+            try:
+                os.rmdir(dirpath)  # Only succeeds if empty
+            except OSError:
+                pass
+
     async def sync(self, source, fs, keep_extensions: set[str] | None = None) -> dict:
         """Perform a full mirror sync.
 
@@ -47,58 +200,65 @@ class BaseSyncConnector(ABC):
         local_root = fs._resolve_path(folder_path)
         local_root.mkdir(parents=True, exist_ok=True)
 
+        # Local hash cache: remote_path -> [size, mtime_ns, sha256]. Files whose
+        # size and mtime are unchanged reuse the cached hash instead of being re-read.
+        hash_cache_file = local_root / ".voitta_hash_cache.json"
+        old_hashes: dict[str, list] = read_json_sidecar(hash_cache_file)
+        new_hashes: dict[str, list] = {}
+
         remote_files = await self.list_files(source)
-        remote_paths = set()
+        remote_paths = frozenset(rf.remote_path for rf in remote_files)
         stats = {"downloaded": 0, "deleted": 0, "skipped": 0, "errors": 0}
 
-        # Download new/changed files
+        # Find new/changed files
+        to_download: list[tuple[RemoteFile, Path]] = []
         for rf in remote_files:
-            remote_paths.add(rf.remote_path)
             local_file = local_root / rf.remote_path
 
-            if local_file.exists():
+            try:
+                st = local_file.stat()
+            except FileNotFoundError:
+                st = None
+
+            if st is not None:
                 if rf.content_hash:
-                    local_hash = hashlib.sha256(local_file.read_bytes()).hexdigest()
+                    cached = old_hashes.get(rf.remote_path)
+                    if cached and cached[0] == st.st_size and cached[1] == st.st_mtime_ns:
+                        local_hash = cached[2]
+                    else:
+                        with open(local_file, "rb") as f:
+                            local_hash = hashlib.file_digest(f, "sha256").hexdigest()
+                    new_hashes[rf.remote_path] = [st.st_size, st.st_mtime_ns, local_hash]
                     if local_hash == rf.content_hash:
                         stats["skipped"] += 1
                         continue
-                elif local_file.stat().st_size == rf.size:
+                elif st.st_size == rf.size:
                     stats["skipped"] += 1
                     continue
 
             local_file.parent.mkdir(parents=True, exist_ok=True)
+            to_download.append((rf, local_file))
 
-            try:
-                await self.download_file(source, rf.remote_path, local_file)
-                stats["downloaded"] += 1
-                logger.info("Downloaded: %s", rf.remote_path)
-            except Exception as e:
-                logger.error("Failed to download %s: %s", rf.remote_path, e)
-                stats["errors"] += 1
-
-        # Delete local files not on remote (mirror)
-        _keep = keep_extensions or set()
-        for local_file in local_root.rglob("*"):
-            if local_file.is_file() and not local_file.name.startswith("."):
-                if local_file.suffix.lower() in _keep:
-                    continue
-                rel = str(local_file.relative_to(local_root))
-                if rel not in remote_paths:
-                    try:
-                        local_file.unlink()
-                        stats["deleted"] += 1
-                        logger.info("Deleted (not on remote): %s", rel)
-                    except Exception as e:
-                        logger.error("Failed to delete %s: %s", rel, e)
-                        stats["errors"] += 1
+        # Download them, up to download_concurrency at a time
+        sem = asyncio.Semaphore(self.download_concurrency)
 
-        # Clean up empty directories
-        for dirpath in sorted(local_root.rglob("*"), reverse=True):
-            if dirpath.is_dir() and not any(dirpath.iterdir()):
+        async def _download_one(rf: RemoteFile, local_file: Path) -> bool:
+            async with sem:
                 try:
-                    dirpath.rmdir()
-                except Exception:
-                    pass
+                    await self._download_remote_file(source, rf, local_file)
+                    logger.info("Downloaded: %s", rf.remote_path)
+                    return True
+                except Exception as e:
+                    logger.error("Failed to download %s: %s", rf.remote_path, e)
+                    return False
+
+        results = await asyncio.gather(*(_download_one(rf, lf) for rf, lf in to_download))
+        downloaded = sum(results)
+        stats["downloaded"] += downloaded
+        stats["errors"] += len(results) - downloaded
+
+        # Delete local files not on remote (mirror) and clean up empty directories
+        self._mirror_delete(local_root, remote_paths, stats, keep_extensions)
 
         # Write timestamps sidecar for the indexing pipeline
         timestamps = {}
@@ -120,5 +280,7 @@ class BaseSyncConnector(ABC):
         if sources:
             (local_root / ".voitta_sources.json").write_text(json.dumps(sources))
 
+        write_json_sidecar(hash_cache_file, new_hashes)
+
         logger.info("Sync complete for %s: %s", folder_path, stats)
         return stats
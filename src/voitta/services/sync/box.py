@@ -1,20 +1,33 @@
 """Box sync connector using OAuth 2.0 delegated auth."""
 
+import asyncio
+import hashlib
+import json
 import logging
+import os
+import random
 import re
 import time
 from pathlib import Path
 from urllib.parse import urlencode
 
+try:
+    import fcntl
+except ImportError:  # Windows: no cross-process locking
+    fcntl = None
+
 import httpx
 
-from .base import BaseSyncConnector, RemoteFile
+from .base import BaseSyncConnector, RemoteFile, sanitize_filename
 
 logger = logging.getLogger(__name__)
 
 BOX_AUTH_URL = "https://account.box.com/api/oauth2/authorize"
 BOX_TOKEN_URL = "https://api.box.com/oauth2/token"
 BOX_API_BASE = "https://api.box.com/2.0"
+BOX_LIST_CONCURRENCY = 8  # Max in-flight folder listing requests
+BOX_TOKEN_REFRESH_FRACTION = 0.9  # Refresh access tokens at ~90% of their lifetime
+BOX_DOWNLOAD_CHUNK_SIZE = 1 << 20  # Stream downloads to disk 1 MiB at a time
 
 
 # ---------------------------------------------------------------------------
@@ -22,12 +35,48 @@ BOX_API_BASE = "https://api.box.com/2.0"
 # ---------------------------------------------------------------------------
 
 
-def _sanitize_filename(name: str) -> str:
-    """Sanitize a string for use as a filename/path component."""
-    sanitized = re.sub(r'[<>:"/\\|?*]', "-", name)
-    sanitized = re.sub(r"\s+", "-", sanitized)
-    sanitized = re.sub(r"-{2,}", "-", sanitized)
-    return sanitized.strip("-")[:100]
+_FILE_ID_RE = re.compile(r"^(\d+)-")
+
+
+def _read_token_sidecar(path: Path) -> tuple[str, float] | None:
+    """Read a persisted (access_token, refresh_at) pair, or None if unusable."""
+    try:
+        data = json.loads(path.read_text())
+        return data["access_token"], float(data["refresh_at"])
+    except Exception:
+        return None
+
+
+def _write_token_sidecar(path: Path, entry: tuple[str, float]) -> None:
+    """Atomically persist an (access_token, refresh_at) pair, readable only by us."""
+    tmp_path = path.with_name(path.name + ".tmp")
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "w") as f:
+        json.dump({"access_token": entry[0], "refresh_at": entry[1]}, f)
+    os.replace(tmp_path, path)
+
+
+def _token_sidecar_path(folder_path: str) -> Path:
+    """Location of the persisted access token for a synced folder."""
+    from ..filesystem import get_filesystem_service
+
+    return get_filesystem_service()._resolve_path(folder_path) / ".box_token.json"
+
+
+def _acquire_file_lock(path: Path) -> int | None:
+    """Take an exclusive cross-process lock next to path (blocking)."""
+    if fcntl is None:
+        return None
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd = os.open(path.with_name(path.name + ".lock"), os.O_RDWR | os.O_CREAT, 0o600)
+    fcntl.flock(fd, fcntl.LOCK_EX)
+    return fd
+
+
+def _release_file_lock(fd: int | None) -> None:
+    if fd is not None:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+        os.close(fd)
 
 
 def get_auth_url(client_id: str, redirect_uri: str, state: str) -> str:
@@ -76,8 +125,10 @@ async def exchange_code_for_tokens(
 class BoxConnector(BaseSyncConnector):
     """Sync files from a Box folder using OAuth 2.0 delegated auth."""
 
-    # In-memory token cache: folder_path -> (access_token, expires_at)
+    # In-memory token cache: folder_path -> (access_token, refresh_at)
     _token_cache: dict[str, tuple[str, float]] = {}
+    # One lock per folder so concurrent callers share a single refresh
+    _refresh_locks: dict[str, asyncio.Lock] = {}
 
     async def _get_access_token(self, source) -> str:
         """Get an access token, refreshing if needed.
@@ -92,33 +143,72 @@ class BoxConnector(BaseSyncConnector):
 
         # Check memory cache
         cached = self._token_cache.get(source.folder_path)
-        if cached:
-            token, expires_at = cached
-            if time.time() < expires_at - 60:  # 60s safety margin
-                return token
-
-        async with httpx.AsyncClient() as client:
-            resp = await client.post(
-                BOX_TOKEN_URL,
-                data={
-                    "grant_type": "refresh_token",
-                    "client_id": source.box_client_id,
-                    "client_secret": source.box_client_secret,
-                    "refresh_token": source.box_refresh_token,
-                },
+        if cached and time.time() < cached[1]:
+            return cached[0]
+
+        lock = self._refresh_locks.setdefault(source.folder_path, asyncio.Lock())
+        async with lock:
+            # Another caller may have refreshed while we waited; refreshing again
+            # would spend the single-use refresh token a second time.
+            cached = self._token_cache.get(source.folder_path)
+            if cached and time.time() < cached[1]:
+                return cached[0]
+
+            # The on-disk cache survives restarts and is shared with other worker
+            # processes; the file lock makes sure only one of them rotates the
+            # refresh token at a time.
+            cache_path = self._token_cache_path(source)
+            lock_fd = await asyncio.to_thread(_acquire_file_lock, cache_path)
+            try:
+                cached = _read_token_sidecar(cache_path)
+                if cached and time.time() < cached[1]:
+                    self._token_cache[source.folder_path] = cached
+                    return cached[0]
+
+                access_token = await self._refresh_access_token(source)
+                _write_token_sidecar(cache_path, self._token_cache[source.folder_path])
+                return access_token
+            finally:
+                _release_file_lock(lock_fd)
+
+    def _token_cache_path(self, source) -> Path:
+        """Location of the persisted access token for a source's folder."""
+        return _token_sidecar_path(source.folder_path)
+
+    @classmethod
+    def forget_access_token(cls, folder_path: str) -> None:
+        """Drop a folder's cached access token, in memory and on disk.
+
+        Called when the grant or credentials change, so a reconnect never
+        keeps serving a token minted for the previous grant.
+        """
+        cls._token_cache.pop(folder_path, None)
+        _token_sidecar_path(folder_path).unlink(missing_ok=True)
+
+    async def _refresh_access_token(self, source) -> str:
+        """Exchange the refresh token for a new access token and cache it."""
+        client = await self._get_client()
+        resp = await client.post(
+            BOX_TOKEN_URL,
+            data={
+                "grant_type": "refresh_token",
+                "client_id": source.box_client_id,
+                "client_secret": source.box_client_secret,
+                "refresh_token": source.box_refresh_token,
+            },
+        )
+        if resp.status_code != 200:
+            try:
+                body = resp.json()
+                error_desc = body.get("error_description", body.get("error", ""))
+            except Exception:
+                error_desc = resp.text[:500]
+            raise RuntimeError(
+                f"Box token refresh failed ({resp.status_code}): {error_desc}. "
+                "Try reconnecting Box."
             )
-            if resp.status_code != 200:
-                try:
-                    body = resp.json()
-                    error_desc = body.get("error_description", body.get("error", ""))
-                except Exception:
-                    error_desc = resp.text[:500]
-                raise RuntimeError(
-                    f"Box token refresh failed ({resp.status_code}): {error_desc}. "
-                    "Try reconnecting Box."
-                )
 
-            data = resp.json()
+        data = resp.json()
 
         # Box always rotates the refresh token
         new_refresh = data.get("refresh_token")
@@ -128,7 +218,11 @@ class BoxConnector(BaseSyncConnector):
 
         access_token = data["access_token"]
         expires_in = data.get("expires_in", 3600)
-        self._token_cache[source.folder_path] = (access_token, time.time() + expires_in)
+        # Refresh after a jittered fraction of the lifetime rather than a fixed
+        # margin before expiry: tolerates clock skew and keeps many sources from
+        # refreshing in lockstep.
+        lifetime = expires_in * BOX_TOKEN_REFRESH_FRACTION * random.uniform(0.9, 1.0)
+        self._token_cache[source.folder_path] = (access_token, time.time() + lifetime)
 
         return access_token
 
@@ -140,97 +234,151 @@ class BoxConnector(BaseSyncConnector):
         token = await self._get_access_token(source)
         files: list[RemoteFile] = []
 
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            await self._list_folder_recursive(
-                client, token, source.box_folder_id, "", files
-            )
+        client = await self._get_client()
+        await self._list_folder_recursive(
+            client, token, source.box_folder_id, "", files
+        )
 
         logger.info("Listed %d files from Box folder %s", len(files), source.box_folder_id)
         return files
 
     async def _list_folder_recursive(
         self, client: httpx.AsyncClient, token: str, folder_id: str, path_prefix: str,
-        files: list[RemoteFile],
+        files: list[RemoteFile], sem: asyncio.Semaphore | None = None,
     ) -> None:
-        """Walk a Box folder tree, collecting all files."""
-        offset = 0
-        limit = 1000
-
-        while True:
-            resp = await client.get(
-                f"{BOX_API_BASE}/folders/{folder_id}/items",
-                params={
-                    "fields": "name,size,modified_at,created_at,sha1,type",
-                    "limit": limit,
-                    "offset": offset,
-                },
-                headers={"Authorization": f"Bearer {token}"},
-            )
+        """Walk a Box folder tree, collecting all files.
 
-            if resp.status_code == 401:
-                raise RuntimeError("Box authentication failed. Try reconnecting.")
-            if resp.status_code != 200:
-                raise RuntimeError(
-                    f"Box folder list failed ({resp.status_code}): {resp.text[:500]}"
-                )
+        Subfolders are listed concurrently; the semaphore bounds the number of
+        in-flight folder requests across the whole walk.
+        """
+        if sem is None:
+            sem = asyncio.Semaphore(BOX_LIST_CONCURRENCY)
 
-            data = resp.json()
-            entries = data.get("entries", [])
+        marker = None
+        subfolder_tasks: list[asyncio.Task] = []
 
-            for entry in entries:
-                entry_name = entry.get("name", "")
-                entry_type = entry.get("type", "")
-                entry_id = entry.get("id", "")
+        try:
+            while True:
+                params = {
+                    "fields": "name,size,modified_at,created_at,sha1,type",
+                    "limit": 1000,
+                    "usemarker": "true",
+                }
+                if marker:
+                    params["marker"] = marker
+                async with sem:
+                    resp = await client.get(
+                        f"{BOX_API_BASE}/folders/{folder_id}/items",
+                        params=params,
+                        headers={"Authorization": f"Bearer {token}"},
+                    )
 
-                if entry_type == "folder":
-                    subfolder_path = f"{path_prefix}{entry_name}/"
-                    await self._list_folder_recursive(
-                        client, token, entry_id, subfolder_path, files
+                if resp.status_code == 401:
+                    raise RuntimeError("Box authentication failed. Try reconnecting.")
+                if resp.status_code != 200:
+                    raise RuntimeError(
+                        f"Box folder list failed ({resp.status_code}): {resp.text[:500]}"
                     )
-                elif entry_type == "file":
-                    # Embed file ID in filename for reliable download
-                    safe_name = _sanitize_filename(entry_name)
-                    remote_path = f"{path_prefix}{entry_id}-{safe_name}"
-
-                    files.append(
-                        RemoteFile(
-                            remote_path=remote_path,
-                            size=entry.get("size", 0),
-                            modified_at=entry.get("modified_at", ""),
-                            content_hash=entry.get("sha1"),
-                            created_at=entry.get("created_at", ""),
+
+                data = resp.json()
+                entries = data.get("entries", [])
+
+                for entry in entries:
+                    entry_name = entry.get("name", "")
+                    entry_type = entry.get("type", "")
+                    entry_id = entry.get("id", "")
+
+                    if entry_type == "folder":
+                        # Start listing the subfolder while this folder keeps paginating
+                        subfolder_path = f"{path_prefix}{entry_name}/"
+                        subfolder_tasks.append(asyncio.create_task(
+                            self._list_folder_recursive(
+                                client, token, entry_id, subfolder_path, files, sem
+                            )
+                        ))
+                    elif entry_type == "file":
+                        # Embed file ID in filename for reliable download
+                        safe_name = sanitize_filename(entry_name)
+                        remote_path = f"{path_prefix}{entry_id}-{safe_name}"
+
+                        files.append(
+                            RemoteFile(
+                                remote_path=remote_path,
+                                size=entry.get("size", 0),
+                                modified_at=entry.get("modified_at", ""),
+                                content_hash=entry.get("sha1"),
+                                created_at=entry.get("created_at", ""),
+                                source_id=entry_id,
+                            )
                         )
-                    )
 
-            total_count = data.get("total_count", 0)
-            offset += len(entries)
-            if offset >= total_count or len(entries) == 0:
-                break
+                marker = data.get("next_marker")
+                if not marker:
+                    break
+
+            await asyncio.gather(*subfolder_tasks)
+        except BaseException:
+            # Don't leave sibling listings running against a client about to close
+            for task in subfolder_tasks:
+                task.cancel()
+            raise
 
     async def download_file(self, source, remote_path: str, local_path: Path) -> None:
         """Download a file from Box by its embedded file ID."""
         # Extract file ID from path: {id}-{sanitized_name}
         stem = Path(remote_path).name
-        m = re.match(r"^(\d+)-", stem)
+        m = _FILE_ID_RE.match(stem)
         if not m:
             raise RuntimeError(f"Cannot parse Box file ID from path: {remote_path}")
-        file_id = m.group(1)
+        await self._download_by_id(source, m.group(1), local_path)
 
-        token = await self._get_access_token(source)
-
-        async with httpx.AsyncClient(follow_redirects=True, timeout=120.0) as client:
-            resp = await client.get(
-                f"{BOX_API_BASE}/files/{file_id}/content",
-                headers={"Authorization": f"Bearer {token}"},
+    async def _download_remote_file(self, source, rf: RemoteFile, local_path: Path) -> None:
+        if rf.source_id:
+            # content_hash is the SHA-1 Box reported in the listing
+            await self._download_by_id(
+                source, rf.source_id, local_path, expected_sha1=rf.content_hash
             )
+        else:
+            await self.download_file(source, rf.remote_path, local_path)
+
+    async def _download_by_id(
+        self, source, file_id: str, local_path: Path, expected_sha1: str | None = None
+    ) -> None:
+        token = await self._get_access_token(source)
 
+        client = await self._get_client()
+        async with client.stream(
+            "GET",
+            f"{BOX_API_BASE}/files/{file_id}/content",
+            headers={"Authorization": f"Bearer {token}"},
+            follow_redirects=True,
+            timeout=120.0,
+        ) as resp:
             if resp.status_code == 401:
                 raise RuntimeError("Box authentication failed. Try reconnecting.")
             if resp.status_code == 404:
                 raise RuntimeError(f"Box file not found: {file_id}")
             if resp.status_code != 200:
+                await resp.aread()
                 raise RuntimeError(
                     f"Box download failed ({resp.status_code}): {resp.text[:500]}"
                 )
 
-            local_path.write_bytes(resp.content)
+            # Stream into a temp file, hashing as we go, so a failed or corrupt
+            # transfer never replaces the previous copy
+            tmp_path = local_path.with_name(local_path.name + ".tmp")
+            sha1 = hashlib.sha1()
+            try:
+                with open(tmp_path, "wb") as f:
+                    async for chunk in resp.aiter_bytes(BOX_DOWNLOAD_CHUNK_SIZE):
+                        sha1.update(chunk)
+                        await asyncio.to_thread(f.write, chunk)
+                if expected_sha1 and sha1.hexdigest() != expected_sha1:
+                    raise RuntimeError(
+                        f"Box download checksum mismatch for {file_id}: "
+                        f"expected {expected_sha1}, got {sha1.hexdigest()}"
+                    )
+                os.replace(tmp_path, local_path)
+            except BaseException:
+                tmp_path.unlink(missing_ok=True)
+                raise
@@ -1,30 +1,177 @@
 """Confluence sync connector - Pages from Confluence Cloud and Server/Data Center."""
 
+import asyncio
 import base64
-import hashlib
-import json
 import logging
 import re
+import time
+from datetime import datetime, timezone
+from functools import lru_cache
+from html.parser import HTMLParser
 from pathlib import Path
 
 import httpx
 
-from .base import BaseSyncConnector, RemoteFile
+from .base import (
+    BaseSyncConnector,
+    RemoteFile,
+    read_json_sidecar,
+    sanitize_filename,
+    write_json_sidecar,
+)
 
 logger = logging.getLogger(__name__)
 
+CONFLUENCE_DOWNLOAD_CONCURRENCY = 8  # Max pages fetched in parallel during sync
+CONFLUENCE_BATCH_SIZE = 50  # Page IDs per CQL search when fetching changed pages
+CONFLUENCE_FULL_LIST_INTERVAL = 24 * 3600  # Seconds between full listings of a space
+# CQL dates are minute-resolution and in the user's timezone; re-query a day of
+# overlap so no change slips through the checkpoint.
+CONFLUENCE_CHANGE_OVERLAP = 24 * 3600
+
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
 
-def _sanitize_filename(name: str) -> str:
-    """Sanitize a string for use as a filename/path component."""
-    sanitized = re.sub(r'[<>:"/\\|?*]', "-", name)
-    sanitized = re.sub(r"\s+", "-", sanitized)
-    sanitized = re.sub(r"-{2,}", "-", sanitized)
-    return sanitized.strip("-")[:100]
+_BLANK_LINES_RE = re.compile(r"\n{3,}")
+_SPACES_RE = re.compile(r"[ \t]+")
+
+_PAGE_ID_RE = re.compile(r"^(\d+)-")
+
+_PAGE_EXPAND = "body.storage,version,space,history,metadata.labels,ancestors"
+_ATTACHMENT_EXPAND = "children.attachment.version"
+
+# Page bodies larger than this are converted in a worker thread
+_INLINE_RENDER_LIMIT = 4 * 1024
+
+# Elements rendered as prefix + converted content + suffix
+_WRAP_TAGS = {
+    **{f"h{i}": ("#" * i + " ", "\n") for i in range(1, 7)},
+    "strong": ("**", "**"),
+    "b": ("**", "**"),
+    "em": ("*", "*"),
+    "i": ("*", "*"),
+    "code": ("`", "`"),
+    "li": ("- ", "\n"),
+    "th": ("| ", " "),
+    "td": ("| ", " "),
+}
+# Elements that become a line break where they open and close
+_BREAK_TAGS = frozenset({"p", "ul", "ol", "table", "div"})
+# Confluence storage-format elements whose children are ordinary page content.
+# Every other ac:/ri: element (macro parameters, images, link bodies, ...) is
+# dropped together with its content.
+_TRANSPARENT_AC_TAGS = frozenset({
+    "ac:structured-macro",
+    "ac:rich-text-body",
+    "ac:layout",
+    "ac:layout-section",
+    "ac:layout-cell",
+    "ac:task-list",
+    "ac:task",
+    "ac:task-body",
+})
+
+
+class _StorageFormatConverter(HTMLParser):
+    """Single-pass converter from Confluence storage format to markdown."""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self._root: list[str] = []
+        # Open wrapping elements: (tag, prefix, suffix, converted content so far)
+        self._stack: list[tuple[str, str, str, list[str]]] = []
+        self._skip = 0  # Depth inside dropped ac:/ri: elements
+        self._code: list[str] | None = None  # Body of an open code macro
+        self._code_depth = 0
+        self._in_code_body = False
+
+    def _out(self) -> list[str]:
+        return self._stack[-1][3] if self._stack else self._root
+
+    def handle_starttag(self, tag, attrs):
+        if self._skip:
+            if tag.startswith(("ac:", "ri:")):
+                self._skip += 1
+            return
+        if self._code is not None:
+            if tag == "ac:structured-macro":
+                self._code_depth += 1
+            elif tag == "ac:plain-text-body":
+                self._in_code_body = True
+            return
+
+        if tag.startswith(("ac:", "ri:")):
+            if tag == "ac:structured-macro" and dict(attrs).get("ac:name") == "code":
+                self._code = []
+                self._code_depth = 1
+            elif tag not in _TRANSPARENT_AC_TAGS:
+                self._skip = 1
+        elif tag in _WRAP_TAGS:
+            prefix, suffix = _WRAP_TAGS[tag]
+            self._stack.append((tag, prefix, suffix, []))
+        elif tag == "a":
+            href = dict(attrs).get("href")
+            if href is None:
+                self._stack.append((tag, "", "", []))
+            else:
+                self._stack.append((tag, "[", f"]({href})", []))
+        elif tag == "br" or tag in _BREAK_TAGS:
+            self._out().append("\n")
+
+    def handle_endtag(self, tag):
+        if self._skip:
+            if tag.startswith(("ac:", "ri:")):
+                self._skip -= 1
+            return
+        if self._code is not None:
+            if tag == "ac:plain-text-body":
+                self._in_code_body = False
+            elif tag == "ac:structured-macro":
+                self._code_depth -= 1
+                if not self._code_depth:
+                    code = "".join(self._code)
+                    self._code = None
+                    self._out().append(f"```\n{code}\n```\n")
+            return
+
+        if tag in _BREAK_TAGS:
+            self._out().append("\n")
+        elif tag == "tr":
+            self._out().append(" |\n")
+        elif tag in _WRAP_TAGS or tag == "a":
+            if not any(frame[0] == tag for frame in self._stack):
+                return  # Stray closing tag
+            # Elements left open inside this one keep their content unwrapped
+            while True:
+                open_tag, prefix, suffix, parts = self._stack.pop()
+                if open_tag == tag:
+                    self._out().append(prefix + "".join(parts) + suffix)
+                    break
+                self._out().extend(parts)
+
+    def handle_data(self, data):
+        if self._skip:
+            return
+        if self._code is not None:
+            if self._in_code_body:
+                self._code.append(data)
+            return
+        self._out().append(data.replace("\xa0", " "))
+
+    def unknown_decl(self, data):
+        # CDATA sections only carry content inside a code macro body
+        if self._code is not None and self._in_code_body and data.startswith("CDATA["):
+            self._code.append(data[6:])
+
+    def markdown(self) -> str:
+        self.close()
+        while self._stack:
+            parts = self._stack.pop()[3]
+            self._out().extend(parts)
+        return "".join(self._root)
 
 
 def _html_to_markdown(html: str) -> str:
@@ -32,70 +179,13 @@ def _html_to_markdown(html: str) -> str:
     if not html:
         return ""
 
-    text = html
-
-    # Headers
-    for i in range(6, 0, -1):
-        text = re.sub(rf"<h{i}[^>]*>(.*?)</h{i}>", rf"{'#' * i} \1\n", text, flags=re.DOTALL)
-
-    # Line breaks and paragraphs
-    text = re.sub(r"<br\s*/?>", "\n", text)
-    text = re.sub(r"</?p[^>]*>", "\n", text)
-
-    # Bold and italic
-    text = re.sub(r"<strong[^>]*>(.*?)</strong>", r"**\1**", text, flags=re.DOTALL)
-    text = re.sub(r"<b[^>]*>(.*?)</b>", r"**\1**", text, flags=re.DOTALL)
-    text = re.sub(r"<em[^>]*>(.*?)</em>", r"*\1*", text, flags=re.DOTALL)
-    text = re.sub(r"<i[^>]*>(.*?)</i>", r"*\1*", text, flags=re.DOTALL)
-
-    # Links
-    text = re.sub(r'<a[^>]+href="([^"]*)"[^>]*>(.*?)</a>', r"[\2](\1)", text, flags=re.DOTALL)
-
-    # Lists
-    text = re.sub(r"<li[^>]*>(.*?)</li>", r"- \1\n", text, flags=re.DOTALL)
-    text = re.sub(r"</?[ou]l[^>]*>", "\n", text)
-
-    # Code blocks (Confluence uses ac:structured-macro for code)
-    text = re.sub(
-        r'<ac:structured-macro[^>]*ac:name="code"[^>]*>.*?<ac:plain-text-body><!\[CDATA\[(.*?)\]\]></ac:plain-text-body>.*?</ac:structured-macro>',
-        r"```\n\1\n```\n",
-        text,
-        flags=re.DOTALL
-    )
-
-    # Inline code
-    text = re.sub(r"<code[^>]*>(.*?)</code>", r"`\1`", text, flags=re.DOTALL)
-
-    # Tables - simplified conversion
-    text = re.sub(r"<table[^>]*>", "\n", text)
-    text = re.sub(r"</table>", "\n", text)
-    text = re.sub(r"<tr[^>]*>", "", text)
-    text = re.sub(r"</tr>", " |\n", text)
-    text = re.sub(r"<t[hd][^>]*>(.*?)</t[hd]>", r"| \1 ", text, flags=re.DOTALL)
-
-    # Divs and spans
-    text = re.sub(r"</?div[^>]*>", "\n", text)
-    text = re.sub(r"</?span[^>]*>", "", text)
-
-    # Confluence macros - extract content or remove
-    text = re.sub(r"<ac:structured-macro[^>]*>.*?</ac:structured-macro>", "", text, flags=re.DOTALL)
-    text = re.sub(r"<ac:[^>]+/>", "", text)
-    text = re.sub(r"<ac:[^>]+>.*?</ac:[^>]+>", "", text, flags=re.DOTALL)
-    text = re.sub(r"<ri:[^>]+/>", "", text)
-
-    # Strip remaining tags
-    text = re.sub(r"<[^>]+>", "", text)
+    converter = _StorageFormatConverter()
+    converter.feed(html)
+    text = converter.markdown()
 
     # Clean up whitespace
-    text = re.sub(r"\n{3,}", "\n\n", text)
-    text = re.sub(r"[ \t]+", " ", text)
-
-    # Decode HTML entities
-    text = text.replace("&nbsp;", " ")
-    text = text.replace("&amp;", "&")
-    text = text.replace("&lt;", "<")
-    text = text.replace("&gt;", ">")
-    text = text.replace("&quot;", '"')
+    text = _BLANK_LINES_RE.sub("\n\n", text)
+    text = _SPACES_RE.sub(" ", text)
 
     return text.strip()
 
@@ -168,6 +258,22 @@ def _render_page_md(page: dict, attachments: list) -> str:
 # ---------------------------------------------------------------------------
 
 
+@lru_cache(maxsize=16)
+def _auth_headers(token: str, email: str | None = None) -> dict:
+    """Auth headers for a credential pair: Basic with an email (Cloud), else Bearer.
+
+    Cached so every request made with the same credentials shares one dict;
+    callers must not mutate it.
+    """
+    if email is not None:
+        b64 = base64.b64encode(f"{email}:{token}".encode()).decode()
+        authorization = f"Basic {b64}"
+    else:
+        authorization = f"Bearer {token}"
+    retval = {"Authorization": authorization, "Content-Type": "application/json"}
+    return retval
+
+
 async def list_spaces(source) -> list[dict]:
     """List Confluence spaces accessible with the stored credentials.
 
@@ -178,12 +284,10 @@ async def list_spaces(source) -> list[dict]:
     if is_cloud:
         if not source.confluence_email:
             raise RuntimeError("Confluence Cloud requires an email address")
-        credentials = f"{source.confluence_email}:{source.confluence_token}"
-        b64 = base64.b64encode(credentials.encode()).decode()
-        headers = {"Authorization": f"Basic {b64}", "Content-Type": "application/json"}
+        headers = _auth_headers(source.confluence_token, source.confluence_email)
         api_base = f"{source.confluence_url}/wiki/rest/api"
     else:
-        headers = {"Authorization": f"Bearer {source.confluence_token}", "Content-Type": "application/json"}
+        headers = _auth_headers(source.confluence_token)
         api_base = f"{source.confluence_url}/rest/api"
 
     spaces = []
@@ -216,6 +320,24 @@ async def list_spaces(source) -> list[dict]:
 # ---------------------------------------------------------------------------
 
 
+def _slim_page(page: dict) -> dict:
+    """Keep only the listing fields needed to rebuild a page's RemoteFile."""
+    retval = {
+        "id": page["id"],
+        "title": page.get("title", ""),
+        "ancestors": [
+            {"id": a.get("id"), "title": a.get("title", "")}
+            for a in page.get("ancestors", [])
+        ],
+        "version": {
+            "number": page.get("version", {}).get("number", 1),
+            "when": page.get("version", {}).get("when", ""),
+        },
+        "history": {"createdDate": page.get("history", {}).get("createdDate", "")},
+    }
+    return retval
+
+
 class ConfluenceConnector(BaseSyncConnector):
 
     def _is_cloud(self, source) -> bool:
@@ -224,19 +346,8 @@ class ConfluenceConnector(BaseSyncConnector):
 
     def _headers(self, source) -> dict:
         """Build auth headers - Basic for Cloud, Bearer for Server/DC."""
-        if self._is_cloud(source):
-            credentials = f"{source.confluence_email}:{source.confluence_token}"
-            b64 = base64.b64encode(credentials.encode()).decode()
-            retval = {
-                "Authorization": f"Basic {b64}",
-                "Content-Type": "application/json",
-            }
-        else:
-            retval = {
-                "Authorization": f"Bearer {source.confluence_token}",
-                "Content-Type": "application/json",
-            }
-        return retval
+        email = source.confluence_email if self._is_cloud(source) else None
+        return _auth_headers(source.confluence_token, email)
 
     def _api_base(self, source) -> str:
         # Cloud uses /wiki/rest/api, Server uses /rest/api
@@ -283,22 +394,103 @@ class ConfluenceConnector(BaseSyncConnector):
 
         return pages
 
-    def _build_page_path(self, page: dict, page_map: dict[str, dict]) -> str:
-        """Build hierarchical path for a page based on ancestors."""
-        ancestors = page.get("ancestors", [])
-        path_parts = []
+    async def _get_changed_pages_in_space(
+        self, client, headers, base_url, space_key, known: dict[str, dict], since: float,
+    ) -> list[dict]:
+        """Rebuild a space's page list from the previous listing plus changes.
+
+        A light listing (IDs and titles only) finds deleted pages and renamed
+        ancestors; a CQL search fetches pages modified since ``since`` with the
+        full expansion. Falls back to a full listing if a page can't be placed.
+        """
+        titles: dict[str, str] = {}
+        start = 0
+        limit = 200
+        while True:
+            resp = await client.get(
+                f"{base_url}/content",
+                params={"spaceKey": space_key, "type": "page", "start": start, "limit": limit},
+                headers=headers,
+            )
+            if resp.status_code == 401:
+                raise RuntimeError("Confluence authentication failed. Check your token.")
+            if resp.status_code != 200:
+                raise RuntimeError(
+                    f"Confluence API failed ({resp.status_code}): {resp.text[:500]}"
+                )
+            results = resp.json().get("results", [])
+            titles.update((p["id"], p.get("title", "")) for p in results)
+            if len(results) < limit:
+                break
+            start += limit
 
-        for ancestor in ancestors:
-            ancestor_title = ancestor.get("title", "")
-            if ancestor_title:
-                path_parts.append(_sanitize_filename(ancestor_title))
+        checkpoint = datetime.fromtimestamp(since - CONFLUENCE_CHANGE_OVERLAP, timezone.utc)
+        cql = (
+            f'space="{space_key}" AND type=page '
+            f'AND lastModified >= "{checkpoint:%Y-%m-%d %H:%M}"'
+        )
+        changed: list[dict] = []
+        url = f"{base_url}/content/search"
+        params: dict | None = {"cql": cql, "limit": 50, "expand": "ancestors,version,history"}
+        while url:
+            resp = await client.get(url, params=params, headers=headers)
+            if resp.status_code != 200:
+                logger.warning(
+                    "Confluence change search failed for %s (%d), listing all pages",
+                    space_key, resp.status_code,
+                )
+                return await self._get_all_pages_in_space(client, headers, base_url, space_key)
+            data = resp.json()
+            changed.extend(data.get("results", []))
+            links = data.get("_links", {})
+            # The next link already carries the query and cursor
+            url = f"{links['base']}{links['next']}" if links.get("next") and links.get("base") else None
+            params = None
+
+        pages = {pid: known[pid] for pid in titles if pid in known}
+        pages.update((p["id"], p) for p in changed if p["id"] in titles)
+        if len(pages) < len(titles):
+            # A page we never listed that isn't in the change set; don't guess
+            return await self._get_all_pages_in_space(client, headers, base_url, space_key)
+
+        # Titles come from the fresh listing so ancestor renames reach descendants
+        for page in pages.values():
+            page["title"] = titles[page["id"]]
+            for ancestor in page.get("ancestors", []):
+                ancestor["title"] = titles.get(ancestor.get("id"), ancestor.get("title", ""))
+
+        logger.info(
+            "Confluence space %s: %d changed page(s) since last sync",
+            space_key, len(changed),
+        )
+        return list(pages.values())
+
+    def _build_page_path(
+        self, page: dict, sanitized_by_id: dict[str, str], prefix_by_parent: dict[str, str],
+    ) -> str:
+        """Build hierarchical path for a page based on ancestors.
+
+        Sanitized titles and the joined ancestor prefix are memoized, so
+        siblings share the work of their common parent path.
+        """
+        ancestors = page.get("ancestors", [])
+        parent_id = ancestors[-1].get("id") if ancestors else None
+
+        prefix = prefix_by_parent.get(parent_id) if parent_id else ""
+        if prefix is None:
+            path_parts = []
+            for ancestor in ancestors:
+                part = sanitized_by_id.get(ancestor.get("id"))
+                if part is None:
+                    part = sanitize_filename(ancestor.get("title", ""))
+                if part:
+                    path_parts.append(part)
+            prefix = "".join(f"{part}/" for part in path_parts)
+            prefix_by_parent[parent_id] = prefix
 
         # Add current page with ID prefix for reliable lookup
-        title = page.get("title", f"Page-{page['id']}")
         page_id = page["id"]
-        path_parts.append(f"{page_id}-{_sanitize_filename(title)}")
-
-        return "/".join(path_parts) + ".md"
+        return f"{prefix}{page_id}-{sanitized_by_id[page_id]}.md"
 
     # ---- list_files -------------------------------------------------------
 
@@ -318,7 +510,12 @@ class ConfluenceConnector(BaseSyncConnector):
         retval = [space_val]
         return retval
 
-    async def list_files(self, source) -> list[RemoteFile]:
+    async def list_files(self, source, state: dict | None = None) -> list[RemoteFile]:
+        """List every page in the configured space(s).
+
+        When ``state`` is given it is read as the listing state saved by the
+        previous sync and updated in place for the next one.
+        """
         if not source.confluence_token:
             raise RuntimeError("Confluence token not configured")
         if not source.confluence_space:
@@ -332,45 +529,81 @@ class ConfluenceConnector(BaseSyncConnector):
         headers = self._headers(source)
         base = self._api_base(source)
 
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            for space_key in space_keys:
+        # With a listing state from a previous sync, only pages modified since
+        # then are fetched in full; see _get_changed_pages_in_space.
+        incremental = False
+        known_spaces: dict[str, dict] = {}
+        if state is not None:
+            now = time.time()
+            scope = f"{source.confluence_url}|{','.join(space_keys)}"
+            full_at = state.get("full_at", 0)
+            # Periodically relist everything to pick up moves that don't bump a version
+            incremental = (
+                state.get("scope") == scope
+                and now - full_at < CONFLUENCE_FULL_LIST_INTERVAL
+            )
+            if incremental:
+                known_spaces = state.get("spaces", {})
+            since = state.get("listed_at", 0)
+            state.clear()
+            state.update(
+                scope=scope,
+                listed_at=now,
+                full_at=full_at if incremental else now,
+                spaces={},
+            )
+
+        client = await self._get_client()
+        for space_key in space_keys:
+            if incremental and space_key in known_spaces:
+                pages = await self._get_changed_pages_in_space(
+                    client, headers, base, space_key, known_spaces[space_key], since
+                )
+            else:
                 pages = await self._get_all_pages_in_space(
                     client, headers, base, space_key
                 )
+            if state is not None:
+                state["spaces"][space_key] = {p["id"]: _slim_page(p) for p in pages}
 
-                # Build map for path resolution
-                page_map = {p["id"]: p for p in pages}
+            # Sanitize every title once; ancestors are usually pages in the same space
+            sanitized_by_id = {
+                p["id"]: sanitize_filename(p.get("title", f"Page-{p['id']}"))
+                for p in pages
+            }
+            prefix_by_parent: dict[str, str] = {}
 
-                # Prefix with space key when syncing multiple spaces
-                prefix = f"{space_key}/" if len(space_keys) > 1 else ""
+            # Prefix with space key when syncing multiple spaces
+            prefix = f"{space_key}/" if len(space_keys) > 1 else ""
 
-                for page in pages:
-                    page_id = page["id"]
-                    version = page.get("version", {}).get("number", 1)
-                    updated = page.get("version", {}).get("when", "")
+            for page in pages:
+                page_id = page["id"]
+                version = page.get("version", {}).get("number", 1)
+                updated = page.get("version", {}).get("when", "")
 
-                    remote_path = f"pages/{prefix}{self._build_page_path(page, page_map)}"
+                remote_path = f"pages/{prefix}{self._build_page_path(page, sanitized_by_id, prefix_by_parent)}"
 
-                    # Use version number as content hash for change detection
-                    content_hash = hashlib.sha256(f"{version}:{updated}".encode()).hexdigest()
+                # Version number and timestamp identify a revision; compared verbatim
+                content_hash = f"v{version}:{updated}"
 
-                    created_date = page.get("history", {}).get("createdDate", "")
+                created_date = page.get("history", {}).get("createdDate", "")
 
-                    files.append(
-                        RemoteFile(
-                            remote_path=remote_path,
-                            size=0,
-                            modified_at=updated,
-                            content_hash=content_hash,
-                            created_at=created_date,
-                        )
+                files.append(
+                    RemoteFile(
+                        remote_path=remote_path,
+                        size=0,
+                        modified_at=updated,
+                        content_hash=content_hash,
+                        created_at=created_date,
+                        source_id=page_id,
                     )
-
-                logger.info(
-                    "Listed %d pages from Confluence space %s",
-                    len(files), space_key
                 )
 
+            logger.info(
+                "Listed %d pages from Confluence space %s",
+                len(files), space_key
+            )
+
         logger.info("Listed %d total pages from %d Confluence space(s)", len(files), len(space_keys))
         return files
 
@@ -382,36 +615,80 @@ class ConfluenceConnector(BaseSyncConnector):
 
         # Extract page ID from path: pages/.../1553249817-Title.md
         stem = Path(remote_path).stem  # e.g. "1553249817-DQ-Dashboard-WIP"
-        m = re.match(r"^(\d+)-", stem)
+        m = _PAGE_ID_RE.match(stem)
         if not m:
             raise RuntimeError(f"Cannot parse page ID from path: {remote_path}")
-        page_id = m.group(1)
+        await self._download_page(source, m.group(1), local_path)
+
+    async def _download_remote_file(self, source, rf: RemoteFile, local_path: Path) -> None:
+        if rf.source_id:
+            await self._download_page(source, rf.source_id, local_path)
+        else:
+            await self.download_file(source, rf.remote_path, local_path)
 
+    async def _download_page(self, source, page_id: str, local_path: Path) -> None:
         headers = self._headers(source)
         base = self._api_base(source)
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            # Fetch page directly by ID
+        client = await self._get_client()
+        # Fetch page directly by ID, with its attachments folded into the same call
+        resp = await client.get(
+            f"{base}/content/{page_id}",
+            params={"expand": f"{_PAGE_EXPAND},{_ATTACHMENT_EXPAND}"},
+            headers=headers,
+        )
+        if resp.status_code == 400:
+            # Older Server/DC releases reject the child expansion
             resp = await client.get(
                 f"{base}/content/{page_id}",
-                params={
-                    "expand": "body.storage,version,space,history,metadata.labels,ancestors",
-                },
+                params={"expand": _PAGE_EXPAND},
                 headers=headers,
             )
 
-            if resp.status_code == 401:
-                raise RuntimeError("Confluence authentication failed. Check your token.")
-            if resp.status_code == 404:
-                raise RuntimeError(f"Page not found: {page_id}")
-            if resp.status_code != 200:
-                raise RuntimeError(
-                    f"Failed to fetch page {page_id}: {resp.text[:300]}"
-                )
+        if resp.status_code == 401:
+            raise RuntimeError("Confluence authentication failed. Check your token.")
+        if resp.status_code == 404:
+            raise RuntimeError(f"Page not found: {page_id}")
+        if resp.status_code != 200:
+            raise RuntimeError(
+                f"Failed to fetch page {page_id}: {resp.text[:300]}"
+            )
 
-            page = resp.json()
+        page = resp.json()
+        await self._write_page(client, headers, base, source, page, local_path)
+
+    async def _fetch_pages_batch(
+        self, client: httpx.AsyncClient, headers: dict, base: str, page_ids: list[str],
+    ) -> dict[str, dict]:
+        """Fetch several pages with bodies and attachments in one CQL search."""
+        resp = await client.get(
+            f"{base}/content/search",
+            params={
+                "cql": f"id in ({','.join(page_ids)})",
+                "expand": f"{_PAGE_EXPAND},{_ATTACHMENT_EXPAND}",
+                "limit": len(page_ids),
+            },
+            headers=headers,
+        )
+        if resp.status_code == 401:
+            raise RuntimeError("Confluence authentication failed. Check your token.")
+        if resp.status_code != 200:
+            raise RuntimeError(
+                f"Confluence page search failed ({resp.status_code}): {resp.text[:300]}"
+            )
+        retval = {p["id"]: p for p in resp.json().get("results", [])}
+        return retval
 
-            # Get attachments
+    async def _write_page(
+        self, client: httpx.AsyncClient, headers: dict, base: str, source, page: dict,
+        local_path: Path,
+    ) -> None:
+        """Render a fetched page to markdown, fetching attachments if not expanded."""
+        expanded = page.get("children", {}).get("attachment")
+        if expanded is not None and "next" not in expanded.get("_links", {}):
+            attachments = expanded.get("results", [])
+        else:
+            # Not expanded, or more attachments than fit in the expansion
             page_id = page["id"]
             resp = await client.get(
                 f"{base}/content/{page_id}/child/attachment",
@@ -423,11 +700,17 @@ class ConfluenceConnector(BaseSyncConnector):
             if resp.status_code == 200:
                 attachments = resp.json().get("results", [])
 
-            # Add base URL for attachment links
-            page["_base_url"] = source.confluence_url
+        # Add base URL for attachment links
+        page["_base_url"] = source.confluence_url
 
-        md = _render_page_md(page, attachments)
-        local_path.write_text(md, encoding="utf-8")
+        body = page.get("body", {}).get("storage", {}).get("value", "")
+        if len(body) > _INLINE_RENDER_LIMIT:
+            # Convert large pages off the event loop so concurrent downloads keep flowing
+            md = await asyncio.to_thread(_render_page_md, page, attachments)
+            await asyncio.to_thread(local_path.write_text, md, encoding="utf-8")
+        else:
+            md = _render_page_md(page, attachments)
+            local_path.write_text(md, encoding="utf-8")
 
     # ---- sync override (version-based change tracking) -------------------
 
@@ -438,56 +721,75 @@ class ConfluenceConnector(BaseSyncConnector):
         local_root.mkdir(parents=True, exist_ok=True)
 
         hash_file = local_root / ".confluence_revisions.json"
-        old_revisions: dict[str, str] = {}
-        if hash_file.exists():
-            try:
-                old_revisions = json.loads(hash_file.read_text())
-            except Exception:
-                pass
-
-        remote_files = await self.list_files(source)
-        remote_paths: set[str] = set()
+        old_revisions: dict[str, str] = read_json_sidecar(hash_file)
+
+        state_file = local_root / ".confluence_list_state.json"
+        list_state = read_json_sidecar(state_file)
+        remote_files = await self.list_files(source, list_state)
+        remote_paths = frozenset(rf.remote_path for rf in remote_files)
         new_revisions: dict[str, str] = {}
         stats = {"downloaded": 0, "deleted": 0, "skipped": 0, "errors": 0}
 
+        to_download: list[RemoteFile] = []
         for rf in remote_files:
-            remote_paths.add(rf.remote_path)
             new_revisions[rf.remote_path] = rf.content_hash or ""
             local_file = local_root / rf.remote_path
 
             if local_file.exists() and old_revisions.get(rf.remote_path) == rf.content_hash:
                 stats["skipped"] += 1
                 continue
+            to_download.append(rf)
+
+        sem = asyncio.Semaphore(CONFLUENCE_DOWNLOAD_CONCURRENCY)
+        headers = self._headers(source)
+        base = self._api_base(source)
+        client = await self._get_client()
+
+        # Fetch changed pages in CQL batches; anything a batch misses falls
+        # back to a per-page GET below.
+        prefetched: dict[str, dict] = {}
+
+        async def _fetch_batch(page_ids: list[str]) -> None:
+            async with sem:
+                try:
+                    prefetched.update(
+                        await self._fetch_pages_batch(client, headers, base, page_ids)
+                    )
+                except Exception as e:
+                    logger.warning("Confluence batch fetch failed, fetching pages one by one: %s", e)
+
+        ids = [rf.source_id for rf in to_download if rf.source_id]
+        await asyncio.gather(*(
+            _fetch_batch(ids[i:i + CONFLUENCE_BATCH_SIZE])
+            for i in range(0, len(ids), CONFLUENCE_BATCH_SIZE)
+        ))
 
-            local_file.parent.mkdir(parents=True, exist_ok=True)
-            try:
-                await self.download_file(source, rf.remote_path, local_file)
-                stats["downloaded"] += 1
-                logger.info("Downloaded: %s", rf.remote_path)
-            except Exception as e:
-                logger.error("Failed to download %s: %s", rf.remote_path, e)
-                stats["errors"] += 1
-
-        # Mirror-delete
-        for local_file in local_root.rglob("*"):
-            if local_file.is_file() and not local_file.name.startswith("."):
-                rel = str(local_file.relative_to(local_root))
-                if rel not in remote_paths:
-                    try:
-                        local_file.unlink()
-                        stats["deleted"] += 1
-                        logger.info("Deleted (not on remote): %s", rel)
-                    except Exception as e:
-                        logger.error("Failed to delete %s: %s", rel, e)
-                        stats["errors"] += 1
-
-        # Clean up empty directories
-        for dirpath in sorted(local_root.rglob("*"), reverse=True):
-            if dirpath.is_dir() and not any(dirpath.iterdir()):
+        async def _download_one(rf: RemoteFile) -> bool:
+            local_file = local_root / rf.remote_path
+            page = prefetched.pop(rf.source_id, None) if rf.source_id else None
+            async with sem:
                 try:
-                    dirpath.rmdir()
-                except Exception:
-                    pass
+                    local_file.parent.mkdir(parents=True, exist_ok=True)
+                    if page is not None:
+                        await self._write_page(client, headers, base, source, page, local_file)
+                    else:
+                        await self._download_remote_file(source, rf, local_file)
+                    return True
+                except Exception as e:
+                    logger.error("Failed to download %s: %s", rf.remote_path, e)
+                    return False
+
+        results = await asyncio.gather(*(_download_one(rf) for rf in to_download))
+        stats["downloaded"] = sum(results)
+        stats["errors"] += len(results) - stats["downloaded"]
+        if to_download:
+            logger.info(
+                "Downloaded %d/%d changed Confluence pages",
+                stats["downloaded"], len(to_download),
+            )
+
+        # Mirror-delete and clean up empty directories
+        self._mirror_delete(local_root, remote_paths, stats)
 
         # Write timestamps sidecar for the indexing pipeline
         timestamps = {}
@@ -499,8 +801,10 @@ class ConfluenceConnector(BaseSyncConnector):
                 entry["created_at"] = rf.created_at
             if entry:
                 timestamps[rf.remote_path] = entry
-        (local_root / ".voitta_timestamps.json").write_text(json.dumps(timestamps))
+        write_json_sidecar(local_root / ".voitta_timestamps.json", timestamps)
 
-        hash_file.write_text(json.dumps(new_revisions), encoding="utf-8")
+        if new_revisions != old_revisions:
+            write_json_sidecar(hash_file, new_revisions)
+        write_json_sidecar(state_file, list_state)
         logger.info("Sync complete for %s: %s", folder_path, stats)
         return stats
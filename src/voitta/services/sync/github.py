@@ -1,6 +1,8 @@
 """Git sync connector using git clone/pull."""
 
 import asyncio
+import atexit
+import errno
 import hashlib
 import json
 import logging
@@ -9,15 +11,44 @@ import re
 import shutil
 import stat
 import tempfile
+import time
+from dataclasses import dataclass, field
 from pathlib import Path
 from urllib.parse import urlparse, urlunparse
 
 import httpx
 
-from .base import BaseSyncConnector, RemoteFile
+try:
+    import orjson  # Optional: faster canonical JSON for metadata fingerprints
+except ImportError:
+    orjson = None
+
+try:
+    import xxhash  # Optional: non-cryptographic digest for metadata fingerprints
+except ImportError:
+    xxhash = None
+
+from .base import (
+    BaseSyncConnector,
+    RemoteFile,
+    read_json_sidecar,
+    sanitize_filename,
+    write_json_sidecar,
+)
 
 logger = logging.getLogger(__name__)
 
+GIT_BRANCH_CONCURRENCY = 4  # Max branches cloned/pulled at once in all-branches mode
+GIT_MIRROR_WORKERS = 8  # Threads linking/copying changed files into the mirror
+GH_API_CONCURRENCY = 16  # Max in-flight GitHub API requests during metadata sync
+GH_GRAPHQL_RUN_BATCH = 50  # Workflow runs whose jobs are fetched per GraphQL query
+GH_RATE_LIMIT_LOW = 10  # Pause all API calls when this few requests remain
+GH_RATE_LIMIT_MAX_WAIT = 60.0  # Cap on any single rate-limit sleep, seconds
+LS_REMOTE_CACHE_TTL = 60.0  # Seconds a `git ls-remote --heads` result is reused
+
+# (repo_url, ssh_key, token, username) -> (monotonic timestamp, branches)
+_ls_remote_cache: dict[tuple[str, str, str, str], tuple[float, list[str]]] = {}
+
 
 def _ssh_url_to_https(url: str) -> str:
     """Convert git SSH URL to HTTPS.
@@ -53,6 +84,27 @@ def _inject_token_into_url(repo_url: str, username: str, token: str) -> str:
     return retval
 
 
+_askpass_path: str | None = None
+
+
+def _askpass_script() -> str:
+    """Path of this process's GIT_ASKPASS helper, creating it on first use.
+
+    The script prints the token from the environment, so one file serves
+    every git call and the secret is never written to disk.
+    """
+    global _askpass_path
+    if _askpass_path is None or not os.path.exists(_askpass_path):
+        script_dir = tempfile.mkdtemp(prefix="voitta-askpass-")
+        path = os.path.join(script_dir, "askpass.sh")
+        with open(path, "w") as f:
+            f.write('#!/bin/sh\nprintf \'%s\\n\' "$VOITTA_GIT_TOKEN"\n')
+        os.chmod(path, stat.S_IRWXU)
+        atexit.register(shutil.rmtree, script_dir, True)
+        _askpass_path = path
+    return _askpass_path
+
+
 async def _run_git_cmd(
     args: list[str],
     cwd: str | None = None,
@@ -64,19 +116,13 @@ async def _run_git_cmd(
     """Run a git command asynchronously with optional SSH key or HTTPS token."""
     env = {**os.environ, "GIT_TERMINAL_PROMPT": "0"}
     key_file = None
-    askpass_file = None
 
     try:
         if token and token.strip():
             # HTTPS token auth via GIT_ASKPASS
             user = (username or "x-access-token").strip()
-            askpass_file = tempfile.NamedTemporaryFile(
-                mode="w", suffix=".sh", delete=False
-            )
-            askpass_file.write(f"#!/bin/sh\necho '{token.strip()}'\n")
-            askpass_file.close()
-            os.chmod(askpass_file.name, stat.S_IRWXU)
-            env["GIT_ASKPASS"] = askpass_file.name
+            env["GIT_ASKPASS"] = _askpass_script()
+            env["VOITTA_GIT_TOKEN"] = token.strip()
             # Convert SSH URLs to HTTPS so token auth works
             args = list(args)
             for i, arg in enumerate(args):
@@ -124,11 +170,10 @@ async def _run_git_cmd(
                 os.unlink(key_file.name)
             except OSError:
                 pass
-        if askpass_file:
-            try:
-                os.unlink(askpass_file.name)
-            except OSError:
-                pass
+
+
+# One "<sha>\trefs/heads/<branch>" line per branch (SHA-1 or SHA-256 repos)
+_LS_REMOTE_HEADS_RE = re.compile(r"^[0-9a-f]{40,64}\trefs/heads/(.+)$", re.M)
 
 
 async def list_remote_branches(
@@ -136,8 +181,19 @@ async def list_remote_branches(
     ssh_key: str = "",
     token: str = "",
     username: str = "",
+    cache_ttl: float = LS_REMOTE_CACHE_TTL,
 ) -> list[str]:
-    """List branches of a remote git repo via `git ls-remote --heads`."""
+    """List branches of a remote git repo via `git ls-remote --heads`.
+
+    Results are cached in memory per URL and credentials for ``cache_ttl``
+    seconds, so the branch picker and a sync started right after it (or a
+    quick retry) don't each pay a network round-trip.
+    """
+    cache_key = (repo_url, ssh_key, token, username)
+    cached = _ls_remote_cache.get(cache_key)
+    if cached and time.monotonic() - cached[0] < cache_ttl:
+        return list(cached[1])
+
     rc, stdout, stderr = await _run_git_cmd(
         ["ls-remote", "--heads", repo_url],
         ssh_key=ssh_key or None,
@@ -148,12 +204,7 @@ async def list_remote_branches(
     if rc != 0:
         raise RuntimeError(f"git ls-remote failed: {stderr.strip()}")
 
-    branches = []
-    for line in stdout.strip().splitlines():
-        # Format: "<sha>\trefs/heads/<branch>"
-        parts = line.split("\t", 1)
-        if len(parts) == 2 and parts[1].startswith("refs/heads/"):
-            branches.append(parts[1][len("refs/heads/"):])
+    branches = _LS_REMOTE_HEADS_RE.findall(stdout)
 
     # Sort with main/master first, then alphabetical
     def sort_key(b: str) -> tuple[int, str]:
@@ -164,28 +215,112 @@ async def list_remote_branches(
         return (2, b)
 
     branches.sort(key=sort_key)
-    return branches
+    _ls_remote_cache[cache_key] = (time.monotonic(), branches)
+    return list(branches)
+
+
+def _write_if_changed(path: Path, data: bytes) -> bool:
+    """Write rendered markdown with raw fd writes unless the file already matches.
+
+    Metadata is re-rendered whenever ``updated_at`` moves, which often leaves
+    the markdown identical; skipping those writes keeps mtimes (and the
+    indexer) quiet. Returns True when the file was written.
+    """
+    try:
+        if path.stat().st_size == len(data) and path.read_bytes() == data:
+            return False
+    except OSError:
+        pass
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+    return True
+
+
+async def _write_gh_markdown(local_file: Path, md: str, stats: dict) -> None:
+    """Write one rendered metadata document off the event loop, updating stats."""
+    local_file.parent.mkdir(parents=True, exist_ok=True)
+    if await asyncio.to_thread(_write_if_changed, local_file, md.encode()):
+        stats["downloaded"] += 1
+    else:
+        stats["skipped"] += 1
+
+
+def _fast_copy(src: Path, dst: Path) -> None:
+    """Copy file contents in-kernel with copy_file_range where supported.
+
+    copy_file_range can reflink on CoW filesystems and never bounces the data
+    through userspace. Before any bytes are copied, an unsupported or
+    cross-device range copy falls back to shutil.copyfile (sendfile on Linux).
+    """
+    if hasattr(os, "copy_file_range"):
+        with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+            copied = 0
+            try:
+                while n := os.copy_file_range(fsrc.fileno(), fdst.fileno(), 1 << 30):
+                    copied += n
+                return
+            except OSError as e:
+                if copied or e.errno not in (
+                    errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP,
+                ):
+                    raise
+    shutil.copyfile(src, dst)
+
+
+def _materialize(src: Path, dst: Path) -> None:
+    """Mirror src to dst as a hardlink, copying when a link isn't possible.
+
+    git replaces files on checkout rather than rewriting them in place, so a
+    link never sees a later change to the repo copy.
+    """
+    dst.unlink(missing_ok=True)
+    try:
+        os.link(src, dst)
+    except OSError as e:
+        if e.errno not in (errno.EXDEV, errno.EPERM, errno.EMLINK, errno.ENOTSUP):
+            raise
+        _fast_copy(src, dst)
+        shutil.copystat(src, dst)
+
+
+def _read_head_sha(repo_dir: Path) -> str | None:
+    """Read the commit SHA checked out in repo_dir without spawning git."""
+    git_dir = repo_dir / ".git"
+    try:
+        head = (git_dir / "HEAD").read_text().strip()
+        if not head.startswith("ref: "):
+            return head  # Detached HEAD
+        ref = head[len("ref: "):]
+        try:
+            return (git_dir / ref).read_text().strip()
+        except FileNotFoundError:
+            pass
+        # Ref may only exist in packed-refs: "<sha> <ref>" per line
+        for line in (git_dir / "packed-refs").read_text().splitlines():
+            sha, _, name = line.partition(" ")
+            if name == ref:
+                return sha
+    except OSError:
+        pass
+    return None
 
 
 # ---------------------------------------------------------------------------
 # GitHub API helpers (issues, PRs, actions)
 # ---------------------------------------------------------------------------
 
-_GH_SANITIZE_RE = re.compile(r'[<>:"/\\|?*]')
-
-
-def _sanitize_gh_filename(name: str) -> str:
-    """Sanitize a string for use as a filename component."""
-    sanitized = _GH_SANITIZE_RE.sub("-", name)
-    sanitized = re.sub(r"\s+", "-", sanitized)
-    sanitized = re.sub(r"-{2,}", "-", sanitized)
-    return sanitized.strip("-")[:80]
+_GH_SSH_URL_RE = re.compile(r"git@github\.com:([^/]+)/([^/]+?)(?:\.git)?$")
 
 
 def _parse_github_repo(repo_url: str) -> tuple[str, str] | None:
     """Extract (owner, repo) from a GitHub URL. Returns None for non-GitHub hosts."""
     # SSH format: git@github.com:org/repo.git
-    m = re.match(r"git@github\.com:([^/]+)/([^/]+?)(?:\.git)?$", repo_url)
+    m = _GH_SSH_URL_RE.match(repo_url)
     if m:
         return m.group(1), m.group(2)
     # HTTPS format
@@ -198,6 +333,102 @@ def _parse_github_repo(repo_url: str) -> tuple[str, str] | None:
     return None
 
 
+def _render_gh_comments_md(comments: list[dict]) -> str:
+    """Render the Comments section shared by issues and pull requests."""
+    if not comments:
+        return ""
+    parts = "".join(
+        f"### {(c.get('user') or {}).get('login', 'unknown')} ({(c.get('created_at') or '')[:10]})\n"
+        f"\n{(c.get('body') or '').strip()}\n\n"
+        for c in comments
+    )
+    return f"## Comments\n\n{parts}"
+
+
+def _gh_json(resp: httpx.Response):
+    """Decode a GitHub API response body, with orjson when it is installed."""
+    retval = orjson.loads(resp.content) if orjson else resp.json()
+    return retval
+
+
+# GraphQL has no "jobs" on WorkflowRun: they are its check suite's check runs
+_GH_RUN_JOBS_SELECTION = (
+    "... on WorkflowRun { checkSuite { checkRuns(first: 100) { nodes {"
+    " name status conclusion startedAt completedAt"
+    " steps(first: 100) { nodes { name status conclusion } } } } } }"
+)
+
+
+def _gh_enum(value: str | None) -> str | None:
+    """GraphQL enum (e.g. ``SUCCESS``) in the REST API's lowercase spelling."""
+    retval = value.lower() if value else value
+    return retval
+
+
+def _gh_check_run_to_job(node: dict) -> dict:
+    """Reshape a GraphQL CheckRun like an item of the REST ``/jobs`` list."""
+    retval = {
+        "name": node.get("name"),
+        "status": _gh_enum(node.get("status")),
+        "conclusion": _gh_enum(node.get("conclusion")),
+        "started_at": node.get("startedAt"),
+        "completed_at": node.get("completedAt"),
+        "steps": [
+            {
+                "name": step.get("name"),
+                "status": _gh_enum(step.get("status")),
+                "conclusion": _gh_enum(step.get("conclusion")),
+            }
+            for step in (node.get("steps") or {}).get("nodes") or []
+        ],
+    }
+    return retval
+
+
+def _gh_fingerprint(fields: tuple) -> str:
+    """Short content digest of the API fields that feed a rendered document."""
+    if orjson:
+        blob = orjson.dumps(fields)
+    else:
+        blob = json.dumps(fields, separators=(",", ":")).encode()
+    if xxhash:
+        retval = xxhash.xxh3_128_hexdigest(blob)
+    else:
+        retval = hashlib.blake2b(blob, digest_size=16, usedforsecurity=False).hexdigest()
+    return retval
+
+
+def _gh_issue_fingerprint(issue: dict) -> str:
+    """Fingerprint of everything _render_gh_issue_md reads from an issue."""
+    retval = _gh_fingerprint((
+        issue.get("title"), issue.get("state"),
+        (issue.get("user") or {}).get("login"),
+        [lb.get("name") for lb in (issue.get("labels") or [])],
+        [a.get("login") for a in (issue.get("assignees") or [])],
+        (issue.get("milestone") or {}).get("title"),
+        issue.get("body"), issue.get("created_at"), issue.get("updated_at"),
+        issue.get("comments"),
+    ))
+    return retval
+
+
+def _gh_pr_fingerprint(pr: dict) -> str:
+    """Fingerprint of everything _render_gh_pr_md reads from a pull request.
+
+    Only the base/head ref names are taken: the nested repo objects carry
+    pushed_at, which moves on every push and would invalidate every PR.
+    """
+    retval = _gh_fingerprint((
+        pr.get("title"), pr.get("state"), pr.get("merged_at"), pr.get("draft"),
+        (pr.get("user") or {}).get("login"),
+        (pr.get("base") or {}).get("ref"), (pr.get("head") or {}).get("ref"),
+        [lb.get("name") for lb in (pr.get("labels") or [])],
+        [r.get("login") for r in (pr.get("requested_reviewers") or [])],
+        pr.get("body"), pr.get("created_at"), pr.get("updated_at"),
+    ))
+    return retval
+
+
 def _render_gh_issue_md(issue: dict, comments: list[dict]) -> str:
     """Render a GitHub issue as a structured markdown document."""
     number = issue["number"]
@@ -210,38 +441,26 @@ def _render_gh_issue_md(issue: dict, comments: list[dict]) -> str:
     assignees = [a.get("login", "") for a in (issue.get("assignees") or [])]
     milestone = (issue.get("milestone") or {}).get("title", "")
 
-    lines: list[str] = [f"# #{number} {title}\n"]
-    lines.append("| Field | Value |")
-    lines.append("|---|---|")
-    lines.append(f"| State | {state} |")
-    lines.append(f"| Author | {user} |")
-    lines.append(f"| Created | {created} |")
-    lines.append(f"| Updated | {updated} |")
-    if labels:
-        lines.append(f"| Labels | {', '.join(labels)} |")
-    if assignees:
-        lines.append(f"| Assignees | {', '.join(assignees)} |")
-    if milestone:
-        lines.append(f"| Milestone | {milestone} |")
-    lines.append("")
+    labels_row = f"| Labels | {', '.join(labels)} |\n" if labels else ""
+    assignees_row = f"| Assignees | {', '.join(assignees)} |\n" if assignees else ""
+    milestone_row = f"| Milestone | {milestone} |\n" if milestone else ""
 
     body = issue.get("body") or ""
-    if body:
-        lines.append("## Description\n")
-        lines.append(body.strip())
-        lines.append("")
-
-    if comments:
-        lines.append("## Comments\n")
-        for c in comments:
-            author = (c.get("user") or {}).get("login", "unknown")
-            date = (c.get("created_at") or "")[:10]
-            cbody = c.get("body") or ""
-            lines.append(f"### {author} ({date})\n")
-            lines.append(cbody.strip())
-            lines.append("")
-
-    return "\n".join(lines)
+    description = f"## Description\n\n{body.strip()}\n\n" if body else ""
+
+    md = (
+        f"# #{number} {title}\n\n"
+        "| Field | Value |\n"
+        "|---|---|\n"
+        f"| State | {state} |\n"
+        f"| Author | {user} |\n"
+        f"| Created | {created} |\n"
+        f"| Updated | {updated} |\n"
+        f"{labels_row}{assignees_row}{milestone_row}\n"
+        f"{description}{_render_gh_comments_md(comments)}"
+    )
+    # Sections end with a blank line; the document itself has no trailing newline
+    return md[:-1]
 
 
 def _render_gh_pr_md(pr: dict, comments: list[dict]) -> str:
@@ -262,40 +481,30 @@ def _render_gh_pr_md(pr: dict, comments: list[dict]) -> str:
     labels = [lb.get("name", "") for lb in (pr.get("labels") or [])]
     reviewers = [r.get("login", "") for r in (pr.get("requested_reviewers") or [])]
 
-    lines: list[str] = [f"# #{number} {title}\n"]
-    lines.append("| Field | Value |")
-    lines.append("|---|---|")
-    lines.append(f"| State | {state} |")
-    lines.append(f"| Author | {user} |")
-    if base_branch and head_branch:
-        lines.append(f"| Branch | {head_branch} → {base_branch} |")
-    lines.append(f"| Created | {created} |")
-    lines.append(f"| Updated | {updated} |")
-    if merged:
-        lines.append(f"| Merged | {merged} |")
-    if labels:
-        lines.append(f"| Labels | {', '.join(labels)} |")
-    if reviewers:
-        lines.append(f"| Reviewers | {', '.join(reviewers)} |")
-    lines.append("")
+    branch_row = (
+        f"| Branch | {head_branch} → {base_branch} |\n"
+        if base_branch and head_branch else ""
+    )
+    merged_row = f"| Merged | {merged} |\n" if merged else ""
+    labels_row = f"| Labels | {', '.join(labels)} |\n" if labels else ""
+    reviewers_row = f"| Reviewers | {', '.join(reviewers)} |\n" if reviewers else ""
 
     body = pr.get("body") or ""
-    if body:
-        lines.append("## Description\n")
-        lines.append(body.strip())
-        lines.append("")
-
-    if comments:
-        lines.append("## Comments\n")
-        for c in comments:
-            author = (c.get("user") or {}).get("login", "unknown")
-            date = (c.get("created_at") or "")[:10]
-            cbody = c.get("body") or ""
-            lines.append(f"### {author} ({date})\n")
-            lines.append(cbody.strip())
-            lines.append("")
-
-    return "\n".join(lines)
+    description = f"## Description\n\n{body.strip()}\n\n" if body else ""
+
+    md = (
+        f"# #{number} {title}\n\n"
+        "| Field | Value |\n"
+        "|---|---|\n"
+        f"| State | {state} |\n"
+        f"| Author | {user} |\n"
+        f"{branch_row}"
+        f"| Created | {created} |\n"
+        f"| Updated | {updated} |\n"
+        f"{merged_row}{labels_row}{reviewers_row}\n"
+        f"{description}{_render_gh_comments_md(comments)}"
+    )
+    return md[:-1]
 
 
 def _render_gh_run_md(run: dict, jobs: list[dict]) -> str:
@@ -309,40 +518,61 @@ def _render_gh_run_md(run: dict, jobs: list[dict]) -> str:
     created = run.get("created_at", "")
     updated = run.get("updated_at", "")
 
-    lines: list[str] = [f"# Run #{run_number} — {name}\n"]
-    lines.append("| Field | Value |")
-    lines.append("|---|---|")
-    lines.append(f"| Status | {run_status} |")
-    if conclusion:
-        lines.append(f"| Conclusion | {conclusion} |")
-    lines.append(f"| Branch | {branch} |")
-    lines.append(f"| Event | {event} |")
-    lines.append(f"| Created | {created} |")
-    lines.append(f"| Updated | {updated} |")
-    lines.append("")
+    conclusion_row = f"| Conclusion | {conclusion} |\n" if conclusion else ""
 
+    jobs_md = ""
     if jobs:
-        lines.append("## Jobs\n")
+        job_parts = []
         for job in jobs:
-            job_name = job.get("name", "job")
-            job_conclusion = job.get("conclusion", job.get("status", ""))
             started = job.get("started_at", "")
             completed = job.get("completed_at", "")
-            lines.append(f"### {job_name} ({job_conclusion})")
-            if started:
-                lines.append(f"- Started: {started}")
-            if completed:
-                lines.append(f"- Completed: {completed}")
             steps = job.get("steps") or []
-            if steps:
-                lines.append("- Steps:")
-                for step in steps:
-                    step_name = step.get("name", "step")
-                    step_conclusion = step.get("conclusion", step.get("status", ""))
-                    lines.append(f"  - {step_name}: {step_conclusion}")
-            lines.append("")
+            steps_md = "".join(
+                f"  - {step.get('name', 'step')}: {step.get('conclusion', step.get('status', ''))}\n"
+                for step in steps
+            )
+            job_parts.append(
+                f"### {job.get('name', 'job')} ({job.get('conclusion', job.get('status', ''))})\n"
+                + (f"- Started: {started}\n" if started else "")
+                + (f"- Completed: {completed}\n" if completed else "")
+                + (f"- Steps:\n{steps_md}" if steps else "")
+                + "\n"
+            )
+        jobs_md = "## Jobs\n\n" + "".join(job_parts)
+
+    md = (
+        f"# Run #{run_number} — {name}\n\n"
+        "| Field | Value |\n"
+        "|---|---|\n"
+        f"| Status | {run_status} |\n"
+        f"{conclusion_row}"
+        f"| Branch | {branch} |\n"
+        f"| Event | {event} |\n"
+        f"| Created | {created} |\n"
+        f"| Updated | {updated} |\n"
+        "\n"
+        f"{jobs_md}"
+    )
+    return md[:-1]
+
+
+@dataclass
+class _GhETagCache:
+    """ETags and bodies of GitHub API responses, for conditional requests.
 
-    return "\n".join(lines)
+    Entries looked up or refreshed during a sync are carried into ``new``,
+    which is what gets persisted, so URLs no longer requested drop out.
+    """
+
+    old: dict[str, list]
+    new: dict[str, list] = field(default_factory=dict)
+
+    def lookup(self, key: str) -> list | None:
+        retval = self.new.get(key) or self.old.get(key)
+        return retval
+
+    def store(self, key: str, etag: str, body) -> None:
+        self.new[key] = [etag, body]
 
 
 class GitHubConnector(BaseSyncConnector):
@@ -372,6 +602,86 @@ class GitHubConnector(BaseSyncConnector):
         """Not used — sync() is overridden to use git clone/pull directly."""
         pass
 
+    async def _is_up_to_date(self, source, repo_dir: Path, branch: str) -> bool:
+        """Whether the checkout already matches the remote branch head.
+
+        A ``git ls-remote`` transfers no objects, so an idle branch costs one
+        cheap round trip instead of fetch + reset + clean.
+        """
+        local_sha = _read_head_sha(repo_dir)
+        if not local_sha:
+            return False
+        rc, out, _ = await self._run_git(
+            ["ls-remote", "origin", f"refs/heads/{branch}"], cwd=str(repo_dir), source=source
+        )
+        if rc != 0:
+            return False
+        retval = out.split("\t", 1)[0].strip() == local_sha
+        return retval
+
+    async def _sparse_clone(
+        self, source, repo_url: str, branch: str, repo_dir: Path, subfolder: str,
+    ) -> bool:
+        """Clone only the blobs under subfolder (partial clone + cone sparse-checkout).
+
+        Returns False, leaving no repo_dir behind, if any step fails so the
+        caller can fall back to a regular clone.
+        """
+        steps = [
+            ([
+                "clone",
+                "--filter=blob:none",
+                "--no-checkout",
+                "--single-branch",
+                "--branch", branch,
+                "--depth", "1",
+                repo_url,
+                str(repo_dir),
+            ], None),
+            (["sparse-checkout", "init", "--cone"], str(repo_dir)),
+            (["sparse-checkout", "set", subfolder], str(repo_dir)),
+            (["checkout", branch], str(repo_dir)),
+        ]
+        for args, cwd in steps:
+            rc, out, err = await self._run_git(args, cwd=cwd, source=source)
+            if rc != 0:
+                logger.warning(
+                    "Sparse clone of %s failed at 'git %s', doing a full clone: %s",
+                    repo_url, args[0], err.strip(),
+                )
+                shutil.rmtree(repo_dir, ignore_errors=True)
+                return False
+        return True
+
+    async def _update_sparse_checkout(self, source, repo_dir: Path, subfolder: str) -> None:
+        """Keep a sparse checkout's cone in line with the configured subfolder."""
+        sparse_file = repo_dir / ".git" / "info" / "sparse-checkout"
+        if not subfolder:
+            # Subfolder cleared: check out the whole tree from now on
+            rc, out, err = await self._run_git(
+                ["sparse-checkout", "disable"], cwd=str(repo_dir), source=source
+            )
+            if rc != 0:
+                raise RuntimeError(f"git sparse-checkout disable failed: {err}")
+            sparse_file.unlink(missing_ok=True)
+            return
+        # A full clone (made before a subfolder was configured, or by the
+        # full-clone fallback) is converted so only the subfolder stays checked out
+        converting = not sparse_file.exists()
+        if not converting and f"/{subfolder}/" in sparse_file.read_text().splitlines():
+            return
+        rc, out, err = await self._run_git(
+            ["sparse-checkout", "set", "--cone", subfolder], cwd=str(repo_dir), source=source
+        )
+        if rc != 0:
+            if converting:
+                logger.warning(
+                    "Could not enable sparse checkout in %s, keeping the full checkout: %s",
+                    repo_dir, err.strip(),
+                )
+                return
+            raise RuntimeError(f"git sparse-checkout set failed: {err}")
+
     async def _sync_single_branch(
         self,
         source,
@@ -388,17 +698,23 @@ class GitHubConnector(BaseSyncConnector):
         repo_dir = local_root / ".git-repo"
         stats = {"downloaded": 0, "deleted": 0, "skipped": 0, "errors": 0}
 
-        if (repo_dir / ".git").exists():
+        # A .git file means a worktree left by all-branches mode; re-clone it
+        is_clone = (repo_dir / ".git").is_dir()
+        if is_clone and await self._is_up_to_date(source, repo_dir, branch):
+            logger.info("Branch %s already up to date in %s", branch, local_root)
+        elif is_clone:
             # Pull updates
             logger.info("Pulling updates for %s (branch: %s)", local_root, branch)
 
-            # Ensure the target branch is tracked (clone may have used --single-branch for a different branch)
-            await self._run_git(
-                ["remote", "set-branches", "origin", branch], cwd=str(repo_dir), source=source
-            )
-
+            # Fetch only the target branch (an explicit refspec also covers a clone
+            # made for a different branch) and stay shallow: just the new tip's
+            # objects, no tags. Partial clones reuse their blob filter automatically.
             rc, out, err = await self._run_git(
-                ["fetch", "--prune", "origin"], cwd=str(repo_dir), source=source
+                [
+                    "fetch", "--depth", "1", "--no-tags", "origin",
+                    f"+refs/heads/{branch}:refs/remotes/origin/{branch}",
+                ],
+                cwd=str(repo_dir), source=source,
             )
             if rc != 0:
                 raise RuntimeError(f"git fetch failed: {err}")
@@ -419,18 +735,34 @@ class GitHubConnector(BaseSyncConnector):
             if repo_dir.exists():
                 shutil.rmtree(repo_dir)
 
-            clone_args = [
-                "clone",
-                "--single-branch",
-                "--branch", branch,
-                "--depth", "1",
-                repo_url,
-                str(repo_dir),
-            ]
-            rc, out, err = await self._run_git(clone_args, source=source)
-            if rc != 0:
-                raise RuntimeError(f"git clone failed: {err}")
+            if not (subfolder and await self._sparse_clone(source, repo_url, branch, repo_dir, subfolder)):
+                clone_args = [
+                    "clone",
+                    "--single-branch",
+                    "--branch", branch,
+                    "--depth", "1",
+                    repo_url,
+                    str(repo_dir),
+                ]
+                rc, out, err = await self._run_git(clone_args, source=source)
+                if rc != 0:
+                    raise RuntimeError(f"git clone failed: {err}")
+
+        if subfolder or (repo_dir / ".git" / "info" / "sparse-checkout").exists():
+            await self._update_sparse_checkout(source, repo_dir, subfolder)
+
+        await self._mirror_checkout(repo_dir, local_root, subfolder, keep_extensions, stats)
+        return stats
 
+    async def _mirror_checkout(
+        self,
+        repo_dir: Path,
+        local_root: Path,
+        subfolder: str,
+        keep_extensions: set[str] | None,
+        stats: dict,
+    ) -> None:
+        """Mirror a checkout (or its subfolder) into local_root, updating stats."""
         # Mirror the repo (or subfolder) into local_root
         source_dir = repo_dir / subfolder if subfolder else repo_dir
         if not source_dir.exists():
@@ -438,75 +770,123 @@ class GitHubConnector(BaseSyncConnector):
                 f"Subfolder '{subfolder}' not found in repository"
             )
 
-        # Collect all files (excluding .git and hidden files)
+        # Collect all files (excluding .git and hidden files) with their stats.
+        # scandir's d_type answers the dir/file question for free and
+        # DirEntry.stat() caches, so each source file costs one stat. Hidden
+        # and symlinked directories are not descended into.
+        src_root = str(source_dir)
+        src_files: list[tuple[str, str, os.stat_result]] = []
+        pending = [(src_root, "")]
+        while pending:
+            dirpath, prefix = pending.pop()
+            with os.scandir(dirpath) as it:
+                for entry in it:
+                    if entry.name.startswith("."):
+                        continue
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append((entry.path, f"{prefix}{entry.name}/"))
+                    elif entry.is_file():
+                        src_files.append((f"{prefix}{entry.name}", entry.path, entry.stat()))
+                    elif entry.is_symlink() and not os.path.exists(entry.path):
+                        logger.debug("Skipping broken symlink: %s", entry.path)
+        src_files.sort()
+
+        # Find new/changed files; only the destination needs a stat of its own
+        dst_root = str(local_root)
         remote_paths: set[str] = set()
-        for src_file in source_dir.rglob("*"):
-            if src_file.is_dir():
-                continue
-            if src_file.is_symlink() and not src_file.exists():
-                logger.debug("Skipping broken symlink: %s", src_file)
-                continue
-            rel = src_file.relative_to(source_dir)
-            if any(p.startswith(".") for p in rel.parts):
-                continue
-            remote_paths.add(str(rel))
-
-        # Copy new/changed files
-        for rel_str in sorted(remote_paths):
-            src_file = source_dir / rel_str
-            dst_file = local_root / rel_str
-
-            if dst_file.exists():
-                src_stat = src_file.stat()
-                dst_stat = dst_file.stat()
+        to_copy: list[tuple[str, str]] = []
+        for rel_str, src_path, src_stat in src_files:
+            remote_paths.add(rel_str)
+            dst_path = os.path.join(dst_root, rel_str)
+            try:
+                dst_stat = os.stat(dst_path)
+            except FileNotFoundError:
+                pass
+            else:
                 if (
                     src_stat.st_size == dst_stat.st_size
-                    and src_stat.st_mtime <= dst_stat.st_mtime
+                    and src_stat.st_mtime_ns <= dst_stat.st_mtime_ns
                 ):
                     stats["skipped"] += 1
                     continue
+            to_copy.append((src_path, dst_path))
 
-            dst_file.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(str(src_file), str(dst_file))
-            stats["downloaded"] += 1
+        # Parent directories are created once up front; the links/copies are
+        # then split across worker threads, a slice per thread so the cheap
+        # hardlink case isn't dominated by per-file thread hand-offs
+        for parent in {os.path.dirname(dst) for _, dst in to_copy}:
+            os.makedirs(parent, exist_ok=True)
 
-        # Delete local files that no longer exist in repo
-        _keep = keep_extensions or set()
-        for local_file in local_root.rglob("*"):
-            if local_file.is_file() and not local_file.name.startswith("."):
-                try:
-                    local_file.relative_to(repo_dir)
-                    continue
-                except ValueError:
-                    pass
+        def _materialize_all(pairs: list[tuple[str, str]]) -> None:
+            for src_path, dst_path in pairs:
+                _materialize(Path(src_path), Path(dst_path))
 
-                if local_file.suffix.lower() in _keep:
-                    continue
+        await asyncio.gather(*(
+            asyncio.to_thread(_materialize_all, to_copy[i::GIT_MIRROR_WORKERS])
+            for i in range(min(GIT_MIRROR_WORKERS, len(to_copy)))
+        ))
+        stats["downloaded"] += len(to_copy)
 
-                rel = str(local_file.relative_to(local_root))
-                if rel not in remote_paths:
-                    try:
-                        local_file.unlink()
-                        stats["deleted"] += 1
-                        logger.info("Deleted (not in repo): %s", rel)
-                    except Exception as e:
-                        logger.error("Failed to delete %s: %s", rel, e)
-                        stats["errors"] += 1
-
-        # Clean up empty directories (excluding .git-repo)
-        for dirpath in sorted(local_root.rglob("*"), reverse=True):
-            if dirpath.is_dir() and not any(dirpath.iterdir()):
-                try:
-                    dirpath.relative_to(repo_dir)
-                    continue
-                except ValueError:
-                    pass
-                try:
-                    dirpath.rmdir()
-                except Exception:
-                    pass
+        # Delete local files that no longer exist in repo and prune empty
+        # directories, leaving the .git-repo checkout alone
+        await asyncio.to_thread(
+            self._mirror_delete, local_root, remote_paths, stats, keep_extensions,
+            frozenset({repo_dir.name}),
+        )
 
-        return stats
+    async def _fetch_shared_repo(self, source, repo_url: str, shared_dir: Path) -> None:
+        """Create (if needed) and fetch the bare repo backing all branch worktrees.
+
+        Every branch tip is fetched shallowly into refs/remotes/origin/*, so
+        blobs common to several branches are transferred and stored once. The
+        URL is passed on each fetch rather than saved as a remote, so token
+        credentials never land in the repo config.
+        """
+        if not (shared_dir / "HEAD").is_file():
+            if shared_dir.exists():
+                shutil.rmtree(shared_dir)
+            rc, out, err = await self._run_git(
+                ["init", "--bare", str(shared_dir)], source=source
+            )
+            if rc != 0:
+                raise RuntimeError(f"git init failed: {err}")
+
+        rc, out, err = await self._run_git(
+            [
+                "fetch", "--prune", "--depth", "1", repo_url,
+                "+refs/heads/*:refs/remotes/origin/*",
+            ],
+            cwd=str(shared_dir), source=source,
+        )
+        if rc != 0:
+            raise RuntimeError(f"git fetch failed: {err}")
+
+    async def _checkout_worktree(
+        self, source, shared_dir: Path, worktree_dir: Path, branch: str,
+        lock: asyncio.Lock,
+    ) -> None:
+        """Point a branch's worktree at the freshly fetched remote tip."""
+        ref = f"refs/remotes/origin/{branch}"
+        if (worktree_dir / ".git").is_file():
+            rc, out, err = await self._run_git(
+                ["reset", "--hard", ref], cwd=str(worktree_dir), source=source
+            )
+            if rc == 0:
+                await self._run_git(["clean", "-fdx"], cwd=str(worktree_dir), source=source)
+                return
+            logger.warning("Recreating worktree %s: %s", worktree_dir, err.strip())
+
+        # Missing, broken, or a standalone clone from before the shared repo
+        if worktree_dir.exists():
+            shutil.rmtree(worktree_dir)
+        async with lock:
+            await self._run_git(["worktree", "prune"], cwd=str(shared_dir), source=source)
+            rc, out, err = await self._run_git(
+                ["worktree", "add", "--detach", "-f", str(worktree_dir), ref],
+                cwd=str(shared_dir), source=source,
+            )
+        if rc != 0:
+            raise RuntimeError(f"git worktree add failed: {err}")
 
     async def sync(self, source, fs, keep_extensions: set[str] | None = None) -> dict:
         """Sync a git repository using clone or pull.
@@ -576,37 +956,59 @@ class GitHubConnector(BaseSyncConnector):
 
         totals = {"downloaded": 0, "deleted": 0, "skipped": 0, "errors": 0}
 
-        for branch in branches:
+        # One shared object store fetches every branch tip in a single round
+        # trip; each branch gets a detached worktree in its own .git-repo.
+        shared_dir = local_root / ".git-repo"
+        await self._fetch_shared_repo(source, repo_url, shared_dir)
+
+        # Checkouts and mirroring are local now; the semaphore caps concurrent
+        # git processes and the lock serializes worktree bookkeeping.
+        sem = asyncio.Semaphore(GIT_BRANCH_CONCURRENCY)
+        worktree_lock = asyncio.Lock()
+
+        async def _sync_branch(branch: str) -> dict:
             # Sanitise branch name for filesystem (replace / with --)
             safe_name = branch.replace("/", "--")
             branch_root = branches_dir / safe_name
             branch_root.mkdir(parents=True, exist_ok=True)
-
-            try:
-                stats = await self._sync_single_branch(
-                    source, repo_url, branch, branch_root, subfolder,
-                    keep_extensions,
+            worktree_dir = branch_root / ".git-repo"
+            retval = {"downloaded": 0, "deleted": 0, "skipped": 0, "errors": 0}
+            async with sem:
+                await self._checkout_worktree(
+                    source, shared_dir, worktree_dir, branch, worktree_lock,
                 )
-                for k in totals:
-                    totals[k] += stats[k]
-                logger.info(
-                    "Branch %s synced for %s: %s", branch, folder_path, stats,
+                await self._mirror_checkout(
+                    worktree_dir, branch_root, subfolder, keep_extensions, retval,
                 )
-            except Exception as e:
+            return retval
+
+        results = await asyncio.gather(
+            *(_sync_branch(b) for b in branches), return_exceptions=True,
+        )
+        for branch, result in zip(branches, results):
+            if isinstance(result, BaseException):
                 logger.error(
-                    "Failed to sync branch %s for %s: %s", branch, folder_path, e,
+                    "Failed to sync branch %s for %s: %s", branch, folder_path, result,
                 )
                 totals["errors"] += 1
+                continue
+            for k in totals:
+                totals[k] += result[k]
+            logger.info(
+                "Branch %s synced for %s: %s", branch, folder_path, result,
+            )
 
         # Clean up local branch folders that no longer exist remotely
         safe_names = {b.replace("/", "--") for b in branches}
-        if branches_dir.exists():
-            for child in list(branches_dir.iterdir()):
-                if child.is_dir() and child.name not in safe_names:
-                    logger.info(
-                        "Removing stale branch folder: %s", child.name,
-                    )
-                    shutil.rmtree(child)
+        stale = [
+            child for child in branches_dir.iterdir()
+            if child.is_dir() and child.name not in safe_names
+        ]
+        for child in stale:
+            logger.info("Removing stale branch folder: %s", child.name)
+        # Whole branch trees can be large; delete them off the event loop
+        await asyncio.gather(*(asyncio.to_thread(shutil.rmtree, c) for c in stale))
+        await self._run_git(["worktree", "prune"], cwd=str(shared_dir), source=source)
 
         # Sync issues, pull requests, and workflow runs from GitHub API
         try:
@@ -630,18 +1032,81 @@ class GitHubConnector(BaseSyncConnector):
     # GitHub API helpers (issues, PRs, actions)
     # ------------------------------------------------------------------
 
+    # Wall-clock time before which no GitHub API request should be sent; shared
+    # by every concurrent fetch so they all back off together.
+    _gh_resume_at: float = 0.0
+
+    async def _gh_request(
+        self, client: httpx.AsyncClient, url: str, headers: dict,
+        params: dict | None, *, json_body: dict | None = None, max_retries: int = 3,
+    ) -> httpx.Response:
+        """GET (or POST, given json_body) with GitHub rate-limit awareness.
+
+        Waits out a shared pause when a previous response reported the quota
+        nearly exhausted, and retries 429s and rate-limit 403s honouring
+        Retry-After / X-RateLimit-Reset, else backing off 2, 4, 8 s.
+        """
+        for attempt in range(max_retries + 1):
+            delay = self._gh_resume_at - time.time()
+            if delay > 0:
+                await asyncio.sleep(min(delay, GH_RATE_LIMIT_MAX_WAIT))
+            if json_body is None:
+                resp = await client.get(url, headers=headers, params=params)
+            else:
+                resp = await client.post(url, headers=headers, json=json_body)
+
+            remaining = resp.headers.get("x-ratelimit-remaining")
+            reset = resp.headers.get("x-ratelimit-reset")
+            if remaining and reset and int(remaining) < GH_RATE_LIMIT_LOW:
+                self._gh_resume_at = max(self._gh_resume_at, float(reset))
+
+            throttled = resp.status_code == 429 or (
+                resp.status_code == 403
+                and (remaining == "0" or "rate limit" in resp.text.lower())
+            )
+            if not throttled or attempt == max_retries:
+                return resp
+            try:
+                retry_after = float(resp.headers["Retry-After"])
+            except (KeyError, ValueError):
+                retry_after = (
+                    float(reset) - time.time() if remaining == "0" and reset
+                    else 2 ** (attempt + 1)
+                )
+            retry_after = min(max(retry_after, 1.0), GH_RATE_LIMIT_MAX_WAIT)
+            logger.warning(
+                "GitHub API rate limited (%d), retry %d/%d in %.0fs: %s",
+                resp.status_code, attempt + 1, max_retries, retry_after, url[:120],
+            )
+            self._gh_resume_at = max(self._gh_resume_at, time.time() + retry_after)
+        return resp
+
     async def _gh_api_get(
         self,
         client: httpx.AsyncClient,
         url: str,
         token: str = "",
         params: dict | None = None,
+        etags: _GhETagCache | None = None,
     ) -> dict | list:
-        """Make a GET request to the GitHub REST API."""
+        """Make a GET request to the GitHub REST API.
+
+        With an ETag cache, the request is conditional: a 304 (free against
+        the rate limit, no body) returns the body cached from last time.
+        """
         headers = {"Accept": "application/vnd.github+json"}
         if token:
             headers["Authorization"] = f"Bearer {token}"
-        resp = await client.get(url, headers=headers, params=params)
+        cached = None
+        if etags is not None:
+            cache_key = url + "?" + "&".join(f"{k}={v}" for k, v in sorted((params or {}).items()))
+            cached = etags.lookup(cache_key)
+            if cached:
+                headers["If-None-Match"] = cached[0]
+        resp = await self._gh_request(client, url, headers, params)
+        if resp.status_code == 304 and cached:
+            etags.store(cache_key, cached[0], cached[1])
+            return cached[1]
         if resp.status_code in (401, 403):
             raise RuntimeError(
                 f"GitHub API auth error ({resp.status_code}): {resp.text[:200]}"
@@ -652,7 +1117,11 @@ class GitHubConnector(BaseSyncConnector):
             raise RuntimeError(
                 f"GitHub API error ({resp.status_code}): {resp.text[:300]}"
             )
-        return resp.json()
+        retval = _gh_json(resp)
+        etag = resp.headers.get("etag")
+        if etags is not None and etag:
+            etags.store(cache_key, etag, retval)
+        return retval
 
     async def _gh_api_get_pages(
         self,
@@ -661,6 +1130,7 @@ class GitHubConnector(BaseSyncConnector):
         token: str = "",
         params: dict | None = None,
         max_items: int = 500,
+        etags: _GhETagCache | None = None,
     ) -> list[dict]:
         """Paginate through a GitHub API list endpoint."""
         params = dict(params or {})
@@ -668,7 +1138,7 @@ class GitHubConnector(BaseSyncConnector):
         params.setdefault("page", 1)
         results: list[dict] = []
         while len(results) < max_items:
-            data = await self._gh_api_get(client, url, token, params)
+            data = await self._gh_api_get(client, url, token, params, etags)
             if not data:
                 break
             if isinstance(data, list):
@@ -690,6 +1160,72 @@ class GitHubConnector(BaseSyncConnector):
             params["page"] += 1
         return results[:max_items]
 
+    async def _gh_graphql(
+        self, client: httpx.AsyncClient, token: str, query: str, variables: dict,
+    ) -> dict:
+        """Run a GitHub GraphQL query and return its ``data`` object.
+
+        Per-field errors leave those fields null in ``data``; the request only
+        fails outright when no data comes back at all.
+        """
+        headers = {"Authorization": f"Bearer {token}"}
+        resp = await self._gh_request(
+            client, "https://api.github.com/graphql", headers, None,
+            json_body={"query": query, "variables": variables},
+        )
+        if resp.status_code != 200:
+            raise RuntimeError(
+                f"GitHub GraphQL error ({resp.status_code}): {resp.text[:300]}"
+            )
+        payload = _gh_json(resp)
+        data = payload.get("data")
+        if not data:
+            raise RuntimeError(f"GitHub GraphQL error: {payload.get('errors')}")
+        return data
+
+    async def _gh_graphql_run_jobs(
+        self, client: httpx.AsyncClient, token: str, runs: list[dict],
+        sem: asyncio.Semaphore,
+    ) -> dict[int, list[dict]]:
+        """Fetch the jobs of many workflow runs with batched GraphQL queries.
+
+        Jobs are the check runs of each run's check suite, reshaped like the
+        REST ``/jobs`` payload so _render_gh_run_md can't tell them apart.
+        Runs missing from the result (no node_id, null node) are left for the
+        caller to fetch over REST.
+        """
+        runs = [r for r in runs if r.get("node_id")]
+        batches = [
+            runs[i:i + GH_GRAPHQL_RUN_BATCH]
+            for i in range(0, len(runs), GH_GRAPHQL_RUN_BATCH)
+        ]
+
+        async def _query(batch: list[dict]) -> dict[int, list[dict]]:
+            params = ", ".join(f"$id{i}: ID!" for i in range(len(batch)))
+            fields = " ".join(
+                f"r{i}: node(id: $id{i}) {{ {_GH_RUN_JOBS_SELECTION} }}"
+                for i in range(len(batch))
+            )
+            variables = {f"id{i}": run["node_id"] for i, run in enumerate(batch)}
+            async with sem:
+                data = await self._gh_graphql(
+                    client, token, f"query({params}) {{ {fields} }}", variables,
+                )
+            retval = {}
+            for i, run in enumerate(batch):
+                suite = (data.get(f"r{i}") or {}).get("checkSuite")
+                if suite is not None:
+                    retval[run["id"]] = [
+                        _gh_check_run_to_job(node)
+                        for node in (suite.get("checkRuns") or {}).get("nodes") or []
+                    ]
+            return retval
+
+        jobs_by_run: dict[int, list[dict]] = {}
+        for result in await asyncio.gather(*(_query(b) for b in batches)):
+            jobs_by_run.update(result)
+        return jobs_by_run
+
     # ------------------------------------------------------------------
     # Metadata sync: issues, PRs, actions
     # ------------------------------------------------------------------
@@ -722,91 +1258,91 @@ class GitHubConnector(BaseSyncConnector):
         new_revisions: dict[str, str] = {}
         remote_paths: set[str] = set()
         timestamps: dict[str, dict] = {}
+        etags_file = local_root / ".github_etags.json"
+        etags = _GhETagCache(read_json_sidecar(etags_file))
         stats = {"downloaded": 0, "deleted": 0, "skipped": 0, "errors": 0}
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            # --- Issues ---
-            try:
-                await self._sync_gh_issues(
-                    client, api_base, token, local_root,
-                    old_revisions, new_revisions, remote_paths, stats,
-                    timestamps,
-                )
-            except Exception as e:
-                logger.error("Failed to sync GitHub issues: %s", e)
-                stats["errors"] += 1
-
-            # --- Pull Requests ---
-            try:
-                await self._sync_gh_pull_requests(
-                    client, api_base, token, local_root,
-                    old_revisions, new_revisions, remote_paths, stats,
-                    timestamps,
-                )
-            except Exception as e:
-                logger.error("Failed to sync GitHub PRs: %s", e)
-                stats["errors"] += 1
-
-            # --- Actions / Workflow Runs ---
-            try:
-                await self._sync_gh_actions(
-                    client, api_base, token, local_root,
-                    old_revisions, new_revisions, remote_paths, stats,
-                    timestamps,
-                )
-            except Exception as e:
-                logger.error("Failed to sync GitHub actions: %s", e)
+        # The connector's pooled client keeps GitHub connections (HTTP/2 when
+        # available) alive between syncs; close_connectors() shuts it down.
+        client = await self._get_client()
+        # Issues, PRs and workflow runs hit independent endpoints and write
+        # distinct paths, so fetch them concurrently. The shared dicts are
+        # only mutated between awaits, which is safe on one event loop.
+        # One semaphore for all three keeps GitHub's secondary rate limits happy
+        sem = asyncio.Semaphore(GH_API_CONCURRENCY)
+        args = (
+            client, api_base, token, local_root,
+            old_revisions, new_revisions, remote_paths, stats,
+            timestamps, sem, etags,
+        )
+        results = await asyncio.gather(
+            self._sync_gh_issues(*args),
+            self._sync_gh_pull_requests(*args),
+            self._sync_gh_actions(*args),
+            return_exceptions=True,
+        )
+        for kind, result in zip(("issues", "PRs", "actions"), results):
+            if isinstance(result, BaseException):
+                logger.error("Failed to sync GitHub %s: %s", kind, result)
                 stats["errors"] += 1
 
-        # Delete stale metadata files
+        # Delete stale metadata files in one walk per folder, building relative
+        # paths as strings, then remove directories left empty (deepest first)
         for folder_name in ("issues", "pull-requests", "actions"):
-            folder = local_root / folder_name
-            if not folder.exists():
+            folder = str(local_root / folder_name)
+            if not os.path.isdir(folder):
                 continue
-            for f in folder.rglob("*.md"):
-                rel = str(f.relative_to(local_root))
-                if rel not in remote_paths:
-                    try:
-                        f.unlink()
-                        stats["deleted"] += 1
-                    except Exception as e:
-                        logger.error("Failed to delete %s: %s", rel, e)
-                        stats["errors"] += 1
-            # Clean up empty directories
-            for d in sorted(folder.rglob("*"), reverse=True):
-                if d.is_dir() and not any(d.iterdir()):
-                    try:
-                        d.rmdir()
-                    except Exception:
-                        pass
+            subdirs: list[str] = []
+            for dirpath, dirnames, filenames in os.walk(folder):
+                rel_dir = os.path.relpath(dirpath, local_root).replace(os.sep, "/")
+                if dirpath != folder:
+                    subdirs.append(dirpath)
+                for name in filenames:
+                    if not name.endswith(".md"):
+                        continue
+                    rel = f"{rel_dir}/{name}"
+                    if rel not in remote_paths:
+                        try:
+                            os.unlink(os.path.join(dirpath, name))
+                            stats["deleted"] += 1
+                        except Exception as e:
+                            logger.error("Failed to delete %s: %s", rel, e)
+                            stats["errors"] += 1
+            for dirpath in reversed(subdirs):
+                try:
+                    os.rmdir(dirpath)  # Only succeeds if empty
+                except OSError:
+                    pass
 
         # Write timestamps sidecar for the indexing pipeline
         (local_root / ".voitta_timestamps.json").write_text(json.dumps(timestamps))
 
         revisions_file.write_text(json.dumps(new_revisions), encoding="utf-8")
+        write_json_sidecar(etags_file, etags.new)
         logger.info("GitHub metadata sync: %s", stats)
         return stats
 
     async def _sync_gh_issues(
         self, client, api_base, token, local_root,
         old_revisions, new_revisions, remote_paths, stats,
-        timestamps,
+        timestamps, sem, etags,
     ):
         """Fetch and render GitHub issues as markdown files."""
         issues = await self._gh_api_get_pages(
             client, f"{api_base}/issues", token,
             {"state": "all", "sort": "updated", "direction": "desc"},
-            max_items=500,
+            max_items=500, etags=etags,
         )
         # GitHub issues endpoint includes PRs — filter them out
         issues = [i for i in issues if "pull_request" not in i]
 
+        to_render: list[tuple[dict, Path]] = []
         for issue in issues:
             number = issue["number"]
             title = issue.get("title", f"Issue-{number}")
             updated = issue.get("updated_at", "")
             created = issue.get("created_at", "")
-            safe_title = _sanitize_gh_filename(title)
+            safe_title = sanitize_filename(title, 80)
             rel_path = f"issues/{number}-{safe_title}.md"
             remote_paths.add(rel_path)
 
@@ -819,7 +1355,7 @@ class GitHubConnector(BaseSyncConnector):
             if ts_entry:
                 timestamps[rel_path] = ts_entry
 
-            content_hash = hashlib.sha256(updated.encode()).hexdigest()
+            content_hash = _gh_issue_fingerprint(issue)
             new_revisions[rel_path] = content_hash
 
             local_file = local_root / rel_path
@@ -827,42 +1363,51 @@ class GitHubConnector(BaseSyncConnector):
                 stats["skipped"] += 1
                 continue
 
-            # Fetch comments for new/changed issues
-            comments: list[dict] = []
-            if issue.get("comments", 0) > 0:
+            to_render.append((issue, local_file))
+
+        # Fetch comments for new/changed issues concurrently
+        async def _fetch_comments(issue: dict) -> list[dict]:
+            if issue.get("comments", 0) <= 0:
+                return []
+            async with sem:
                 try:
-                    comments = await self._gh_api_get_pages(
-                        client, f"{api_base}/issues/{number}/comments", token,
-                        max_items=100,
+                    retval = await self._gh_api_get_pages(
+                        client, f"{api_base}/issues/{issue['number']}/comments", token,
+                        max_items=100, etags=etags,
                     )
                 except Exception as e:
                     logger.warning(
-                        "Failed to fetch comments for issue #%d: %s", number, e,
+                        "Failed to fetch comments for issue #%d: %s", issue["number"], e,
                     )
+                    retval = []
+            return retval
+
+        # Each issue is rendered and written as soon as its comments arrive
+        async def _refresh(issue: dict, local_file: Path) -> None:
+            comments = await _fetch_comments(issue)
+            await _write_gh_markdown(local_file, _render_gh_issue_md(issue, comments), stats)
 
-            md = _render_gh_issue_md(issue, comments)
-            local_file.parent.mkdir(parents=True, exist_ok=True)
-            local_file.write_text(md, encoding="utf-8")
-            stats["downloaded"] += 1
+        await asyncio.gather(*(_refresh(i, f) for i, f in to_render))
 
     async def _sync_gh_pull_requests(
         self, client, api_base, token, local_root,
         old_revisions, new_revisions, remote_paths, stats,
-        timestamps,
+        timestamps, sem, etags,
     ):
         """Fetch and render GitHub pull requests as markdown files."""
         prs = await self._gh_api_get_pages(
             client, f"{api_base}/pulls", token,
             {"state": "all", "sort": "updated", "direction": "desc"},
-            max_items=500,
+            max_items=500, etags=etags,
         )
 
+        to_render: list[tuple[dict, Path]] = []
         for pr in prs:
             number = pr["number"]
             title = pr.get("title", f"PR-{number}")
             updated = pr.get("updated_at", "")
             created = pr.get("created_at", "")
-            safe_title = _sanitize_gh_filename(title)
+            safe_title = sanitize_filename(title, 80)
             rel_path = f"pull-requests/{number}-{safe_title}.md"
             remote_paths.add(rel_path)
 
@@ -875,7 +1420,7 @@ class GitHubConnector(BaseSyncConnector):
             if ts_entry:
                 timestamps[rel_path] = ts_entry
 
-            content_hash = hashlib.sha256(updated.encode()).hexdigest()
+            content_hash = _gh_pr_fingerprint(pr)
             new_revisions[rel_path] = content_hash
 
             local_file = local_root / rel_path
@@ -883,51 +1428,62 @@ class GitHubConnector(BaseSyncConnector):
                 stats["skipped"] += 1
                 continue
 
-            # Fetch issue comments + review comments, merge chronologically
-            comments: list[dict] = []
+            to_render.append((pr, local_file))
+
+        # Fetch issue comments + review comments, merge chronologically
+        async def _fetch_comments(pr: dict) -> list[dict]:
+            number = pr["number"]
+
+            async def _get(url: str) -> list[dict]:
+                async with sem:
+                    retval = await self._gh_api_get_pages(
+                        client, url, token, max_items=100, etags=etags,
+                    )
+                return retval
+
             try:
-                issue_comments = await self._gh_api_get_pages(
-                    client, f"{api_base}/issues/{number}/comments", token,
-                    max_items=100,
+                issue_comments, review_comments = await asyncio.gather(
+                    _get(f"{api_base}/issues/{number}/comments"),
+                    _get(f"{api_base}/pulls/{number}/comments"),
                 )
-                review_comments = await self._gh_api_get_pages(
-                    client, f"{api_base}/pulls/{number}/comments", token,
-                    max_items=100,
-                )
-                all_comments = issue_comments + review_comments
-                all_comments.sort(key=lambda c: c.get("created_at", ""))
-                comments = all_comments
             except Exception as e:
                 logger.warning(
                     "Failed to fetch comments for PR #%d: %s", number, e,
                 )
+                return []
+            all_comments = issue_comments + review_comments
+            all_comments.sort(key=lambda c: c.get("created_at", ""))
+            return all_comments
+
+        # Each PR is rendered and written as soon as its comments arrive
+        async def _refresh(pr: dict, local_file: Path) -> None:
+            comments = await _fetch_comments(pr)
+            await _write_gh_markdown(local_file, _render_gh_pr_md(pr, comments), stats)
 
-            md = _render_gh_pr_md(pr, comments)
-            local_file.parent.mkdir(parents=True, exist_ok=True)
-            local_file.write_text(md, encoding="utf-8")
-            stats["downloaded"] += 1
+        await asyncio.gather(*(_refresh(pr, f) for pr, f in to_render))
 
     async def _sync_gh_actions(
         self, client, api_base, token, local_root,
         old_revisions, new_revisions, remote_paths, stats,
-        timestamps,
+        timestamps, sem, etags,
     ):
         """Fetch and render recent GitHub Actions workflow runs."""
         runs_data = await self._gh_api_get(
             client, f"{api_base}/actions/runs", token,
-            {"per_page": 100},
+            {"per_page": 100}, etags,
         )
         runs = (
             runs_data.get("workflow_runs", [])
             if isinstance(runs_data, dict) else []
         )
 
+        to_render: list[tuple[dict, Path]] = []
         for run in runs[:100]:
             run_number = run.get("run_number", 0)
             workflow_name = run.get("name", "workflow")
             updated = run.get("updated_at", "")
             created = run.get("created_at", "")
-            safe_workflow = _sanitize_gh_filename(workflow_name)
+            safe_workflow = sanitize_filename(workflow_name, 80)
             rel_path = f"actions/{safe_workflow}/{run_number}.md"
             remote_paths.add(rel_path)
 
@@ -940,7 +1496,9 @@ class GitHubConnector(BaseSyncConnector):
             if ts_entry:
                 timestamps[rel_path] = ts_entry
 
-            content_hash = hashlib.sha256(updated.encode()).hexdigest()
+            # Every field a run's page shows moves together with updated_at, so
+            # the timestamp itself is the revision key; nothing to hash
+            content_hash = updated
             new_revisions[rel_path] = content_hash
 
             local_file = local_root / rel_path
@@ -948,24 +1506,43 @@ class GitHubConnector(BaseSyncConnector):
                 stats["skipped"] += 1
                 continue
 
-            # Fetch job details for this run
-            jobs: list[dict] = []
+            to_render.append((run, local_file))
+
+        # Fetch job details for new/changed runs concurrently
+        async def _fetch_jobs(run: dict) -> list[dict]:
+            async with sem:
+                try:
+                    jobs_data = await self._gh_api_get(
+                        client,
+                        f"{api_base}/actions/runs/{run['id']}/jobs",
+                        token, etags=etags,
+                    )
+                except Exception as e:
+                    logger.warning(
+                        "Failed to fetch jobs for run #%d: %s", run.get("run_number", 0), e,
+                    )
+                    return []
+            retval = (
+                jobs_data.get("jobs", [])
+                if isinstance(jobs_data, dict) else []
+            )
+            return retval
+
+        # GraphQL needs a token; it fetches the jobs of up to
+        # GH_GRAPHQL_RUN_BATCH runs per request. Anything it misses goes to REST.
+        jobs_by_run: dict[int, list[dict]] = {}
+        if token and to_render:
             try:
-                jobs_data = await self._gh_api_get(
-                    client,
-                    f"{api_base}/actions/runs/{run['id']}/jobs",
-                    token,
-                )
-                jobs = (
-                    jobs_data.get("jobs", [])
-                    if isinstance(jobs_data, dict) else []
+                jobs_by_run = await self._gh_graphql_run_jobs(
+                    client, token, [run for run, _ in to_render], sem,
                 )
             except Exception as e:
-                logger.warning(
-                    "Failed to fetch jobs for run #%d: %s", run_number, e,
-                )
+                logger.warning("GraphQL jobs query failed, using REST: %s", e)
+
+        async def _refresh(run: dict, local_file: Path) -> None:
+            jobs = jobs_by_run.get(run["id"])
+            if jobs is None:
+                jobs = await _fetch_jobs(run)
+            await _write_gh_markdown(local_file, _render_gh_run_md(run, jobs), stats)
 
-            md = _render_gh_run_md(run, jobs)
-            local_file.parent.mkdir(parents=True, exist_ok=True)
-            local_file.write_text(md, encoding="utf-8")
-            stats["downloaded"] += 1
+        await asyncio.gather(*(_refresh(run, f) for run, f in to_render))
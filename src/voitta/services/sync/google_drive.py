@@ -3,7 +3,11 @@
 import asyncio
 import json
 import logging
+import os
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timezone
 from pathlib import Path
 from urllib.parse import urlencode
 
@@ -16,6 +20,11 @@ logger = logging.getLogger(__name__)
 GOOGLE_AUTH_URL = "https://accounts.google.com/o/oauth2/v2/auth"
 GOOGLE_TOKEN_URL = "https://oauth2.googleapis.com/token"
 GOOGLE_DRIVE_SCOPE = "https://www.googleapis.com/auth/drive.readonly"
+GOOGLE_DRIVE_FILES_URL = "https://www.googleapis.com/drive/v3/files"
+DRIVE_LIST_CONCURRENCY = 8  # Listing queries in flight; one Drive service per worker thread
+DRIVE_DOWNLOAD_CONCURRENCY = 8  # Files downloaded in parallel during sync
+DRIVE_DOWNLOAD_CHUNK_SIZE = 1 << 20  # Stream downloads to disk 1 MiB at a time
+DRIVE_PARENTS_PER_QUERY = 50  # Folders whose children are fetched by one OR'd query
 
 # Google Workspace native mimeTypes → (virtual_suffix, export_mimeType)
 _GOOGLE_EXPORT_MAP = {
@@ -81,39 +90,35 @@ async def list_root_folders(client_id: str, client_secret: str, refresh_token: s
         access_token = token_resp.json()["access_token"]
 
         headers = {"Authorization": f"Bearer {access_token}"}
-        base_url = "https://www.googleapis.com/drive/v3/files"
+        base_url = GOOGLE_DRIVE_FILES_URL
         base_params = {
             "fields": "files(id,name)",
             "pageSize": "100",
             "orderBy": "name",
         }
 
-        # My Drive root folders
-        resp = await client.get(base_url, headers=headers, params={
-            **base_params,
-            "q": "'root' in parents and mimeType='application/vnd.google-apps.folder' and trashed=false",
-        })
-        if resp.status_code != 200:
-            raise RuntimeError(f"Drive API error: {resp.text[:300]}")
+        # My Drive root folders, shared-with-me folders and Shared Drives
+        # (Team Drives) are independent, so all three are requested at once
+        resp, resp2, resp3 = await asyncio.gather(
+            client.get(base_url, headers=headers, params={
+                **base_params,
+                "q": "'root' in parents and mimeType='application/vnd.google-apps.folder' and trashed=false",
+            }),
+            client.get(base_url, headers=headers, params={
+                **base_params,
+                "q": "sharedWithMe=true and mimeType='application/vnd.google-apps.folder' and trashed=false",
+            }),
+            client.get(
+                "https://www.googleapis.com/drive/v3/drives",
+                headers=headers,
+                params={"pageSize": "100"},
+            ),
+        )
+        for r in (resp, resp2, resp3):
+            if r.status_code != 200:
+                raise RuntimeError(f"Drive API error: {r.text[:300]}")
         my_folders = [{"id": f["id"], "name": f["name"]} for f in resp.json().get("files", [])]
-
-        # Shared with me folders
-        resp2 = await client.get(base_url, headers=headers, params={
-            **base_params,
-            "q": "sharedWithMe=true and mimeType='application/vnd.google-apps.folder' and trashed=false",
-        })
-        if resp2.status_code != 200:
-            raise RuntimeError(f"Drive API error: {resp2.text[:300]}")
         shared_folders = [{"id": f["id"], "name": f["name"]} for f in resp2.json().get("files", [])]
-
-        # Shared Drives (Team Drives)
-        resp3 = await client.get(
-            "https://www.googleapis.com/drive/v3/drives",
-            headers=headers,
-            params={"pageSize": "100"},
-        )
-        if resp3.status_code != 200:
-            raise RuntimeError(f"Drive API error: {resp3.text[:300]}")
         shared_drives = [{"id": d["id"], "name": d["name"]} for d in resp3.json().get("drives", [])]
 
         return {"folders": my_folders, "shared_folders": shared_folders, "shared_drives": shared_drives}
@@ -153,8 +158,18 @@ async def exchange_code_for_tokens(
 
 class GoogleDriveConnector(BaseSyncConnector):
 
+    download_concurrency = DRIVE_DOWNLOAD_CONCURRENCY
+
     # In-memory token cache: folder_path -> (access_token, expires_at)
     _token_cache: dict[str, tuple[str, float]] = {}
+    # Service-account token cache: folder_path -> (access_token, expires_at)
+    _sa_token_cache: dict[str, tuple[str, float]] = {}
+    # One lock per folder so concurrent callers share a single refresh
+    _refresh_locks: dict[str, asyncio.Lock] = {}
+    # Per-thread (access_token, Drive service), see _build_service
+    _thread_services = threading.local()
+    # (parent_id, name) -> child id, for path-based downloads outside sync()
+    _id_cache: dict[tuple[str, str], str] = {}
 
     async def _get_access_token(self, source) -> str:
         """Get an OAuth access token, refreshing if needed."""
@@ -163,35 +178,55 @@ class GoogleDriveConnector(BaseSyncConnector):
                 "Google Drive not connected. Click 'Connect' to sign in via browser."
             )
 
-        # Check memory cache
+        token = self._cached_access_token(source)
+        if token:
+            return token
+
+        lock = self._refresh_locks.setdefault(source.folder_path, asyncio.Lock())
+        async with lock:
+            # Another caller may have refreshed while we waited
+            token = self._cached_access_token(source)
+            if token:
+                return token
+            return await self._refresh_access_token(source)
+
+    def _cached_access_token(self, source) -> str | None:
+        """Return a still-valid token from memory or the source row, if any."""
         cached = self._token_cache.get(source.folder_path)
         if cached:
             token, expires_at = cached
             if time.time() < expires_at - 60:
                 return token
-
-        async with httpx.AsyncClient() as client:
-            resp = await client.post(
-                GOOGLE_TOKEN_URL,
-                data={
-                    "grant_type": "refresh_token",
-                    "client_id": source.gd_client_id,
-                    "client_secret": source.gd_client_secret,
-                    "refresh_token": source.gd_refresh_token,
-                },
+        expires_at = source.gd_access_token_expires_at
+        if source.gd_access_token and expires_at and time.time() < expires_at - 60:
+            self._token_cache[source.folder_path] = (source.gd_access_token, expires_at)
+            return source.gd_access_token
+        return None
+
+    async def _refresh_access_token(self, source) -> str:
+        """Exchange the refresh token for a new access token and cache it."""
+        client = await self._get_client()
+        resp = await client.post(
+            GOOGLE_TOKEN_URL,
+            data={
+                "grant_type": "refresh_token",
+                "client_id": source.gd_client_id,
+                "client_secret": source.gd_client_secret,
+                "refresh_token": source.gd_refresh_token,
+            },
+        )
+        if resp.status_code != 200:
+            try:
+                body = resp.json()
+                error_desc = body.get("error_description", body.get("error", ""))
+            except Exception:
+                error_desc = resp.text[:500]
+            raise RuntimeError(
+                f"Google token refresh failed ({resp.status_code}): {error_desc}. "
+                "Try reconnecting Google Drive."
             )
-            if resp.status_code != 200:
-                try:
-                    body = resp.json()
-                    error_desc = body.get("error_description", body.get("error", ""))
-                except Exception:
-                    error_desc = resp.text[:500]
-                raise RuntimeError(
-                    f"Google token refresh failed ({resp.status_code}): {error_desc}. "
-                    "Try reconnecting Google Drive."
-                )
 
-            data = resp.json()
+        data = resp.json()
 
         # Google may rotate the refresh token (rare, but handle it)
         new_refresh = data.get("refresh_token")
@@ -200,58 +235,125 @@ class GoogleDriveConnector(BaseSyncConnector):
             logger.info("Google refresh token rotated for %s", source.folder_path)
 
         access_token = data["access_token"]
-        expires_in = data.get("expires_in", 3600)
-        self._token_cache[source.folder_path] = (access_token, time.time() + expires_in)
+        expires_at = time.time() + data.get("expires_in", 3600)
+        self._token_cache[source.folder_path] = (access_token, expires_at)
+        source.gd_access_token = access_token
+        source.gd_access_token_expires_at = expires_at
 
         return access_token
 
-    def _get_service_sa(self, source):
-        """Build Drive service using service account credentials."""
+    async def _get_sa_access_token(self, source) -> str:
+        """Get a service-account access token, minting a new one if needed."""
+        cached = self._sa_token_cache.get(source.folder_path)
+        if cached and time.time() < cached[1] - 60:
+            return cached[0]
+
+        lock = self._refresh_locks.setdefault(source.folder_path, asyncio.Lock())
+        async with lock:
+            cached = self._sa_token_cache.get(source.folder_path)
+            if cached and time.time() < cached[1] - 60:
+                return cached[0]
+            token, expires_at = await asyncio.to_thread(self._mint_sa_token, source)
+            self._sa_token_cache[source.folder_path] = (token, expires_at)
+            return token
+
+    def _mint_sa_token(self, source) -> tuple[str, float]:
+        """Exchange a JWT signed with the service account key for an access token."""
+        from google.auth.transport.requests import Request
         from google.oauth2.service_account import Credentials
-        from googleapiclient.discovery import build
 
         creds_info = json.loads(source.gd_service_account_json)
         creds = Credentials.from_service_account_info(
             creds_info, scopes=[GOOGLE_DRIVE_SCOPE]
         )
-        return build("drive", "v3", credentials=creds)
+        creds.refresh(Request())
+        # google-auth reports expiry as a naive UTC datetime
+        expires_at = creds.expiry.replace(tzinfo=timezone.utc).timestamp()
+        return creds.token, expires_at
+
+    def _build_service(self, access_token: str):
+        """Return this thread's Drive service for an access token, building it once.
+
+        googleapiclient services are not thread-safe, so each thread keeps its
+        own; it is rebuilt only when the token changes.
+        """
+        cached = getattr(self._thread_services, "entry", None)
+        if cached and cached[0] == access_token:
+            return cached[1]
 
-    def _get_service_oauth(self, access_token: str):
-        """Build Drive service using an OAuth access token."""
         from google.oauth2.credentials import Credentials
         from googleapiclient.discovery import build
 
         creds = Credentials(token=access_token)
-        return build("drive", "v3", credentials=creds)
+        # The Drive v3 discovery document ships with the client library
+        service = build("drive", "v3", credentials=creds, cache_discovery=False)
+        self._thread_services.entry = (access_token, service)
+        return service
 
-    async def _get_service(self, source):
-        """Dispatch: OAuth (if refresh_token) or service account."""
+    async def _service_factory(self, source):
+        """Return a zero-argument callable giving the calling thread a Drive service.
+
+        Service accounts use the same token-based service as OAuth, so the key
+        is only parsed and signed when a new token is minted.
+        """
         if source.gd_refresh_token:
             token = await self._get_access_token(source)
-            return self._get_service_oauth(token)
         elif source.gd_service_account_json:
-            return self._get_service_sa(source)
+            token = await self._get_sa_access_token(source)
         else:
             raise RuntimeError(
                 "Google Drive not configured. Provide OAuth credentials or a service account."
             )
+        return lambda: self._build_service(token)
 
     async def list_files(self, source) -> list[RemoteFile]:
-        service = await self._get_service(source)
+        make_service = await self._service_factory(source)
         files: list[RemoteFile] = []
         await asyncio.to_thread(
-            self._list_recursive_sync, service, source.gd_folder_id, "", files
+            self._list_tree_sync, make_service, source.gd_folder_id, files
         )
         return files
 
-    def _list_recursive_sync(self, service, folder_id, current_path, files):
+    def _list_tree_sync(self, make_service, root_folder_id, files):
+        """Breadth-first listing of the tree under root_folder_id.
+
+        Each level's folders are fetched in OR'd batches of
+        DRIVE_PARENTS_PER_QUERY, with the batches running in parallel.
+        """
+        def _list_batch(folders: list[tuple[str, str]]):
+            return self._list_folders_sync(make_service(), folders)
+
+        with ThreadPoolExecutor(max_workers=DRIVE_LIST_CONCURRENCY) as pool:
+            level = [(root_folder_id, "")]
+            while level:
+                batches = [
+                    level[i:i + DRIVE_PARENTS_PER_QUERY]
+                    for i in range(0, len(level), DRIVE_PARENTS_PER_QUERY)
+                ]
+                next_level: list[tuple[str, str]] = []
+                for subfolders, folder_files in pool.map(_list_batch, batches):
+                    next_level.extend(subfolders)
+                    files.extend(folder_files)
+                level = next_level
+
+    def _list_folders_sync(self, service, folders):
+        """List the children of several folders with one query.
+
+        ``folders`` is a list of (folder_id, path); returns (subfolders as
+        (id, path), files). Each child's ``parents`` says which folder(s) it
+        was listed for.
+        """
+        path_by_id = dict(folders)
+        parents_q = " or ".join(f"'{folder_id}' in parents" for folder_id in path_by_id)
+        subfolders: list[tuple[str, str]] = []
+        files: list[RemoteFile] = []
         page_token = None
         while True:
             results = (
                 service.files()
                 .list(
-                    q=f"'{folder_id}' in parents and trashed = false",
-                    fields="nextPageToken, files(id, name, mimeType, size, modifiedTime, createdTime, md5Checksum)",
+                    q=f"({parents_q}) and trashed = false",
+                    fields="nextPageToken, files(id, name, mimeType, size, modifiedTime, createdTime, md5Checksum, parents)",
                     pageSize=1000,
                     pageToken=page_token,
                     supportsAllDrives=True,
@@ -261,88 +363,133 @@ class GoogleDriveConnector(BaseSyncConnector):
             )
 
             for item in results.get("files", []):
-                mime = item["mimeType"]
-                item_path = f"{current_path}/{item['name']}" if current_path else item["name"]
-                if mime == "application/vnd.google-apps.folder":
-                    self._list_recursive_sync(service, item["id"], item_path, files)
-                elif mime in _GOOGLE_EXPORT_MAP:
-                    suffix, _ = _GOOGLE_EXPORT_MAP[mime]
-                    url_template = _GOOGLE_URL_MAP.get(mime)
-                    source_url = url_template.format(file_id=item["id"]) if url_template else None
-                    files.append(
-                        RemoteFile(
-                            remote_path=item_path + suffix,
-                            size=0,  # native Google files have no size
-                            modified_at=item.get("modifiedTime", ""),
-                            content_hash=None,
-                            created_at=item.get("createdTime", ""),
-                            source_url=source_url,
-                        )
-                    )
-                elif mime.startswith("application/vnd.google-apps."):
-                    # Skip other Google-native types (forms, sites, maps, etc.)
-                    continue
-                else:
-                    files.append(
-                        RemoteFile(
-                            remote_path=item_path,
-                            size=int(item.get("size", 0)),
-                            modified_at=item.get("modifiedTime", ""),
-                            content_hash=item.get("md5Checksum"),
-                            created_at=item.get("createdTime", ""),
-                        )
-                    )
+                for parent_id in item.get("parents") or ():
+                    current_path = path_by_id.get(parent_id)
+                    if current_path is not None:
+                        self._add_listed_item(item, current_path, subfolders, files)
 
             page_token = results.get("nextPageToken")
             if not page_token:
                 break
+        return subfolders, files
+
+    @staticmethod
+    def _add_listed_item(item, current_path, subfolders, files):
+        """Route one listed Drive item to subfolders or files (or skip it)."""
+        mime = item["mimeType"]
+        item_path = f"{current_path}/{item['name']}" if current_path else item["name"]
+        if mime == "application/vnd.google-apps.folder":
+            subfolders.append((item["id"], item_path))
+        elif mime in _GOOGLE_EXPORT_MAP:
+            suffix, _ = _GOOGLE_EXPORT_MAP[mime]
+            url_template = _GOOGLE_URL_MAP.get(mime)
+            source_url = url_template.format(file_id=item["id"]) if url_template else None
+            files.append(
+                RemoteFile(
+                    remote_path=item_path + suffix,
+                    size=0,  # native Google files have no size
+                    modified_at=item.get("modifiedTime", ""),
+                    content_hash=None,
+                    created_at=item.get("createdTime", ""),
+                    source_url=source_url,
+                    source_id=item["id"],
+                )
+            )
+        elif mime.startswith("application/vnd.google-apps."):
+            # Skip other Google-native types (forms, sites, maps, etc.)
+            return
+        else:
+            files.append(
+                RemoteFile(
+                    remote_path=item_path,
+                    size=int(item.get("size", 0)),
+                    modified_at=item.get("modifiedTime", ""),
+                    content_hash=item.get("md5Checksum"),
+                    created_at=item.get("createdTime", ""),
+                    source_id=item["id"],
+                )
+            )
 
-    async def download_file(self, source, remote_path: str, local_path: Path) -> None:
-        service = await self._get_service(source)
-
-        # Detect Google Workspace export files by their virtual suffix
-        export_mime = None
-        resolve_path = remote_path
+    @staticmethod
+    def _split_export_suffix(remote_path: str) -> tuple[str, str | None]:
+        """Strip a Workspace export suffix, returning (drive_path, export_mime)."""
         for suffix, mime in _EXPORT_SUFFIXES.items():
             if remote_path.endswith(suffix):
-                export_mime = mime
-                resolve_path = remote_path[: -len(suffix)]
-                break
+                return remote_path[: -len(suffix)], mime
+        return remote_path, None
 
+    async def download_file(self, source, remote_path: str, local_path: Path) -> None:
+        make_service = await self._service_factory(source)
+        resolve_path, export_mime = self._split_export_suffix(remote_path)
+        # The service is fetched on the worker thread that uses it
         file_id = await asyncio.to_thread(
-            self._resolve_file_id, service, source.gd_folder_id, resolve_path
+            lambda: self._resolve_file_id(make_service(), source.gd_folder_id, resolve_path)
         )
+        await self._download_by_id(source, file_id, export_mime, local_path)
 
-        if export_mime:
-            def _export():
-                from googleapiclient.http import MediaIoBaseDownload
-
-                request = service.files().export_media(fileId=file_id, mimeType=export_mime)
-                with open(local_path, "wb") as f:
-                    downloader = MediaIoBaseDownload(f, request)
-                    done = False
-                    while not done:
-                        _, done = downloader.next_chunk()
-
-            await asyncio.to_thread(_export)
+    async def _download_remote_file(self, source, rf: RemoteFile, local_path: Path) -> None:
+        if rf.source_id:
+            _, export_mime = self._split_export_suffix(rf.remote_path)
+            await self._download_by_id(source, rf.source_id, export_mime, local_path)
         else:
-            def _download():
-                from googleapiclient.http import MediaIoBaseDownload
+            await self.download_file(source, rf.remote_path, local_path)
 
-                request = service.files().get_media(fileId=file_id, supportsAllDrives=True)
-                with open(local_path, "wb") as f:
-                    downloader = MediaIoBaseDownload(f, request)
-                    done = False
-                    while not done:
-                        _, done = downloader.next_chunk()
-
-            await asyncio.to_thread(_download)
+    async def _download_by_id(
+        self, source, file_id: str, export_mime: str | None, local_path: Path
+    ) -> None:
+        # Both auth modes stream straight from the REST endpoint on the pooled client
+        if source.gd_refresh_token:
+            token = await self._get_access_token(source)
+        elif source.gd_service_account_json:
+            token = await self._get_sa_access_token(source)
+        else:
+            raise RuntimeError(
+                "Google Drive not configured. Provide OAuth credentials or a service account."
+            )
+        if export_mime:
+            url = f"{GOOGLE_DRIVE_FILES_URL}/{file_id}/export"
+            params = {"mimeType": export_mime}
+        else:
+            url = f"{GOOGLE_DRIVE_FILES_URL}/{file_id}"
+            params = {"alt": "media", "supportsAllDrives": "true"}
+        await self._stream_download(token, url, params, local_path)
+
+    async def _stream_download(
+        self, token: str, url: str, params: dict, local_path: Path
+    ) -> None:
+        """Stream a Drive download into place via a temp file (one GET, no ranges)."""
+        client = await self._get_client()
+        async with client.stream(
+            "GET", url, params=params,
+            headers={"Authorization": f"Bearer {token}"},
+            follow_redirects=True,
+            timeout=120.0,
+        ) as resp:
+            if resp.status_code != 200:
+                await resp.aread()
+                raise RuntimeError(
+                    f"Google Drive download failed ({resp.status_code}): {resp.text[:500]}"
+                )
+            tmp_path = local_path.with_name(local_path.name + ".tmp")
+            try:
+                with open(tmp_path, "wb") as f:
+                    async for chunk in resp.aiter_bytes(DRIVE_DOWNLOAD_CHUNK_SIZE):
+                        await asyncio.to_thread(f.write, chunk)
+                os.replace(tmp_path, local_path)
+            except BaseException:
+                tmp_path.unlink(missing_ok=True)
+                raise
 
     def _resolve_file_id(self, service, root_folder_id, remote_path):
         """Walk path segments to find the file's Drive ID."""
         parts = remote_path.split("/")
         current_parent = root_folder_id
         for part in parts:
+            key = (current_parent, part)
+            cached = self._id_cache.get(key)
+            if cached:
+                current_parent = cached
+                continue
             escaped = part.replace("'", "\\'")
             results = (
                 service.files()
@@ -359,4 +506,5 @@ class GoogleDriveConnector(BaseSyncConnector):
             if not found:
                 raise FileNotFoundError(f"Remote path not found: {remote_path}")
             current_parent = found[0]["id"]
+            self._id_cache[key] = current_parent
         return current_parent
@@ -1,7 +1,9 @@
 """Jira sync connector - Issues, boards, and sprints from Jira Cloud and Server/Data Center."""
 
+import asyncio
 import base64
 import hashlib
+import io
 import json
 import logging
 import re
@@ -10,10 +12,12 @@ from urllib.parse import urlparse
 
 import httpx
 
-from .base import BaseSyncConnector, RemoteFile
+from .base import BaseSyncConnector, RemoteFile, sanitize_filename
 
 logger = logging.getLogger(__name__)
 
+JIRA_DOWNLOAD_CONCURRENCY = 8  # Max issues fetched in parallel during sync
+
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -43,14 +47,6 @@ def _parse_jira_url(url: str) -> tuple[str, str]:
     return base_url, project_key
 
 
-def _sanitize_filename(name: str) -> str:
-    """Sanitize a string for use as a filename/path component."""
-    sanitized = re.sub(r'[<>:"/\\|?*]', "-", name)
-    sanitized = re.sub(r"\s+", "-", sanitized)
-    sanitized = re.sub(r"-{2,}", "-", sanitized)
-    return sanitized.strip("-")[:100]
-
-
 def _format_custom_value(value) -> str:
     """Format an arbitrary Jira field value for markdown display."""
     if value is None:
@@ -148,112 +144,110 @@ def _render_issue_md(
         consumed_custom.add(sp_field_id)
 
     # ----- Build markdown -----
-    lines: list[str] = []
-    lines.append(f"# [{key}] {summary}\n")
-
-    # Metadata table
-    lines.append("| Field | Value |")
-    lines.append("|---|---|")
-    lines.append(f"| Type | {issue_type} |")
-    lines.append(f"| Status | {status} |")
-    lines.append(f"| Priority | {priority} |")
+    buf = io.StringIO()
+    write = buf.write
+    write(
+        f"# [{key}] {summary}\n\n"
+        # Metadata table
+        "| Field | Value |\n"
+        "|---|---|\n"
+        f"| Type | {issue_type} |\n"
+        f"| Status | {status} |\n"
+        f"| Priority | {priority} |\n"
+    )
     if resolution:
-        lines.append(f"| Resolution | {resolution} |")
+        write(f"| Resolution | {resolution} |\n")
     if resolution_date:
-        lines.append(f"| Resolution Date | {resolution_date} |")
-    lines.append(f"| Assignee | {assignee} |")
-    lines.append(f"| Reporter | {reporter} |")
-    lines.append(f"| Created | {created} |")
-    lines.append(f"| Updated | {updated} |")
+        write(f"| Resolution Date | {resolution_date} |\n")
+    write(
+        f"| Assignee | {assignee} |\n"
+        f"| Reporter | {reporter} |\n"
+        f"| Created | {created} |\n"
+        f"| Updated | {updated} |\n"
+    )
     if due_date:
-        lines.append(f"| Due Date | {due_date} |")
+        write(f"| Due Date | {due_date} |\n")
     if labels:
-        lines.append(f"| Labels | {', '.join(labels)} |")
+        write(f"| Labels | {', '.join(labels)} |\n")
     if components:
-        lines.append(f"| Components | {', '.join(components)} |")
+        write(f"| Components | {', '.join(components)} |\n")
     if epic_link:
-        lines.append(f"| Epic | {epic_link} |")
+        write(f"| Epic | {epic_link} |\n")
     if sprint_value:
-        lines.append(f"| Sprint | {sprint_value} |")
+        write(f"| Sprint | {sprint_value} |\n")
     if story_points:
-        lines.append(f"| Story Points | {story_points} |")
+        write(f"| Story Points | {story_points} |\n")
     if fix_versions:
-        lines.append(f"| Fix Version/s | {', '.join(fix_versions)} |")
+        write(f"| Fix Version/s | {', '.join(fix_versions)} |\n")
     if affects_versions:
-        lines.append(f"| Affects Version/s | {', '.join(affects_versions)} |")
+        write(f"| Affects Version/s | {', '.join(affects_versions)} |\n")
     if time_tracking:
         if time_tracking.get("originalEstimate"):
-            lines.append(f"| Original Estimate | {time_tracking['originalEstimate']} |")
+            write(f"| Original Estimate | {time_tracking['originalEstimate']} |\n")
         if time_tracking.get("remainingEstimate"):
-            lines.append(f"| Remaining Estimate | {time_tracking['remainingEstimate']} |")
+            write(f"| Remaining Estimate | {time_tracking['remainingEstimate']} |\n")
         if time_tracking.get("timeSpent"):
-            lines.append(f"| Time Spent | {time_tracking['timeSpent']} |")
+            write(f"| Time Spent | {time_tracking['timeSpent']} |\n")
     if isinstance(votes, dict) and votes.get("votes", 0) > 0:
-        lines.append(f"| Votes | {votes['votes']} |")
+        write(f"| Votes | {votes['votes']} |\n")
     if isinstance(watches, dict) and watches.get("watchCount", 0) > 0:
-        lines.append(f"| Watchers | {watches['watchCount']} |")
+        write(f"| Watchers | {watches['watchCount']} |\n")
     if isinstance(security, dict) and security.get("name"):
-        lines.append(f"| Security Level | {security['name']} |")
-    lines.append("")
+        write(f"| Security Level | {security['name']} |\n")
+    write("\n")
 
     # Environment
     if environment:
-        lines.append("## Environment\n")
-        lines.append(environment)
-        lines.append("")
+        write(f"## Environment\n\n{environment}\n\n")
 
     # Description
     description = fields.get("description") or ""
     if description:
-        lines.append("## Description\n")
-        lines.append(description)
-        lines.append("")
+        write(f"## Description\n\n{description}\n\n")
 
     # Comments
     comments_data = fields.get("comment", {})
     comments = comments_data.get("comments", []) if isinstance(comments_data, dict) else []
     if comments:
-        lines.append("## Comments\n")
+        write("## Comments\n\n")
         for comment in comments:
             author = (comment.get("author") or {}).get("displayName", "Unknown")
             date = (comment.get("created") or "")[:10]
             body = comment.get("body", "")
-            lines.append(f"### {author} ({date})\n")
-            lines.append(body)
-            lines.append("")
+            write(f"### {author} ({date})\n\n{body}\n\n")
 
     # Work log
     worklog_data = fields.get("worklog", {})
     worklogs = worklog_data.get("worklogs", []) if isinstance(worklog_data, dict) else []
     if worklogs:
-        lines.append("## Work Log\n")
+        write("## Work Log\n\n")
         for wl in worklogs:
             wl_author = (wl.get("author") or {}).get("displayName", "Unknown")
             wl_date = (wl.get("started") or "")[:10]
             wl_time = wl.get("timeSpent", "")
             wl_comment = wl.get("comment", "")
-            entry = f"- **{wl_author}** ({wl_date}): {wl_time}"
+            write(f"- **{wl_author}** ({wl_date}): {wl_time}")
             if wl_comment:
-                entry += f" — {wl_comment}"
-            lines.append(entry)
-        lines.append("")
+                write(f" — {wl_comment}")
+            write("\n")
+        write("\n")
 
     # Attachments (as links)
     attachments = fields.get("attachment") or []
     if attachments:
-        lines.append("## Attachments\n")
+        write("## Attachments\n\n")
         for att in attachments:
             name = att.get("filename", "attachment")
             url = att.get("content", "")
             size = att.get("size", 0)
             size_kb = size // 1024 if size else 0
-            lines.append(f"- [{name}]({url}) ({size_kb} KB)")
-        lines.append("")
+            write(f"- [{name}]({url}) ({size_kb} KB)\n")
+        write("\n")
 
     # Issue links
     issue_links = fields.get("issuelinks") or []
     if issue_links:
-        lines.append("## Related Issues\n")
+        write("## Related Issues\n\n")
         for link in issue_links:
             if link.get("outwardIssue"):
                 related = link["outwardIssue"]
@@ -265,24 +259,24 @@ def _render_issue_md(
                 continue
             related_key = related.get("key", "")
             related_summary = (related.get("fields") or {}).get("summary", "")
-            lines.append(f"- {direction}: [{related_key}] {related_summary}")
-        lines.append("")
+            write(f"- {direction}: [{related_key}] {related_summary}\n")
+        write("\n")
 
     # Subtasks
     subtasks = fields.get("subtasks") or []
     if subtasks:
-        lines.append("## Subtasks\n")
+        write("## Subtasks\n\n")
         for subtask in subtasks:
             st_key = subtask.get("key", "")
             st_summary = (subtask.get("fields") or {}).get("summary", "")
             st_status = ((subtask.get("fields") or {}).get("status") or {}).get("name", "")
-            lines.append(f"- [{st_key}] {st_summary} ({st_status})")
-        lines.append("")
+            write(f"- [{st_key}] {st_summary} ({st_status})\n")
+        write("\n")
 
     # Change history
     history_entries = changelog.get("histories", []) if isinstance(changelog, dict) else []
     if history_entries:
-        lines.append("## Change History\n")
+        write("## Change History\n\n")
         for entry in history_entries:
             ch_author = (entry.get("author") or {}).get("displayName", "Unknown")
             ch_date = (entry.get("created") or "")[:16].replace("T", " ")
@@ -290,14 +284,14 @@ def _render_issue_md(
                 field_name = item.get("field", "")
                 from_val = item.get("fromString", "") or ""
                 to_val = item.get("toString", "") or ""
-                lines.append(
+                write(
                     f"- {ch_date} **{ch_author}** changed **{field_name}**: "
-                    f"{from_val} \u2192 {to_val}"
+                    f"{from_val} \u2192 {to_val}\n"
                 )
-        lines.append("")
+        write("\n")
 
     # Remaining custom fields (catch-all)
-    custom_lines: list[str] = []
+    custom_header = False
     for fname, fvalue in fields.items():
         if not fname.startswith("customfield_"):
             continue
@@ -307,16 +301,15 @@ def _render_issue_md(
             continue
         formatted = _format_custom_value(fvalue)
         if formatted:
-            custom_lines.append(f"| {fname} | {formatted} |")
+            if not custom_header:
+                write("## Custom Fields\n\n| Field | Value |\n|---|---|\n")
+                custom_header = True
+            write(f"| {fname} | {formatted} |\n")
+    if custom_header:
+        write("\n")
 
-    if custom_lines:
-        lines.append("## Custom Fields\n")
-        lines.append("| Field | Value |")
-        lines.append("|---|---|")
-        lines.extend(custom_lines)
-        lines.append("")
-
-    return "\n".join(lines)
+    # Every section ends with a blank line; drop the final separator
+    return buf.getvalue()[:-1]
 
 
 # ---------------------------------------------------------------------------
@@ -424,24 +417,24 @@ class JiraConnector(BaseSyncConnector):
         mapping: dict[str, str] = {}
 
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                resp = await client.get(f"{base}/field", headers=headers)
-                if resp.status_code != 200:
-                    logger.warning("Could not fetch Jira field list: %s", resp.status_code)
-                    return mapping
-
-                for field_def in resp.json():
-                    fid = field_def.get("id", "")
-                    name = (field_def.get("name") or "").lower()
-                    schema = field_def.get("schema", {})
-                    custom_type = schema.get("custom", "")
-
-                    if "sprint" in name or "gh-sprint" in custom_type:
-                        mapping["sprint"] = fid
-                    elif name in ("story points", "story point estimate") or "story-points" in custom_type:
-                        mapping["story_points"] = fid
-                    elif name == "epic link" and fid.startswith("customfield_"):
-                        mapping["epic"] = fid
+            client = await self._get_client()
+            resp = await client.get(f"{base}/field", headers=headers)
+            if resp.status_code != 200:
+                logger.warning("Could not fetch Jira field list: %s", resp.status_code)
+                return mapping
+
+            for field_def in resp.json():
+                fid = field_def.get("id", "")
+                name = (field_def.get("name") or "").lower()
+                schema = field_def.get("schema", {})
+                custom_type = schema.get("custom", "")
+
+                if "sprint" in name or "gh-sprint" in custom_type:
+                    mapping["sprint"] = fid
+                elif name in ("story points", "story point estimate") or "story-points" in custom_type:
+                    mapping["story_points"] = fid
+                elif name == "epic link" and fid.startswith("customfield_"):
+                    mapping["epic"] = fid
         except Exception as e:
             logger.warning("Field discovery failed: %s", e)
 
@@ -457,156 +450,156 @@ class JiraConnector(BaseSyncConnector):
         count = 0
 
         try:
-            async with httpx.AsyncClient(timeout=60.0) as client:
-                # List boards for the project(s)
-                board_params = {"maxResults": 50}
-                project_val = (source.jira_project or "").strip()
-                if project_val and project_val != "*" and "," not in project_val:
-                    board_params["projectKeyOrId"] = project_val
-                boards_resp = await client.get(
-                    f"{agile}/board",
-                    params=board_params,
-                    headers=headers,
+            client = await self._get_client()
+            # List boards for the project(s)
+            board_params = {"maxResults": 50}
+            project_val = (source.jira_project or "").strip()
+            if project_val and project_val != "*" and "," not in project_val:
+                board_params["projectKeyOrId"] = project_val
+            boards_resp = await client.get(
+                f"{agile}/board",
+                params=board_params,
+                headers=headers,
+            )
+            if boards_resp.status_code != 200:
+                logger.warning(
+                    "Agile board API unavailable (%s): %s",
+                    boards_resp.status_code,
+                    boards_resp.text[:200],
                 )
-                if boards_resp.status_code != 200:
-                    logger.warning(
-                        "Agile board API unavailable (%s): %s",
-                        boards_resp.status_code,
-                        boards_resp.text[:200],
+                return 0
+
+            boards = boards_resp.json().get("values", [])
+
+            for board in boards:
+                board_id = board.get("id")
+                board_name = board.get("name", f"Board-{board_id}")
+                board_type = board.get("type", "unknown")
+                safe_name = sanitize_filename(board_name)
+
+                # Fetch sprints for this board
+                sprints: list[dict] = []
+                sprint_start = 0
+                while True:
+                    sp_resp = await client.get(
+                        f"{agile}/board/{board_id}/sprint",
+                        params={"startAt": sprint_start, "maxResults": 50},
+                        headers=headers,
                     )
-                    return 0
-
-                boards = boards_resp.json().get("values", [])
-
-                for board in boards:
-                    board_id = board.get("id")
-                    board_name = board.get("name", f"Board-{board_id}")
-                    board_type = board.get("type", "unknown")
-                    safe_name = _sanitize_filename(board_name)
-
-                    # Fetch sprints for this board
-                    sprints: list[dict] = []
-                    sprint_start = 0
-                    while True:
-                        sp_resp = await client.get(
-                            f"{agile}/board/{board_id}/sprint",
-                            params={"startAt": sprint_start, "maxResults": 50},
-                            headers=headers,
+                    if sp_resp.status_code != 200:
+                        break  # Kanban boards may not support sprints
+                    sp_data = sp_resp.json()
+                    batch = sp_data.get("values", [])
+                    sprints.extend(batch)
+                    if sp_data.get("isLast", True) or not batch:
+                        break
+                    sprint_start += len(batch)
+
+                # Write board summary file
+                board_dir = local_root / "boards"
+                board_dir.mkdir(parents=True, exist_ok=True)
+                board_file = board_dir / f"{board_id}-{safe_name}.md"
+
+                blines = [
+                    f"# Board: {board_name}\n",
+                    "| Field | Value |",
+                    "|---|---|",
+                    f"| ID | {board_id} |",
+                    f"| Type | {board_type} |",
+                    f"| Project | {source.jira_project} |",
+                    "",
+                ]
+
+                if sprints:
+                    blines.append("## Sprints\n")
+                    blines.append("| Sprint | State | Start | End | Goal |")
+                    blines.append("|---|---|---|---|---|")
+                    for sp in sprints:
+                        sp_name = sp.get("name", "")
+                        sp_state = sp.get("state", "")
+                        sp_start = (sp.get("startDate") or "")[:10]
+                        sp_end = (sp.get("endDate") or "")[:10]
+                        sp_goal = (sp.get("goal") or "").replace("|", "/").replace("\n", " ")
+                        blines.append(
+                            f"| {sp_name} | {sp_state} | {sp_start} | {sp_end} | {sp_goal} |"
                         )
-                        if sp_resp.status_code != 200:
-                            break  # Kanban boards may not support sprints
-                        sp_data = sp_resp.json()
-                        batch = sp_data.get("values", [])
-                        sprints.extend(batch)
-                        if sp_data.get("isLast", True) or not batch:
-                            break
-                        sprint_start += len(batch)
-
-                    # Write board summary file
-                    board_dir = local_root / "boards"
-                    board_dir.mkdir(parents=True, exist_ok=True)
-                    board_file = board_dir / f"{board_id}-{safe_name}.md"
-
-                    blines = [
-                        f"# Board: {board_name}\n",
-                        "| Field | Value |",
-                        "|---|---|",
-                        f"| ID | {board_id} |",
-                        f"| Type | {board_type} |",
-                        f"| Project | {source.jira_project} |",
-                        "",
-                    ]
-
-                    if sprints:
-                        blines.append("## Sprints\n")
-                        blines.append("| Sprint | State | Start | End | Goal |")
-                        blines.append("|---|---|---|---|---|")
-                        for sp in sprints:
-                            sp_name = sp.get("name", "")
-                            sp_state = sp.get("state", "")
-                            sp_start = (sp.get("startDate") or "")[:10]
-                            sp_end = (sp.get("endDate") or "")[:10]
-                            sp_goal = (sp.get("goal") or "").replace("|", "/").replace("\n", " ")
-                            blines.append(
-                                f"| {sp_name} | {sp_state} | {sp_start} | {sp_end} | {sp_goal} |"
-                            )
-                        blines.append("")
-
-                    board_file.write_text("\n".join(blines), encoding="utf-8")
-                    count += 1
-
-                    # Write individual sprint files with issue lists
-                    if sprints:
-                        sprint_dir = local_root / "sprints"
-                        sprint_dir.mkdir(parents=True, exist_ok=True)
-
-                        for sp in sprints:
-                            sp_id = sp.get("id")
-                            sp_name = sp.get("name", f"Sprint-{sp_id}")
-                            sp_state = sp.get("state", "")
-                            sp_start = (sp.get("startDate") or "")[:10]
-                            sp_end = (sp.get("endDate") or "")[:10]
-                            sp_complete = (sp.get("completeDate") or "")[:10]
-                            sp_goal = sp.get("goal") or ""
-                            safe_sp = _sanitize_filename(sp_name)
-
-                            slines = [
-                                f"# Sprint: {sp_name}\n",
-                                "| Field | Value |",
-                                "|---|---|",
-                                f"| ID | {sp_id} |",
-                                f"| Board | {board_name} |",
-                                f"| State | {sp_state} |",
-                                f"| Start Date | {sp_start} |",
-                                f"| End Date | {sp_end} |",
-                            ]
-                            if sp_complete:
-                                slines.append(f"| Completed | {sp_complete} |")
+                    blines.append("")
+
+                board_file.write_text("\n".join(blines), encoding="utf-8")
+                count += 1
+
+                # Write individual sprint files with issue lists
+                if sprints:
+                    sprint_dir = local_root / "sprints"
+                    sprint_dir.mkdir(parents=True, exist_ok=True)
+
+                    for sp in sprints:
+                        sp_id = sp.get("id")
+                        sp_name = sp.get("name", f"Sprint-{sp_id}")
+                        sp_state = sp.get("state", "")
+                        sp_start = (sp.get("startDate") or "")[:10]
+                        sp_end = (sp.get("endDate") or "")[:10]
+                        sp_complete = (sp.get("completeDate") or "")[:10]
+                        sp_goal = sp.get("goal") or ""
+                        safe_sp = sanitize_filename(sp_name)
+
+                        slines = [
+                            f"# Sprint: {sp_name}\n",
+                            "| Field | Value |",
+                            "|---|---|",
+                            f"| ID | {sp_id} |",
+                            f"| Board | {board_name} |",
+                            f"| State | {sp_state} |",
+                            f"| Start Date | {sp_start} |",
+                            f"| End Date | {sp_end} |",
+                        ]
+                        if sp_complete:
+                            slines.append(f"| Completed | {sp_complete} |")
+                        slines.append("")
+
+                        if sp_goal:
+                            slines.append("## Goal\n")
+                            slines.append(sp_goal)
                             slines.append("")
 
-                            if sp_goal:
-                                slines.append("## Goal\n")
-                                slines.append(sp_goal)
-                                slines.append("")
-
-                            # Fetch issues in this sprint
-                            try:
-                                issues_resp = await client.get(
-                                    f"{agile}/sprint/{sp_id}/issue",
-                                    params={
-                                        "maxResults": 200,
-                                        "fields": "key,summary,status,assignee,issuetype",
-                                    },
-                                    headers=headers,
-                                )
-                                if issues_resp.status_code == 200:
-                                    sp_issues = issues_resp.json().get("issues", [])
-                                    if sp_issues:
-                                        slines.append("## Issues\n")
+                        # Fetch issues in this sprint
+                        try:
+                            issues_resp = await client.get(
+                                f"{agile}/sprint/{sp_id}/issue",
+                                params={
+                                    "maxResults": 200,
+                                    "fields": "key,summary,status,assignee,issuetype",
+                                },
+                                headers=headers,
+                            )
+                            if issues_resp.status_code == 200:
+                                sp_issues = issues_resp.json().get("issues", [])
+                                if sp_issues:
+                                    slines.append("## Issues\n")
+                                    slines.append(
+                                        "| Key | Type | Summary | Status | Assignee |"
+                                    )
+                                    slines.append("|---|---|---|---|---|")
+                                    for si in sp_issues:
+                                        si_key = si.get("key", "")
+                                        si_f = si.get("fields", {})
+                                        si_type = (si_f.get("issuetype") or {}).get("name", "")
+                                        si_summ = (si_f.get("summary") or "").replace("|", "/")
+                                        si_stat = (si_f.get("status") or {}).get("name", "")
+                                        si_asgn = (si_f.get("assignee") or {}).get(
+                                            "displayName", "Unassigned"
+                                        )
                                         slines.append(
-                                            "| Key | Type | Summary | Status | Assignee |"
+                                            f"| {si_key} | {si_type} | {si_summ} "
+                                            f"| {si_stat} | {si_asgn} |"
                                         )
-                                        slines.append("|---|---|---|---|---|")
-                                        for si in sp_issues:
-                                            si_key = si.get("key", "")
-                                            si_f = si.get("fields", {})
-                                            si_type = (si_f.get("issuetype") or {}).get("name", "")
-                                            si_summ = (si_f.get("summary") or "").replace("|", "/")
-                                            si_stat = (si_f.get("status") or {}).get("name", "")
-                                            si_asgn = (si_f.get("assignee") or {}).get(
-                                                "displayName", "Unassigned"
-                                            )
-                                            slines.append(
-                                                f"| {si_key} | {si_type} | {si_summ} "
-                                                f"| {si_stat} | {si_asgn} |"
-                                            )
-                                        slines.append("")
-                            except Exception as e:
-                                logger.warning("Failed to fetch sprint %s issues: %s", sp_id, e)
-
-                            sp_file = sprint_dir / f"{sp_id}-{safe_sp}.md"
-                            sp_file.write_text("\n".join(slines), encoding="utf-8")
-                            count += 1
+                                    slines.append("")
+                        except Exception as e:
+                            logger.warning("Failed to fetch sprint %s issues: %s", sp_id, e)
+
+                        sp_file = sprint_dir / f"{sp_id}-{safe_sp}.md"
+                        sp_file.write_text("\n".join(slines), encoding="utf-8")
+                        count += 1
 
         except Exception as e:
             logger.warning("Board/sprint sync failed: %s", e)
@@ -629,94 +622,94 @@ class JiraConnector(BaseSyncConnector):
 
         is_cloud = self._is_cloud(source)
 
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            project_val = source.jira_project.strip()
-            if project_val == "*":
-                all_projects = await list_projects(source)
-                all_keys = [p["key"] for p in all_projects]
-                if not all_keys:
-                    raise RuntimeError("No Jira projects found")
-                quoted = ', '.join(f'"{k}"' for k in all_keys)
-                jql = f"project IN ({quoted}) ORDER BY updated DESC"
-            elif "," in project_val:
-                keys = [k.strip() for k in project_val.split(",") if k.strip()]
-                quoted = ', '.join(f'"{k}"' for k in keys)
-                jql = f"project IN ({quoted}) ORDER BY updated DESC"
-            else:
-                jql = f'project = "{project_val}" ORDER BY updated DESC'
+        client = await self._get_client()
+        project_val = source.jira_project.strip()
+        if project_val == "*":
+            all_projects = await list_projects(source)
+            all_keys = [p["key"] for p in all_projects]
+            if not all_keys:
+                raise RuntimeError("No Jira projects found")
+            quoted = ', '.join(f'"{k}"' for k in all_keys)
+            jql = f"project IN ({quoted}) ORDER BY updated DESC"
+        elif "," in project_val:
+            keys = [k.strip() for k in project_val.split(",") if k.strip()]
+            quoted = ', '.join(f'"{k}"' for k in keys)
+            jql = f"project IN ({quoted}) ORDER BY updated DESC"
+        else:
+            jql = f'project = "{project_val}" ORDER BY updated DESC'
 
-            if is_cloud:
-                # Cloud: use v3 search/jql endpoint (v2/search is deprecated)
-                next_page_token = None
-                while True:
-                    params = {
-                        "jql": jql,
-                        "maxResults": 100,
-                        "fields": "key,issuetype,summary,updated,created",
-                    }
-                    if next_page_token:
-                        params["nextPageToken"] = next_page_token
+        if is_cloud:
+            # Cloud: use v3 search/jql endpoint (v2/search is deprecated)
+            next_page_token = None
+            while True:
+                params = {
+                    "jql": jql,
+                    "maxResults": 100,
+                    "fields": "key,issuetype,summary,updated,created",
+                }
+                if next_page_token:
+                    params["nextPageToken"] = next_page_token
 
-                    resp = await client.get(
-                        f"{source.jira_url}/rest/api/3/search/jql",
-                        params=params,
-                        headers=headers,
+                resp = await client.get(
+                    f"{source.jira_url}/rest/api/3/search/jql",
+                    params=params,
+                    headers=headers,
+                )
+
+                if resp.status_code == 401:
+                    raise RuntimeError("Jira authentication failed. Check your email and API token.")
+                if resp.status_code == 403:
+                    raise RuntimeError(
+                        f"Jira access denied. Verify your email and API token. ({resp.text[:300]})"
+                    )
+                if resp.status_code != 200:
+                    raise RuntimeError(
+                        f"Jira search failed ({resp.status_code}): {resp.text[:500]}"
                     )
 
-                    if resp.status_code == 401:
-                        raise RuntimeError("Jira authentication failed. Check your email and API token.")
-                    if resp.status_code == 403:
-                        raise RuntimeError(
-                            f"Jira access denied. Verify your email and API token. ({resp.text[:300]})"
-                        )
-                    if resp.status_code != 200:
-                        raise RuntimeError(
-                            f"Jira search failed ({resp.status_code}): {resp.text[:500]}"
-                        )
+                data = resp.json()
+                issues = data.get("issues", [])
+                self._append_issues(files, issues, source)
 
-                    data = resp.json()
-                    issues = data.get("issues", [])
-                    self._append_issues(files, issues, source)
+                if data.get("isLast", True) or not issues:
+                    break
+                next_page_token = data.get("nextPageToken")
+                if not next_page_token:
+                    break
+        else:
+            # Server/DC: use v2 search endpoint
+            base = self._api_base(source)
+            start_at = 0
+            max_results = 100
+            total = None
 
-                    if data.get("isLast", True) or not issues:
-                        break
-                    next_page_token = data.get("nextPageToken")
-                    if not next_page_token:
-                        break
-            else:
-                # Server/DC: use v2 search endpoint
-                base = self._api_base(source)
-                start_at = 0
-                max_results = 100
-                total = None
-
-                while total is None or start_at < total:
-                    resp = await client.get(
-                        f"{base}/search",
-                        params={
-                            "jql": jql,
-                            "startAt": start_at,
-                            "maxResults": max_results,
-                            "fields": "key,issuetype,summary,updated,created",
-                        },
-                        headers=headers,
-                    )
+            while total is None or start_at < total:
+                resp = await client.get(
+                    f"{base}/search",
+                    params={
+                        "jql": jql,
+                        "startAt": start_at,
+                        "maxResults": max_results,
+                        "fields": "key,issuetype,summary,updated,created",
+                    },
+                    headers=headers,
+                )
 
-                    if resp.status_code == 401:
-                        raise RuntimeError("Jira authentication failed. Check your PAT token.")
-                    if resp.status_code != 200:
-                        raise RuntimeError(
-                            f"Jira search failed ({resp.status_code}): {resp.text[:500]}"
-                        )
+                if resp.status_code == 401:
+                    raise RuntimeError("Jira authentication failed. Check your PAT token.")
+                if resp.status_code != 200:
+                    raise RuntimeError(
+                        f"Jira search failed ({resp.status_code}): {resp.text[:500]}"
+                    )
 
-                    data = resp.json()
-                    total = data.get("total", 0)
-                    issues = data.get("issues", [])
-                    self._append_issues(files, issues, source)
+                data = resp.json()
+                total = data.get("total", 0)
+                issues = data.get("issues", [])
+                self._append_issues(files, issues, source)
 
-                    start_at += max_results
-                    if not issues:
-                        break
+                start_at += max_results
+                if not issues:
+                    break
 
         logger.info("Listed %d issues from Jira project %s", len(files), source.jira_project)
         return files
@@ -730,19 +723,19 @@ class JiraConnector(BaseSyncConnector):
             summary = flds.get("summary", f"Issue-{key}")
             updated = flds.get("updated", "")
 
-            safe_summary = _sanitize_filename(summary)
-            safe_type = _sanitize_filename(issue_type)
+            safe_summary = sanitize_filename(summary)
+            safe_type = sanitize_filename(issue_type)
             remote_path = f"issues/{safe_type}/{key}-{safe_summary}.md"
 
-            content_hash = hashlib.sha256(updated.encode()).hexdigest()
             created = flds.get("created", "")
 
+            # The issue's `updated` timestamp is its revision key as is
             files.append(
                 RemoteFile(
                     remote_path=remote_path,
                     size=0,
                     modified_at=updated,
-                    content_hash=content_hash,
+                    content_hash=updated,
                     created_at=created,
                 )
             )
@@ -769,26 +762,26 @@ class JiraConnector(BaseSyncConnector):
         headers = self._headers(source)
         base = self._api_base(source)
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            resp = await client.get(
-                f"{base}/issue/{issue_key}",
-                params={
-                    "fields": "*all",
-                    "expand": "renderedFields,changelog",
-                },
-                headers=headers,
+        client = await self._get_client()
+        resp = await client.get(
+            f"{base}/issue/{issue_key}",
+            params={
+                "fields": "*all",
+                "expand": "renderedFields,changelog",
+            },
+            headers=headers,
+        )
+
+        if resp.status_code == 401:
+            raise RuntimeError("Jira authentication failed. Check your token.")
+        if resp.status_code == 404:
+            raise RuntimeError(f"Issue not found: {issue_key}")
+        if resp.status_code != 200:
+            raise RuntimeError(
+                f"Failed to fetch issue {issue_key}: {resp.text[:300]}"
             )
 
-            if resp.status_code == 401:
-                raise RuntimeError("Jira authentication failed. Check your token.")
-            if resp.status_code == 404:
-                raise RuntimeError(f"Issue not found: {issue_key}")
-            if resp.status_code != 200:
-                raise RuntimeError(
-                    f"Failed to fetch issue {issue_key}: {resp.text[:300]}"
-                )
-
-            issue = resp.json()
+        issue = resp.json()
 
         md = _render_issue_md(issue, field_map=field_map)
         local_path.write_text(md, encoding="utf-8")
@@ -817,25 +810,42 @@ class JiraConnector(BaseSyncConnector):
         new_revisions: dict[str, str] = {}
         stats = {"downloaded": 0, "deleted": 0, "skipped": 0, "errors": 0}
 
+        to_download: list[RemoteFile] = []
         for rf in remote_files:
             remote_paths.add(rf.remote_path)
             new_revisions[rf.remote_path] = rf.content_hash or ""
             local_file = local_root / rf.remote_path
 
-            if local_file.exists() and old_revisions.get(rf.remote_path) == rf.content_hash:
+            old_revision = old_revisions.get(rf.remote_path)
+            if local_file.exists() and old_revision is not None and (
+                old_revision == rf.content_hash
+                # Sidecars written before revisions were the raw timestamp
+                or old_revision == hashlib.sha256(rf.content_hash.encode()).hexdigest()
+            ):
                 stats["skipped"] += 1
                 continue
+            to_download.append(rf)
 
-            local_file.parent.mkdir(parents=True, exist_ok=True)
-            try:
-                await self.download_file(
-                    source, rf.remote_path, local_file, field_map=field_map
-                )
-                stats["downloaded"] += 1
-                logger.info("Downloaded: %s", rf.remote_path)
-            except Exception as e:
-                logger.error("Failed to download %s: %s", rf.remote_path, e)
-                stats["errors"] += 1
+        sem = asyncio.Semaphore(JIRA_DOWNLOAD_CONCURRENCY)
+
+        async def _download_one(rf: RemoteFile) -> bool:
+            local_file = local_root / rf.remote_path
+            async with sem:
+                try:
+                    local_file.parent.mkdir(parents=True, exist_ok=True)
+                    await self.download_file(
+                        source, rf.remote_path, local_file, field_map=field_map
+                    )
+                    logger.info("Downloaded: %s", rf.remote_path)
+                    return True
+                except Exception as e:
+                    logger.error("Failed to download %s: %s", rf.remote_path, e)
+                    return False
+
+        results = await asyncio.gather(*(_download_one(rf) for rf in to_download))
+        downloaded = sum(results)
+        stats["downloaded"] += downloaded
+        stats["errors"] += len(results) - downloaded
 
         # Mirror-delete issues only (boards/sprints are always refreshed)
         issues_root = local_root / "issues"
@@ -0,0 +1,69 @@
+"""Confluence storage-format converter tests."""
+
+from voitta.services.sync.confluence import _html_to_markdown
+
+
+def test_empty_body():
+    """Test an empty body converts to an empty string."""
+    assert _html_to_markdown("") == ""
+
+
+def test_headings():
+    """Test headings get markdown prefixes and entities are decoded."""
+    html = "<h1>Title</h1><h3>Sub &amp; more</h3><p>Body</p>"
+    assert _html_to_markdown(html) == "# Title\n### Sub & more\n\nBody"
+
+
+def test_nested_lists():
+    """Test nested list items are flattened into bullet lines."""
+    html = (
+        "<ul><li>one</li><li>two<ul><li>nested</li></ul></li></ul>"
+        "<ol><li>first</li></ol>"
+    )
+    assert _html_to_markdown(html) == "- one\n- two\n- nested\n\n- first"
+
+
+def test_table():
+    """Test table rows become pipe-delimited lines."""
+    html = (
+        "<table><tbody>"
+        "<tr><th>Name</th><th>Value</th></tr>"
+        "<tr><td>a</td><td><strong>1</strong></td></tr>"
+        "</tbody></table>"
+    )
+    assert _html_to_markdown(html) == "| Name | Value |\n| a | **1** |"
+
+
+def test_code_macro_with_split_cdata():
+    """Test a code macro body split around ]]> is rejoined verbatim."""
+    html = (
+        "<p>Run:</p>"
+        '<ac:structured-macro ac:name="code">'
+        '<ac:parameter ac:name="language">python</ac:parameter>'
+        '<ac:plain-text-body><![CDATA[print("]]]]><![CDATA[>")\nx = 1 < 2]]>'
+        "</ac:plain-text-body>"
+        "</ac:structured-macro>"
+    )
+    assert _html_to_markdown(html) == 'Run:\n```\nprint("]]>")\nx = 1 < 2\n```'
+
+
+def test_storage_elements_dropped():
+    """Test ac:/ri: elements are dropped but panel bodies are kept."""
+    html = (
+        "<p>Before</p>"
+        '<ac:image><ri:attachment ri:filename="diagram.png" /></ac:image>'
+        '<ac:structured-macro ac:name="info">'
+        '<ac:parameter ac:name="title">Note</ac:parameter>'
+        "<ac:rich-text-body><p>Inside panel</p></ac:rich-text-body>"
+        "</ac:structured-macro>"
+        '<p>After <ac:link><ri:page ri:content-title="Other" />'
+        "<ac:plain-text-link-body><![CDATA[link text]]></ac:plain-text-link-body>"
+        "</ac:link> end</p>"
+    )
+    assert _html_to_markdown(html) == "Before\n\nInside panel\n\nAfter end"
+
+
+def test_img_is_not_italic():
+    """Test <img> is not mistaken for an <i> element."""
+    html = '<p><img src="a.png" />plain <i>italic</i></p>'
+    assert _html_to_markdown(html) == "plain *italic*"